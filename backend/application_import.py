@@ -0,0 +1,234 @@
+"""
+Bulk Application Import
+Loads NDJSON or CSV exports of (job_id, candidate_id[, status, applied_at,
+updated_at]) with set-based validation and one executemany per chunk
+"""
+
+import csv
+import io
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from application_stats import application_stats
+from entity_stats import entity_stats, SCOPE_CANDIDATE, SCOPE_JOB
+from models import Application, Candidate, Job, StatusEnum, StatusHistory
+from schemas import ApplicationImportError, ApplicationImportResult
+
+# Rows validated and written per transaction
+DEFAULT_CHUNK_SIZE = int(os.environ.get("APPLICATION_IMPORT_CHUNK_SIZE", 5000))
+
+# Upload formats
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+
+IMPORT_NOTE = "Application imported"
+
+# (row number, parsed record or None, parse error or None)
+ParsedRecord = Tuple[int, Optional[dict], Optional[str]]
+
+
+def detect_format(content_type: Optional[str]) -> str:
+    """Upload format from a Content-Type header; anything but CSV is read as NDJSON"""
+    return FORMAT_CSV if content_type and "csv" in content_type.lower() else FORMAT_NDJSON
+
+
+def parse_records(text: str, fmt: str) -> Iterator[ParsedRecord]:
+    """Records of an upload, numbered from 1; blank NDJSON lines are skipped"""
+    if fmt == FORMAT_CSV:
+        reader = csv.DictReader(io.StringIO(text))
+        for row, record in enumerate(reader, start=1):
+            yield row, {key.strip(): value for key, value in record.items() if key}, None
+        return
+
+    row = 0
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield row, None, "Invalid JSON"
+            continue
+        if isinstance(record, dict):
+            yield row, record, None
+        else:
+            yield row, None, "Expected a JSON object"
+
+
+def parse_timestamp(value) -> Optional[datetime]:
+    """ISO 8601 timestamp as naive UTC (the form the models store); None for empty values"""
+    if value is None or value == "":
+        return None
+    text = str(value).strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def validate_record(record: dict, now: datetime) -> dict:
+    """Application row values for one record; ValueError describes the first problem"""
+    job_id = str(record.get("job_id") or "").strip()
+    candidate_id = str(record.get("candidate_id") or "").strip()
+    if not job_id:
+        raise ValueError("Missing job_id")
+    if not candidate_id:
+        raise ValueError("Missing candidate_id")
+
+    status = record.get("status") or StatusEnum.APPLIED.value
+    try:
+        status = StatusEnum(str(status).strip().lower())
+    except ValueError:
+        raise ValueError(f"Invalid status: {status}")
+
+    try:
+        applied_at = parse_timestamp(record.get("applied_at")) or now
+        updated_at = parse_timestamp(record.get("updated_at")) or applied_at
+    except ValueError:
+        raise ValueError("Invalid timestamp; expected ISO 8601")
+    if updated_at < applied_at:
+        raise ValueError("updated_at is before applied_at")
+
+    return {
+        "job_id": job_id,
+        "candidate_id": candidate_id,
+        "status": status,
+        "applied_at": applied_at,
+        "updated_at": updated_at
+    }
+
+
+class ApplicationImporter:
+    """
+    Chunked bulk insert of applications
+
+    - Each record is validated on its own (ids present, status, timestamps),
+      then per chunk: known jobs, known candidates and already-applied pairs
+      come from one IN query each, never one lookup per row
+    - Every accepted row gets an Application and an initial StatusHistory row;
+      both are written with one executemany per chunk, and the chunk commits
+      together with its dashboard counter deltas
+    - Rejected rows, and every row of a chunk the database refuses, are listed
+      in the report; other chunks are unaffected
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+
+    def run(self, db: Session, records: Iterator[ParsedRecord]) -> ApplicationImportResult:
+        now = datetime.utcnow()
+        errors: List[ApplicationImportError] = []
+        seen: Dict[Tuple[str, str], int] = {}
+        chunk: List[Tuple[int, dict]] = []
+        total = imported = 0
+
+        for row, record, error in records:
+            total += 1
+            if error is None:
+                try:
+                    application = validate_record(record, now)
+                except ValueError as e:
+                    error = str(e)
+            if error is not None:
+                errors.append(self._error(row, record, error))
+                continue
+
+            pair = (application["job_id"], application["candidate_id"])
+            if pair in seen:
+                errors.append(self._error(row, application, f"Duplicate of row {seen[pair]}"))
+                continue
+            seen[pair] = row
+
+            chunk.append((row, application))
+            if len(chunk) >= self.chunk_size:
+                imported += self._import_chunk(db, chunk, errors)
+                chunk = []
+        if chunk:
+            imported += self._import_chunk(db, chunk, errors)
+
+        errors.sort(key=lambda error: error.row)
+        return ApplicationImportResult(total_rows=total, imported=imported, failed=len(errors), errors=errors)
+
+    @staticmethod
+    def _error(row: int, record: Optional[dict], message: str) -> ApplicationImportError:
+        record = record or {}
+        job_id, candidate_id = record.get("job_id"), record.get("candidate_id")
+        return ApplicationImportError(
+            row=row,
+            job_id=str(job_id) if job_id is not None else None,
+            candidate_id=str(candidate_id) if candidate_id is not None else None,
+            error=message
+        )
+
+    def _import_chunk(self, db: Session, chunk: List[Tuple[int, dict]], errors: List[ApplicationImportError]) -> int:
+        """Validate one chunk against the database and write it in one transaction; returns rows written"""
+        job_ids = {application["job_id"] for _, application in chunk}
+        candidate_ids = {application["candidate_id"] for _, application in chunk}
+        known_jobs = {job_id for job_id, in db.query(Job.id).filter(Job.id.in_(job_ids))}
+        known_candidates = {
+            candidate_id for candidate_id, in db.query(Candidate.id).filter(Candidate.id.in_(candidate_ids))
+        }
+        pairs = [(application["job_id"], application["candidate_id"]) for _, application in chunk]
+        existing = set(
+            db.query(Application.job_id, Application.candidate_id).filter(
+                tuple_(Application.job_id, Application.candidate_id).in_(pairs)
+            )
+        )
+
+        accepted: List[Tuple[int, dict]] = []
+        for row, application in chunk:
+            if application["job_id"] not in known_jobs:
+                errors.append(self._error(row, application, "Job not found"))
+            elif application["candidate_id"] not in known_candidates:
+                errors.append(self._error(row, application, "Candidate not found"))
+            elif (application["job_id"], application["candidate_id"]) in existing:
+                errors.append(self._error(row, application, "Already applied to this job"))
+            else:
+                application["id"] = str(uuid.uuid4())
+                accepted.append((row, application))
+        if not accepted:
+            return 0
+
+        applications = [application for _, application in accepted]
+        histories = [
+            {
+                "id": str(uuid.uuid4()),
+                "application_id": application["id"],
+                "old_status": None,
+                "new_status": application["status"],
+                "changed_at": application["updated_at"],
+                "notes": IMPORT_NOTE
+            }
+            for application in applications
+        ]
+        try:
+            # Counters first: building them on first use must not see this chunk's rows
+            application_stats.record_import(db, applications)
+            db.execute(insert(Application), applications)
+            db.execute(insert(StatusHistory), histories)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            message = f"Database error: {e.__class__.__name__}"
+            errors.extend(self._error(row, application, message) for row, application in accepted)
+            return 0
+
+        for job_id in {application["job_id"] for application in applications}:
+            entity_stats.invalidate((SCOPE_JOB, job_id))
+        for candidate_id in {application["candidate_id"] for application in applications}:
+            entity_stats.invalidate((SCOPE_CANDIDATE, candidate_id))
+        return len(applications)
+
+
+# Singleton instance
+application_importer = ApplicationImporter()
@@ -0,0 +1,60 @@
+"""
+Application List Pagination
+Keyset pages over (applied_at, id), newest first, with the candidate and job
+of every row loaded in the same query
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query, joinedload
+
+from models import Application
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(application: Application) -> str:
+    """Opaque cursor positioned after this application"""
+    position = [application.applied_at.isoformat(), application.id]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """(applied_at, id) from a cursor; ValueError if it was not produced by encode_cursor"""
+    try:
+        applied_at, application_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(applied_at), str(application_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def application_page(
+    query: Query, limit: int, cursor: Optional[str] = None
+) -> Tuple[List[Application], Optional[str]]:
+    """
+    One page of an Application query and the cursor of the next page (None on the last)
+
+    The candidate and job are joined into the page query, so serializing a page
+    issues no further queries; the cost of a page does not depend on its position
+    """
+    if cursor:
+        applied_at, application_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            Application.applied_at < applied_at,
+            and_(Application.applied_at == applied_at, Application.id < application_id)
+        ))
+
+    rows = query.options(
+        joinedload(Application.candidate), joinedload(Application.job)
+    ).order_by(
+        Application.applied_at.desc(), Application.id.desc()
+    ).limit(limit + 1).all()
+
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(rows[limit - 1])
+    return rows, None
@@ -0,0 +1,272 @@
+"""
+Application Dashboard Statistics
+Counters kept in the application_stats table and changed in the same transaction
+as each application write, so the dashboard is a constant-size read
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, insert, update
+from sqlalchemy.orm import Session
+
+from models import (
+    Application, ApplicationStatsCounter, Candidate, Job, JobApplicationCount, StatusEnum
+)
+from schemas import ApplicationStats
+
+# Counter names
+APPLICATIONS = "applications"
+CANDIDATES = "candidates"
+JOBS = "jobs"
+OFFER_DAYS_TOTAL = "offer_days_total"  # summed whole days from applied to offered
+OFFER_DAYS_COUNT = "offer_days_count"
+
+# Jobs listed in the dashboard's by_job breakdown
+TOP_JOBS = 10
+
+
+def status_counter(status: StatusEnum) -> str:
+    return f"status:{status.value}"
+
+
+def days_to_offer(applied_at: datetime, offered_at: datetime) -> int:
+    return (offered_at - applied_at).days
+
+
+class ApplicationStatsStore:
+    """
+    Dashboard statistics backed by maintained counters
+
+    - record_*(): add the deltas of one write to the counters in the caller's
+      session; they commit or roll back together with the write itself
+    - read(): the dashboard from the counter rows plus the top-jobs index
+    - rebuild(): recompute every counter from the source tables (status
+      breakdown in one GROUP BY); runs automatically when the counters are missing
+    """
+
+    @staticmethod
+    def _add(db: Session, deltas: Dict[str, int]):
+        """Apply several counter deltas in one UPDATE"""
+        deltas = {name: delta for name, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        counter = ApplicationStatsCounter
+        db.execute(
+            update(counter)
+            .where(counter.name.in_(list(deltas)))
+            .values(value=counter.value + case(deltas, value=counter.name, else_=0))
+        )
+
+    def _ensure(self, db: Session):
+        initialized = db.query(ApplicationStatsCounter.value).filter(
+            ApplicationStatsCounter.name == APPLICATIONS
+        ).first()
+        if initialized is None:
+            self.rebuild(db)
+
+    def initialize(self, db: Session):
+        """Build the counters if this database has none yet"""
+        self._ensure(db)
+        db.commit()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record_candidate(self, db: Session):
+        with db.no_autoflush:
+            self._ensure(db)
+            self._add(db, {CANDIDATES: 1})
+
+    def record_job(self, db: Session):
+        with db.no_autoflush:
+            self._ensure(db)
+            self._add(db, {JOBS: 1})
+
+    def record_submission(self, db: Session, application: Application):
+        """Count a new application (not yet flushed) under its status and job"""
+        with db.no_autoflush:
+            self._ensure(db)
+            self._add(db, {APPLICATIONS: 1, status_counter(application.status or StatusEnum.APPLIED): 1})
+            self._add_job_applications(db, application.job_id, 1)
+
+    def record_transition(
+        self,
+        db: Session,
+        application: Application,
+        old_status: StatusEnum,
+        previous_updated_at: Optional[datetime] = None
+    ):
+        """
+        Move an application between status counters; call after application.status
+        and updated_at are set. previous_updated_at is the updated_at before the
+        change (when an offer was made, for applications leaving OFFERED)
+        """
+        deltas: Dict[str, int] = {}
+        self._transition_deltas(
+            deltas, old_status, application.status, application.applied_at,
+            application.updated_at, previous_updated_at
+        )
+        with db.no_autoflush:
+            self._ensure(db)
+            self._add(db, deltas)
+
+    def record_transitions(
+        self,
+        db: Session,
+        transitions: List[Tuple[StatusEnum, datetime, datetime]],
+        new_status: StatusEnum,
+        updated_at: datetime
+    ):
+        """
+        Count many applications moving to one status at updated_at; transitions
+        are (old status, applied_at, updated_at before the change) per application
+        """
+        deltas: Dict[str, int] = {}
+        for old_status, applied_at, previous_updated_at in transitions:
+            self._transition_deltas(deltas, old_status, new_status, applied_at, updated_at, previous_updated_at)
+        with db.no_autoflush:
+            self._ensure(db)
+            self._add(db, deltas)
+
+    @staticmethod
+    def _transition_deltas(
+        deltas: Dict[str, int],
+        old_status: StatusEnum,
+        new_status: StatusEnum,
+        applied_at: datetime,
+        updated_at: datetime,
+        previous_updated_at: Optional[datetime]
+    ):
+        """Accumulate one application's status change into deltas"""
+        if old_status == new_status:
+            return
+        changes = {status_counter(old_status): -1, status_counter(new_status): 1}
+        if new_status == StatusEnum.OFFERED:
+            changes[OFFER_DAYS_TOTAL] = days_to_offer(applied_at, updated_at)
+            changes[OFFER_DAYS_COUNT] = 1
+        elif old_status == StatusEnum.OFFERED and previous_updated_at is not None:
+            changes[OFFER_DAYS_TOTAL] = -days_to_offer(applied_at, previous_updated_at)
+            changes[OFFER_DAYS_COUNT] = -1
+        for name, delta in changes.items():
+            deltas[name] = deltas.get(name, 0) + delta
+
+    def record_import(self, db: Session, applications: List[dict]):
+        """Count a batch of inserted application rows (job_id, status, applied_at, updated_at)"""
+        if not applications:
+            return
+        deltas = {APPLICATIONS: len(applications)}
+        per_job: Dict[str, int] = {}
+        for application in applications:
+            status = application["status"]
+            deltas[status_counter(status)] = deltas.get(status_counter(status), 0) + 1
+            if status == StatusEnum.OFFERED:
+                deltas[OFFER_DAYS_TOTAL] = deltas.get(OFFER_DAYS_TOTAL, 0) + days_to_offer(
+                    application["applied_at"], application["updated_at"]
+                )
+                deltas[OFFER_DAYS_COUNT] = deltas.get(OFFER_DAYS_COUNT, 0) + 1
+            per_job[application["job_id"]] = per_job.get(application["job_id"], 0) + 1
+        with db.no_autoflush:
+            self._ensure(db)
+            self._add(db, deltas)
+            self._add_many_job_applications(db, per_job)
+
+    @staticmethod
+    def _add_job_applications(db: Session, job_id: str, delta: int):
+        updated = db.execute(
+            update(JobApplicationCount)
+            .where(JobApplicationCount.job_id == job_id)
+            .values(applications=JobApplicationCount.applications + delta)
+        ).rowcount
+        if not updated:
+            db.add(JobApplicationCount(job_id=job_id, applications=delta))
+
+    @staticmethod
+    def _add_many_job_applications(db: Session, per_job: Dict[str, int]):
+        """Per-job deltas for many jobs: one UPDATE for jobs with a row, one insert for the rest"""
+        counts = JobApplicationCount
+        existing = {job_id for job_id, in db.query(counts.job_id).filter(counts.job_id.in_(list(per_job)))}
+        if existing:
+            db.execute(
+                update(counts)
+                .where(counts.job_id.in_(list(existing)))
+                .values(applications=counts.applications + case(
+                    {job_id: per_job[job_id] for job_id in existing}, value=counts.job_id, else_=0
+                ))
+            )
+        missing = [job_id for job_id in per_job if job_id not in existing]
+        if missing:
+            db.execute(insert(counts), [{"job_id": job_id, "applications": per_job[job_id]} for job_id in missing])
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def read(self, db: Session) -> ApplicationStats:
+        counters = dict(db.query(ApplicationStatsCounter.name, ApplicationStatsCounter.value).all())
+        if APPLICATIONS not in counters:
+            self.rebuild(db)
+            db.commit()
+            counters = dict(db.query(ApplicationStatsCounter.name, ApplicationStatsCounter.value).all())
+
+        top_jobs = db.query(Job.id, Job.title, JobApplicationCount.applications).join(
+            JobApplicationCount, JobApplicationCount.job_id == Job.id
+        ).filter(JobApplicationCount.applications > 0).order_by(
+            JobApplicationCount.applications.desc()
+        ).limit(TOP_JOBS).all()
+        return self.assemble(counters, top_jobs)
+
+    @staticmethod
+    def assemble(counters: Dict[str, int], top_jobs: List[Tuple[str, str, int]]) -> ApplicationStats:
+        total = counters.get(APPLICATIONS, 0)
+        offered = counters.get(status_counter(StatusEnum.OFFERED), 0)
+        offer_count = counters.get(OFFER_DAYS_COUNT, 0)
+        return ApplicationStats(
+            total_applications=total,
+            by_status={status.value: counters.get(status_counter(status), 0) for status in StatusEnum},
+            by_job={f"{job_id}:{title}": count for job_id, title, count in top_jobs},
+            total_candidates=counters.get(CANDIDATES, 0),
+            total_jobs=counters.get(JOBS, 0),
+            average_time_to_offer=counters.get(OFFER_DAYS_TOTAL, 0) / offer_count if offer_count else None,
+            offer_acceptance_rate=round(offered / total * 100, 2) if total else 0
+        )
+
+    # ------------------------------------------------------------------
+    # Rebuild
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def compute(db: Session) -> Dict[str, int]:
+        """Every counter value from the source tables"""
+        counters = {status_counter(status): 0 for status in StatusEnum}
+        by_status = db.query(Application.status, func.count(Application.id)).group_by(Application.status).all()
+        for status, count in by_status:
+            if status is not None:
+                counters[status_counter(status)] = count
+        counters[APPLICATIONS] = sum(count for _, count in by_status)
+        counters[CANDIDATES] = db.query(func.count(Candidate.id)).scalar() or 0
+        counters[JOBS] = db.query(func.count(Job.id)).scalar() or 0
+
+        # Offered applications with a recorded history, as the dashboard always counted them
+        offers = db.query(Application.applied_at, Application.updated_at).filter(
+            Application.status == StatusEnum.OFFERED, Application.status_history.any()
+        ).all()
+        counters[OFFER_DAYS_TOTAL] = sum(days_to_offer(applied, updated) for applied, updated in offers)
+        counters[OFFER_DAYS_COUNT] = len(offers)
+        return counters
+
+    def rebuild(self, db: Session):
+        """Replace the counters and per-job totals with freshly computed values (caller commits)"""
+        with db.no_autoflush:
+            counters = self.compute(db)
+            per_job = db.query(Application.job_id, func.count(Application.id)).group_by(Application.job_id).all()
+            db.query(ApplicationStatsCounter).delete(synchronize_session=False)
+            db.query(JobApplicationCount).delete(synchronize_session=False)
+            db.add_all(ApplicationStatsCounter(name=name, value=value) for name, value in counters.items())
+            db.add_all(JobApplicationCount(job_id=job_id, applications=count) for job_id, count in per_job)
+            db.flush()
+
+
+# Singleton instance
+application_stats = ApplicationStatsStore()
@@ -0,0 +1,123 @@
+"""
+Application Status Transitions
+The allowed status flow, and bulk transitions applied as a few set-based
+statements in one transaction
+"""
+
+import os
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert, tuple_, update
+from sqlalchemy.orm import Session
+
+from application_stats import application_stats
+from entity_stats import entity_stats, SCOPE_CANDIDATE, SCOPE_JOB
+from models import Application, StatusEnum, StatusHistory
+from schemas import BulkStatusUpdateResult, BulkTransitionRejection
+
+# Statuses an application may move to from each status
+VALID_TRANSITIONS: Dict[StatusEnum, List[StatusEnum]] = {
+    StatusEnum.APPLIED: [StatusEnum.SCREENING, StatusEnum.REJECTED],
+    StatusEnum.SCREENING: [StatusEnum.INTERVIEW_SCHEDULED, StatusEnum.REJECTED],
+    StatusEnum.INTERVIEW_SCHEDULED: [StatusEnum.INTERVIEW_COMPLETED, StatusEnum.REJECTED],
+    StatusEnum.INTERVIEW_COMPLETED: [StatusEnum.OFFERED, StatusEnum.REJECTED],
+    StatusEnum.OFFERED: [StatusEnum.REJECTED],
+    StatusEnum.REJECTED: []
+}
+
+# Most application ids accepted by one bulk transition
+MAX_BULK_TRANSITION = int(os.environ.get("MAX_BULK_TRANSITION", 5000))
+
+
+class TransitionConflict(RuntimeError):
+    """Applications changed status between validation and update; nothing was written"""
+
+
+def is_valid_transition(old_status: Optional[StatusEnum], new_status: StatusEnum) -> bool:
+    return new_status in VALID_TRANSITIONS.get(old_status, [])
+
+
+def sources_of(new_status: StatusEnum) -> List[StatusEnum]:
+    """Statuses from which new_status may be reached"""
+    return [status for status, targets in VALID_TRANSITIONS.items() if new_status in targets]
+
+
+def bulk_transition(
+    db: Session,
+    application_ids: List[str],
+    new_status: StatusEnum,
+    notes: Optional[str] = None,
+    changed_by: Optional[str] = None
+) -> BulkStatusUpdateResult:
+    """
+    Move many applications to new_status in one transaction
+
+    One SELECT loads the current status of every id; ids that do not exist or
+    whose status does not allow the transition are rejected. The rest get one
+    UPDATE, one executemany of history rows and one dashboard counter update.
+    The UPDATE matches each row only while it still has the status it was
+    validated with (and that history and counters record as the old status);
+    if fewer rows match, another write got in between: the transaction is
+    rolled back and TransitionConflict raised.
+    """
+    new_status = StatusEnum(new_status)
+    application_ids = list(dict.fromkeys(application_ids))
+    sources = sources_of(new_status)
+    rows = {
+        row.id: row for row in db.query(
+            Application.id, Application.job_id, Application.candidate_id,
+            Application.status, Application.applied_at, Application.updated_at
+        ).filter(Application.id.in_(application_ids))
+    }
+
+    accepted, rejected = [], []
+    for application_id in application_ids:
+        row = rows.get(application_id)
+        if row is None:
+            rejected.append(BulkTransitionRejection(application_id=application_id, error="Application not found"))
+        elif row.status not in sources:
+            rejected.append(BulkTransitionRejection(
+                application_id=application_id,
+                current_status=row.status,
+                error=f"Invalid transition from {row.status} to {new_status}"
+            ))
+        else:
+            accepted.append(row)
+
+    if accepted:
+        now = datetime.utcnow()
+        updated = db.execute(
+            update(Application)
+            .where(tuple_(Application.id, Application.status).in_([(row.id, row.status) for row in accepted]))
+            .values(status=new_status, updated_at=now)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if updated != len(accepted):
+            db.rollback()
+            raise TransitionConflict(f"{len(accepted) - updated} applications changed status concurrently")
+
+        db.execute(insert(StatusHistory), [
+            {
+                "id": str(uuid.uuid4()),
+                "application_id": row.id,
+                "old_status": row.status,
+                "new_status": new_status,
+                "changed_at": now,
+                "notes": notes,
+                "changed_by": changed_by
+            }
+            for row in accepted
+        ])
+        application_stats.record_transitions(
+            db, [(row.status, row.applied_at, row.updated_at) for row in accepted], new_status, now
+        )
+        db.commit()
+
+        for job_id in {row.job_id for row in accepted}:
+            entity_stats.invalidate((SCOPE_JOB, job_id))
+        for candidate_id in {row.candidate_id for row in accepted}:
+            entity_stats.invalidate((SCOPE_CANDIDATE, candidate_id))
+
+    return BulkStatusUpdateResult(status=new_status, updated=[row.id for row in accepted], rejected=rejected)
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Matching Benchmark Suite
+Times the matching paths on deterministic synthetic candidates and jobs at
+realistic scales, stores results as JSON and compares them against a baseline
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from matching_engine import JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch
+from job_columns import JobColumns
+from taxonomy_registry import taxonomy_registry
+
+DEFAULT_SCALES = [1_000, 100_000, 1_000_000]
+DEFAULT_SEED = 42
+TOP_K = 10
+
+# Scenarios that hold one Python posting object per job are skipped above this size
+DEFAULT_MAX_OBJECT_JOBS = 100_000
+
+# Timed requests per scale (one candidate each)
+DEFAULT_REQUESTS = {1_000: 50, 100_000: 10, 1_000_000: 5}
+
+# A result regresses when it is this much worse than the baseline
+DEFAULT_THRESHOLD = 0.10
+
+# ============================================================================
+# SYNTHETIC DATA
+# ============================================================================
+
+LOCATIONS = ["Bangalore", "Mumbai", "Pune", "Hyderabad", "Chennai", "Delhi", "Remote", "Noida", "Kolkata"]
+LOCATION_WEIGHTS = [20, 14, 10, 12, 8, 9, 18, 5, 4]
+TITLES = [
+    "Backend Developer", "Senior Backend Developer", "Frontend Developer", "Full Stack Developer",
+    "DevOps Engineer", "Data Engineer", "Software Engineer", "Cloud Engineer", "Developer"
+]
+EXPERIENCE = [
+    "0-2 years", "1-3 years", "2-5 yrs", "3-6 years", "5+ years", "3 years",
+    "Fresher", "6-10 years", "8+ yrs", "0 years"
+]
+EXPERIENCE_WEIGHTS = [14, 16, 18, 12, 10, 8, 6, 6, 4, 6]
+LONG_TAIL_SKILLS = 2_000
+
+
+def skill_pool() -> List[str]:
+    """Taxonomy skills, then their aliases, then a long tail of skills outside the taxonomy"""
+    taxonomy = taxonomy_registry.current
+    names = [taxonomy.display_names[key] for key in taxonomy.names]
+    aliases = [alias for info in taxonomy.skills.values() for alias in info["aliases"]]
+    return names + aliases + [f"Skill {i}" for i in range(LONG_TAIL_SKILLS)]
+
+
+def zipf_weights(count: int, exponent: float = 1.1) -> List[float]:
+    """Cumulative Zipf weights: a few skills are very common, most are rare"""
+    return list(np.cumsum(1.0 / np.arange(1, count + 1) ** exponent))
+
+
+class SyntheticData:
+    """Deterministic generator of candidates and job postings"""
+
+    def __init__(self, seed: int = DEFAULT_SEED):
+        self.seed = seed
+        self.skills = skill_pool()
+        self.skill_weights = zipf_weights(len(self.skills))
+
+    def _skills(self, rng: random.Random, low: int, high: int) -> List[str]:
+        return list(dict.fromkeys(rng.choices(self.skills, cum_weights=self.skill_weights, k=rng.randint(low, high))))
+
+    def iter_jobs(self, count: int) -> Iterator[JobPostingForMatch]:
+        """Job postings, generated lazily (the 1M scale is never held as objects)"""
+        rng = random.Random(f"jobs-{self.seed}")
+        for i in range(count):
+            shape = rng.random()
+            if shape < 0.08:
+                salary_range = []
+            elif shape < 0.12:
+                salary_range = [0, 0]
+            else:
+                low = rng.randrange(300_000, 2_500_000, 50_000)
+                salary_range = [low, low + rng.randrange(0, 1_500_000, 50_000)]
+            yield JobPostingForMatch.model_construct(
+                job_id=f"J{i:07d}",
+                title=rng.choice(TITLES),
+                required_skills=self._skills(rng, 0, 8),
+                experience_required=rng.choices(EXPERIENCE, weights=EXPERIENCE_WEIGHTS)[0],
+                location=rng.choices(LOCATIONS, weights=LOCATION_WEIGHTS)[0],
+                salary_range=salary_range,
+                company=f"Company {i % 997}",
+                description=None
+            )
+
+    def jobs(self, count: int) -> List[JobPostingForMatch]:
+        return list(self.iter_jobs(count))
+
+    def candidates(self, count: int) -> List[CandidateMatchProfile]:
+        rng = random.Random(f"candidates-{self.seed}")
+        return [
+            CandidateMatchProfile(
+                skills=self._skills(rng, 3, 12),
+                experience_years=rng.randint(0, 15),
+                preferred_locations=rng.sample(LOCATIONS, rng.randint(1, 2)),
+                preferred_roles=rng.sample(TITLES, rng.randint(0, 2)),
+                expected_salary=rng.randrange(300_000, 3_500_000, 100_000)
+            )
+            for _ in range(count)
+        ]
+
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+
+class Scenario:
+    """
+    A matching path under test
+    setup(data, jobs) builds the per-scale state (compiled columns, payloads, ...);
+    run(state, candidate) serves one request
+    """
+
+    def __init__(self, name: str, setup: Callable, run: Callable, needs_objects: bool):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.needs_objects = needs_objects
+
+
+def _engine_per_job_setup(data: SyntheticData, count: int):
+    return JobMatchingEngine(), data.jobs(count)
+
+
+def _engine_per_job_run(state, candidate):
+    engine, jobs = state
+    return engine.match_candidate_to_top_jobs(candidate, jobs, TOP_K)
+
+
+def _engine_vectorized_setup(data: SyntheticData, count: int):
+    engine = JobMatchingEngine()
+    columns = JobColumns.from_postings(engine, list(data.iter_jobs(count)))
+    return engine, columns
+
+
+def _engine_vectorized_run(state, candidate):
+    engine, columns = state
+    return engine.match_candidate_to_jobs_vectorized(candidate, columns, top_k=TOP_K)
+
+
+def _matches_setup(data: SyntheticData, count: int):
+    import main  # the /matches endpoint (main.calculate_score's scoring rules)
+    # /matches needs at least one salary value per posting
+    jobs = [job if job.salary_range else job.model_copy(update={"salary_range": [0, 0]}) for job in data.iter_jobs(count)]
+    return main, jobs
+
+
+def _matches_run(state, candidate):
+    main, jobs = state
+    payload = main.MatchRequest.model_construct(candidate=candidate, jobs=jobs)
+    return asyncio.run(main.get_matches(payload, top_k=TOP_K))
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "engine_per_job": Scenario("engine_per_job", _engine_per_job_setup, _engine_per_job_run, True),
+    "engine_vectorized": Scenario("engine_vectorized", _engine_vectorized_setup, _engine_vectorized_run, False),
+    "matches": Scenario("matches", _matches_setup, _matches_run, True),
+}
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def percentile_ms(latencies: List[float], q: float) -> float:
+    return round(float(np.percentile(latencies, q)) * 1000, 3)
+
+
+def run_scenario(
+    scenario: Scenario,
+    data: SyntheticData,
+    jobs: int,
+    requests: int,
+    candidates: List[CandidateMatchProfile]
+) -> Dict[str, Any]:
+    """
+    Time one scenario at one scale
+    Peak memory is traced separately (setup, then one extra request) so tracing
+    does not slow down the timed requests
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    state = scenario.setup(data, jobs)
+    setup_seconds = time.perf_counter() - started
+    _, setup_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = []
+    for i in range(requests):
+        started = time.perf_counter()
+        scenario.run(state, candidates[i % len(candidates)])
+        latencies.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    scenario.run(state, candidates[0])
+    _, request_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    return {
+        "scenario": scenario.name,
+        "jobs": jobs,
+        "requests": requests,
+        "setup_seconds": round(setup_seconds, 3),
+        "requests_per_second": round(requests / total, 3),
+        "jobs_per_second": round(jobs * requests / total, 1),
+        "latency_ms": {
+            "mean": round(total / requests * 1000, 3),
+            "p50": percentile_ms(latencies, 50),
+            "p99": percentile_ms(latencies, 99)
+        },
+        "setup_peak_bytes": setup_peak,
+        "request_peak_bytes": request_peak
+    }
+
+
+def run_benchmarks(
+    scales: List[int],
+    scenarios: List[str],
+    seed: int = DEFAULT_SEED,
+    requests: Optional[int] = None,
+    max_object_jobs: int = DEFAULT_MAX_OBJECT_JOBS,
+    log: Callable[[str], None] = print
+) -> Dict[str, Any]:
+    data = SyntheticData(seed)
+    results = []
+    for jobs in scales:
+        count = requests or DEFAULT_REQUESTS.get(jobs, 10)
+        candidates = data.candidates(count)
+        for name in scenarios:
+            scenario = SCENARIOS[name]
+            if scenario.needs_objects and jobs > max_object_jobs:
+                results.append({"scenario": name, "jobs": jobs, "skipped": f"more than {max_object_jobs} posting objects"})
+                log(f"{name:<20} {jobs:>9,} jobs  skipped")
+                continue
+            result = run_scenario(scenario, data, jobs, count, candidates)
+            results.append(result)
+            log(
+                f"{name:<20} {jobs:>9,} jobs  {result['jobs_per_second']:>14,.0f} jobs/s  "
+                f"p50 {result['latency_ms']['p50']:>10.2f} ms  p99 {result['latency_ms']['p99']:>10.2f} ms  "
+                f"peak {result['request_peak_bytes'] / 2**20:>8.1f} MB"
+            )
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "top_k": TOP_K
+        },
+        "results": results
+    }
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+# Metric -> True when a higher value is better
+COMPARED_METRICS = {
+    "jobs_per_second": True,
+    "latency_ms.p50": False,
+    "latency_ms.p99": False,
+    "request_peak_bytes": False,
+}
+
+
+def _metric(result: Dict[str, Any], path: str) -> float:
+    value = result
+    for key in path.split("."):
+        value = value[key]
+    return value
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Per-metric changes for every (scenario, jobs) measured in both runs
+    Each row has regression=True when the metric is worse by more than threshold
+    """
+    previous = {
+        (result["scenario"], result["jobs"]): result
+        for result in baseline["results"] if "skipped" not in result
+    }
+    rows = []
+    for result in current["results"]:
+        before = previous.get((result["scenario"], result["jobs"]))
+        if before is None or "skipped" in result:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = _metric(before, metric), _metric(result, metric)
+            change = (new - old) / old if old else 0.0
+            worse = -change if higher_is_better else change
+            rows.append({
+                "scenario": result["scenario"],
+                "jobs": result["jobs"],
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": round(change, 4),
+                "regression": worse > threshold
+            })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="Comma-separated job counts")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios")
+    parser.add_argument("--requests", type=int, default=None, help="Timed requests per scale")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--max-object-jobs", type=int, default=DEFAULT_MAX_OBJECT_JOBS,
+                        help="Skip per-object scenarios above this many jobs")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative change counted as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)} (available: {', '.join(SCENARIOS)})")
+    scales = [int(scale) for scale in args.scales.split(",")]
+
+    results = run_benchmarks(scales, scenarios, args.seed, args.requests, args.max_object_jobs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.threshold)
+        print(f"\nComparison with {args.compare} (threshold {args.threshold:.0%})")
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else "ok"
+            print(f"{row['scenario']:<20} {row['jobs']:>9,} {row['metric']:<18} "
+                  f"{row['baseline']:>14,.2f} -> {row['current']:>14,.2f} ({row['change']:+.1%})  {flag}")
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+Candidate Inverted Index
+Maps each normalized skill to the candidates that have it, so a job can
+be matched against only the candidates sharing its required skills
+"""
+
+import json
+import threading
+from collections import Counter
+from typing import Dict, Set, Optional
+
+from sqlalchemy.orm import Session
+
+from models import CandidateProfile
+from ranking import select_top_k
+from matching_engine import (
+    JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch,
+    CandidateMatchResult, CandidateRankingResponse,
+    MATCH_FIELDS, engine as default_engine
+)
+
+
+class CandidateIndex:
+    """
+    In-memory index of stored candidate profiles
+
+    - postings: normalized skill -> ids of candidates with that skill (keyed
+      by name, so stored profiles never grow the shared skill vocabulary)
+    - Updated incrementally when a single candidate profile changes
+    - Rebuilt on the next load after a taxonomy reload
+    """
+
+    def __init__(self, engine: JobMatchingEngine):
+        self.engine = engine
+        self._profiles: Dict[str, CandidateMatchProfile] = {}
+        self._skill_keys: Dict[str, tuple] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        engine.registry.subscribe(self.invalidate)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    @staticmethod
+    def profile_from_row(row: CandidateProfile) -> CandidateMatchProfile:
+        return CandidateMatchProfile(
+            skills=json.loads(row.skills),
+            experience_years=row.experience_years,
+            preferred_locations=json.loads(row.preferred_locations),
+            preferred_roles=json.loads(row.preferred_roles),
+            expected_salary=row.expected_salary
+        )
+
+    @staticmethod
+    def store_profile(row: CandidateProfile, profile: CandidateMatchProfile) -> CandidateProfile:
+        """Copy a profile onto its database row"""
+        row.skills = json.dumps(profile.skills)
+        row.experience_years = profile.experience_years
+        row.preferred_locations = json.dumps(profile.preferred_locations)
+        row.preferred_roles = json.dumps(profile.preferred_roles)
+        row.expected_salary = profile.expected_salary
+        return row
+
+    # ------------------------------------------------------------------
+    # Loading and incremental updates
+    # ------------------------------------------------------------------
+
+    def load(self, db: Session):
+        """Index every stored candidate profile"""
+        rows = db.query(CandidateProfile).all()
+        with self._lock:
+            self._profiles, self._skill_keys, self._postings = {}, {}, {}
+            for row in rows:
+                self._add(row.candidate_id, self.profile_from_row(row))
+            self._loaded = True
+
+    def ensure_loaded(self, db: Session):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load(db)
+
+    def invalidate(self, taxonomy=None):
+        """Drop the index; the next ensure_loaded() rebuilds it with the current taxonomy"""
+        with self._lock:
+            self._profiles, self._skill_keys, self._postings = {}, {}, {}
+            self._loaded = False
+
+    def upsert(self, candidate_id: str, profile: CandidateMatchProfile):
+        """Re-index one candidate after their profile changed"""
+        if not self._loaded:
+            return  # picked up by the first load
+        with self._lock:
+            self._remove(candidate_id)
+            self._add(candidate_id, profile)
+
+    def remove(self, candidate_id: str):
+        with self._lock:
+            self._remove(candidate_id)
+
+    def _add(self, candidate_id: str, profile: CandidateMatchProfile):
+        skill_keys = tuple(sorted({self.engine.normalize_skill(s) for s in profile.skills}))
+        self._profiles[candidate_id] = profile
+        self._skill_keys[candidate_id] = skill_keys
+        for skill_key in skill_keys:
+            self._postings.setdefault(skill_key, set()).add(candidate_id)
+
+    def _remove(self, candidate_id: str):
+        for skill_key in self._skill_keys.pop(candidate_id, ()):
+            postings = self._postings.get(skill_key)
+            if postings is not None:
+                postings.discard(candidate_id)
+                if not postings:
+                    del self._postings[skill_key]
+        self._profiles.pop(candidate_id, None)
+
+    # ------------------------------------------------------------------
+    # Ranking
+    # ------------------------------------------------------------------
+
+    def rank_candidates(
+        self,
+        job: JobPostingForMatch,
+        top_k: Optional[int] = None,
+        min_overlap: int = 1,
+        fields: frozenset = MATCH_FIELDS
+    ) -> CandidateRankingResponse:
+        """
+        Rank stored candidates for a job
+        Only candidates sharing at least min_overlap required skills are scored;
+        min_overlap=0 or a job without required skills considers every candidate.
+        fields: result parts to build for the returned candidates (see MATCH_FIELDS)
+        """
+        engine = self.engine
+        required_keys = {engine.normalize_skill(s) for s in job.required_skills}
+
+        with self._lock:
+            overlap = Counter()
+            for skill_key in required_keys:
+                overlap.update(self._postings.get(skill_key, ()))
+            if required_keys and min_overlap > 0:
+                candidate_ids = sorted(cid for cid, count in overlap.items() if count >= min_overlap)
+            else:
+                candidate_ids = sorted(self._profiles)
+            profiles = [self._profiles[cid] for cid in candidate_ids]
+
+        skill_scores = [
+            (overlap[cid] / len(required_keys)) * 100 if required_keys else 100.0
+            for cid in candidate_ids
+        ]
+
+        # Factor scores of the candidates that get scored are kept, so results are built without rescoring
+        factors: Dict[int, tuple] = {}
+
+        def score_row(i: int) -> float:
+            factors[i] = engine.score_factors(profiles[i], job, skill_scores[i])
+            return round(engine.weighted_score(*factors[i]), 2)
+
+        ranked = select_top_k(
+            [engine.score_upper_bound(score) for score in skill_scores],
+            len(candidate_ids) if top_k is None else top_k,
+            score_row
+        )
+
+        vocabulary = engine.vocabulary.scratch()
+        required_vector = vocabulary.encode(job.required_skills)
+        matches = []
+        for _, i in ranked:
+            result = engine.build_job_result(
+                job, factors[i], fields, vocabulary, vocabulary.encode(profiles[i].skills), required_vector
+            )
+            matches.append(CandidateMatchResult(
+                candidate_id=candidate_ids[i],
+                match_score=result.match_score,
+                breakdown=result.breakdown,
+                missing_skills=result.missing_skills,
+                matching_skills=result.matching_skills,
+                recommendation_reason=result.recommendation_reason
+            ))
+
+        return CandidateRankingResponse(
+            job_id=job.job_id,
+            matches=matches,
+            total_candidates=len(candidate_ids)
+        )
+
+
+# Singleton instance
+candidate_index = CandidateIndex(default_engine)
@@ -0,0 +1,40 @@
+"""
+Shared fixtures: an isolated in-memory database and a TestClient bound to it
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import main
+from entity_stats import entity_stats
+from models import Base
+
+
+@pytest.fixture
+def db_engine():
+    """Empty in-memory database with every table; one shared connection so all sessions see it"""
+    db_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=db_engine)
+    return db_engine
+
+
+@pytest.fixture
+def client(db_engine):
+    """TestClient whose requests use db_engine; the process-wide stats cache starts and ends empty"""
+    Session = sessionmaker(bind=db_engine)
+
+    def get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    entity_stats.clear()
+    main.app.dependency_overrides[main.get_db] = get_db
+    yield TestClient(main.app)
+    main.app.dependency_overrides.pop(main.get_db, None)
+    entity_stats.clear()
@@ -0,0 +1,161 @@
+"""
+Per-Entity Application Statistics
+Job and candidate application breakdowns from one grouped query, cached per
+entity and invalidated whenever an application for that entity is written
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import Application, Candidate, Job, StatusEnum
+from schemas import CandidateApplicationStats, JobApplicationStats
+
+# Entities whose stats are kept; the least recently read are evicted beyond this
+DEFAULT_MAX_ENTRIES = int(os.environ.get("ENTITY_STATS_CACHE_SIZE", 10000))
+
+# Key scopes
+SCOPE_JOB = "job"
+SCOPE_CANDIDATE = "candidate"
+
+
+def status_breakdown(db: Session, column, entity_id: str) -> Dict[str, int]:
+    """Application count per status for one job or candidate (every status present)"""
+    by_status = {status.value: 0 for status in StatusEnum}
+    rows = db.query(Application.status, func.count(Application.id)).filter(
+        column == entity_id
+    ).group_by(Application.status).all()
+    for status, count in rows:
+        if status is not None:
+            by_status[status.value] = count
+    return by_status
+
+
+class EntityStatsCache:
+    """
+    LRU cache of JobApplicationStats / CandidateApplicationStats
+
+    - Keys are (scope, entity id); a hit issues no queries, a miss two (the
+      entity's name and one GROUP BY over its applications)
+    - invalidate_application() drops the job's and candidate's entries and must
+      run after the write commits, so a rolled-back write never clears them
+    - A computation that overlaps an invalidation of its key is returned to its
+      caller but not stored, so a read racing a write cannot cache stale counts
+    - Cached responses are shared between callers and must not be mutated
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, object]" = OrderedDict()
+        self._loading: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], Optional[object]]):
+        """Return the cached value for key, computing it on a miss (None results are not stored)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            token = self._loading[key] = object()
+
+        try:
+            value = compute()
+        except Exception:
+            with self._lock:
+                if self._loading.get(key) is token:
+                    del self._loading[key]
+            raise
+
+        with self._lock:
+            if self._loading.get(key) is token:
+                del self._loading[key]
+                if value is None:
+                    return None
+                self._entries[key] = value
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key: tuple):
+        with self._lock:
+            self._loading.pop(key, None)
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_application(self, job_id: str, candidate_id: str):
+        """An application for this job and candidate was created or changed status"""
+        self.invalidate((SCOPE_JOB, job_id))
+        self.invalidate((SCOPE_CANDIDATE, candidate_id))
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._loading.clear()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def job_stats(self, db: Session, job_id: str) -> Optional[JobApplicationStats]:
+        """Stats for a job, or None if it does not exist"""
+        def compute():
+            title = db.query(Job.title).filter(Job.id == job_id).scalar()
+            if title is None:
+                return None
+            by_status = status_breakdown(db, Application.job_id, job_id)
+            return JobApplicationStats(
+                job_id=job_id,
+                job_title=title,
+                total_applications=sum(by_status.values()),
+                by_status=by_status
+            )
+
+        return self.get_or_compute((SCOPE_JOB, job_id), compute)
+
+    def candidate_stats(self, db: Session, candidate_id: str) -> Optional[CandidateApplicationStats]:
+        """Stats for a candidate, or None if it does not exist"""
+        def compute():
+            name = db.query(Candidate.name).filter(Candidate.id == candidate_id).scalar()
+            if name is None:
+                return None
+            by_status = status_breakdown(db, Application.candidate_id, candidate_id)
+            return CandidateApplicationStats(
+                candidate_id=candidate_id,
+                candidate_name=name,
+                total_applications=sum(by_status.values()),
+                by_status=by_status,
+                offers_received=by_status[StatusEnum.OFFERED.value],
+                rejections=by_status[StatusEnum.REJECTED.value]
+            )
+
+        return self.get_or_compute((SCOPE_CANDIDATE, candidate_id), compute)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations
+            }
+
+
+# Singleton instance
+entity_stats = EntityStatsCache()
@@ -0,0 +1,80 @@
+"""
+Experience Requirement Parser
+One compiled parser for experience strings ("0-2 years", "5+ yrs", "Fresher"),
+memoized by raw string and shared by every scoring path
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Tuple
+
+import numpy as np
+
+# Upper bound of open-ended ("5+") and unspecified requirements
+OPEN_ENDED_MAX_YEARS = 99
+
+# Distinct raw strings kept in the memo table (catalogs hold a few hundred)
+EXPERIENCE_CACHE_SIZE = int(os.environ.get("EXPERIENCE_CACHE_SIZE", 4096))
+
+_NUMBER = re.compile(r'\d+')
+
+# Requirement kinds
+UNSPECIFIED = "unspecified"  # no number ("Fresher")
+EXACT = "exact"              # one number ("3 years")
+AT_LEAST = "at_least"        # one number and a "+" ("5+ years")
+RANGE = "range"              # two or more numbers ("2-5 yrs"); only the first two count
+
+
+class ExperienceRange(NamedTuple):
+    """
+    Normalized experience requirement
+
+    - kind: one of the requirement kinds above
+    - min_years / max_years: the interval; open-ended and unspecified
+      requirements end at OPEN_ENDED_MAX_YEARS
+    """
+    kind: str
+    min_years: int
+    max_years: int
+
+    @property
+    def bounds(self) -> Tuple[int, int]:
+        """(min, max) interval, as scored by the /api/match engine"""
+        return self.min_years, self.max_years
+
+    @property
+    def stated_bounds(self) -> Tuple[int, int]:
+        """(min, max) of the numbers actually written, as scored by /matches: "5+" -> (5, 5), none -> (0, 0)"""
+        if self.kind == UNSPECIFIED:
+            return 0, 0
+        if self.kind == AT_LEAST:
+            return self.min_years, self.min_years
+        return self.min_years, self.max_years
+
+
+@lru_cache(maxsize=EXPERIENCE_CACHE_SIZE)
+def parse_experience(raw: str) -> ExperienceRange:
+    """Parse an experience requirement string (memoized by the raw string)"""
+    numbers = _NUMBER.findall(raw)
+    if not numbers:
+        return ExperienceRange(UNSPECIFIED, 0, OPEN_ENDED_MAX_YEARS)
+    if len(numbers) == 1:
+        years = int(numbers[0])
+        if '+' in raw:
+            return ExperienceRange(AT_LEAST, years, OPEN_ENDED_MAX_YEARS)
+        return ExperienceRange(EXACT, years, years)
+    return ExperienceRange(RANGE, int(numbers[0]), int(numbers[1]))
+
+
+def experience_intervals(raw_values: Iterable[str], stated: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (min_years, max_years) int arrays for many requirement strings
+    stated: use stated_bounds instead of bounds
+    """
+    ranges = [parse_experience(raw) for raw in raw_values]
+    pairs = [r.stated_bounds if stated else r.bounds for r in ranges]
+    return (
+        np.array([low for low, _ in pairs], dtype=np.int64),
+        np.array([high for _, high in pairs], dtype=np.int64)
+    )
@@ -0,0 +1,223 @@
+"""
+Compiled Job Catalog
+Keeps every open job that has a match profile pre-compiled in memory, so
+match requests only send the candidate instead of the full job list
+"""
+
+import json
+import threading
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from models import Job, JobMatchProfile, JobStatusEnum
+from job_columns import CompiledJob, JobColumns
+from matching_engine import (
+    JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch, CatalogFilters, MatchingResponse,
+    MATCH_FIELDS, engine as default_engine
+)
+
+
+class JobCatalog:
+    """
+    In-memory catalog of compiled jobs backed by the job_match_profiles table
+
+    - Each entry is compiled once (normalized skill ids, parsed experience
+      range, normalized location and title) and recompiled individually
+      when its job is added, updated or closed
+    - Columns for vectorized scoring are rebuilt lazily from the compiled
+      entries after a change; no posting is re-parsed
+    - version increases on every change; subscribers are notified with it
+    - A taxonomy reload drops every entry; recompile_profiles() rewrites the
+      stored normalized skills and the next load compiles from them
+    """
+
+    def __init__(self, engine: JobMatchingEngine):
+        self.engine = engine
+        self.version = 0
+        self._entries: Dict[str, CompiledJob] = {}
+        self._columns: Optional[JobColumns] = None
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[int], None]] = []
+        engine.registry.subscribe(self.invalidate)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def compile_profile(self, job: Job, profile: JobMatchProfile, data) -> JobMatchProfile:
+        """Store raw matching inputs on the profile row along with their compiled form"""
+        engine = self.engine
+        profile.required_skills = json.dumps(data.required_skills)
+        profile.experience_required = data.experience_required
+        profile.location = data.location
+        if len(data.salary_range) >= 2:
+            profile.salary_min, profile.salary_max = data.salary_range[0], data.salary_range[1]
+        else:
+            profile.salary_min, profile.salary_max = None, None
+
+        profile.normalized_skills = json.dumps(sorted({engine.normalize_skill(s) for s in data.required_skills}))
+        profile.experience_min, profile.experience_max = engine.parse_experience_range(data.experience_required)
+        profile.location_normalized = data.location.lower().strip()
+        profile.title_normalized = job.title.lower().strip()
+        return profile
+
+    @staticmethod
+    def posting_from_row(job: Job, profile: JobMatchProfile) -> JobPostingForMatch:
+        """Rebuild the raw posting stored for a job"""
+        if profile.salary_min is not None and profile.salary_max is not None:
+            salary_range = [profile.salary_min, profile.salary_max]
+        else:
+            salary_range = []
+        return JobPostingForMatch(
+            job_id=job.id,
+            title=job.title,
+            required_skills=json.loads(profile.required_skills),
+            experience_required=profile.experience_required,
+            location=profile.location,
+            salary_range=salary_range,
+            company=job.company,
+            description=job.description
+        )
+
+    def entry_from_row(self, job: Job, profile: JobMatchProfile) -> CompiledJob:
+        """Build a catalog entry from stored compiled fields (no re-normalization)"""
+        vocabulary = self.engine.vocabulary
+        if profile.salary_min is not None and profile.salary_max is not None:
+            salary_range = [profile.salary_min, profile.salary_max]
+        else:
+            salary_range = []
+        return CompiledJob(
+            job_id=job.id,
+            title=job.title,
+            company=job.company,
+            skill_ids=tuple(sorted({vocabulary.intern(s) for s in json.loads(profile.normalized_skills)})),
+            raw_skill_count=len(json.loads(profile.required_skills)),
+            salary_range=salary_range,
+            experience_range=(profile.experience_min, profile.experience_max),
+            location_key=profile.location_normalized,
+            title_key=profile.title_normalized
+        )
+
+    # ------------------------------------------------------------------
+    # Loading and incremental updates
+    # ------------------------------------------------------------------
+
+    def load(self, db: Session):
+        """Load all open jobs with a match profile"""
+        rows = db.query(Job, JobMatchProfile).join(
+            JobMatchProfile, JobMatchProfile.job_id == Job.id
+        ).filter(Job.status == JobStatusEnum.OPEN).order_by(Job.id).all()
+
+        with self._lock:
+            self._entries = {job.id: self.entry_from_row(job, profile) for job, profile in rows}
+            self._columns = None
+            self._loaded = True
+            self._changed()
+
+    def recompile_profiles(self, db: Session) -> int:
+        """
+        Rewrite stored normalized skills that differ under the current taxonomy
+        Maintenance step run after a taxonomy reload; returns the profiles rewritten
+        """
+        engine = self.engine
+        rewritten = 0
+        for profile in db.query(JobMatchProfile).all():
+            normalized = json.dumps(sorted({engine.normalize_skill(s) for s in json.loads(profile.required_skills)}))
+            if normalized != profile.normalized_skills:
+                profile.normalized_skills = normalized
+                rewritten += 1
+        if rewritten:
+            db.commit()
+            # A load between the reload and this commit compiled the old skills
+            self.invalidate()
+        return rewritten
+
+    def invalidate(self, taxonomy=None):
+        """Drop every compiled entry; the next ensure_loaded() rebuilds them"""
+        with self._lock:
+            self._entries = {}
+            self._columns = None
+            self._loaded = False
+            self._changed()
+
+    def ensure_loaded(self, db: Session):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load(db)
+
+    def refresh(self, job: Job):
+        """Recompile a single job's entry after it was added, updated or closed"""
+        if not self._loaded:
+            return  # picked up by the first load
+        with self._lock:
+            profile = job.match_profile
+            if job.status == JobStatusEnum.OPEN and profile is not None:
+                self._entries[job.id] = self.entry_from_row(job, profile)
+            elif self._entries.pop(job.id, None) is None:
+                return
+            self._columns = None
+            self._changed()
+
+    def subscribe(self, listener: Callable[[int], None]):
+        """Call listener(version) after every change to the catalog"""
+        self._listeners.append(listener)
+
+    def _changed(self):
+        self.version += 1
+        for listener in self._listeners:
+            listener(self.version)
+
+    def columns(self) -> JobColumns:
+        with self._lock:
+            if self._columns is None:
+                self._columns = JobColumns(self.engine.vocabulary, list(self._entries.values()))
+            return self._columns
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def filter_mask(columns: JobColumns, filters: Optional[CatalogFilters]) -> Optional[np.ndarray]:
+        """Boolean row mask for the requested filters (None when unfiltered)"""
+        if filters is None:
+            return None
+        mask = np.ones(len(columns), dtype=bool)
+        if filters.job_ids is not None:
+            wanted = set(filters.job_ids)
+            mask &= np.array([job.job_id in wanted for job in columns.jobs], dtype=bool)
+        if filters.locations is not None:
+            mask &= _value_mask(columns.location_names, columns.location_ids, filters.locations)
+        if filters.companies is not None:
+            mask &= _value_mask(columns.company_names, columns.company_ids, filters.companies)
+        return mask
+
+    def match(
+        self,
+        candidate: CandidateMatchProfile,
+        filters: Optional[CatalogFilters] = None,
+        top_k: Optional[int] = None,
+        fields: frozenset = MATCH_FIELDS
+    ) -> MatchingResponse:
+        """Rank catalog jobs for a candidate"""
+        columns = self.columns()
+        return self.engine.match_candidate_to_jobs_vectorized(
+            candidate, columns, self.filter_mask(columns, filters), top_k=top_k, fields=fields
+        )
+
+
+def _value_mask(names, ids: np.ndarray, values) -> np.ndarray:
+    wanted = {value.lower().strip() for value in values}
+    table = np.array([name in wanted for name in names], dtype=bool)
+    return table[ids] if len(table) else np.zeros(len(ids), dtype=bool)
+
+
+# Singleton instance
+catalog = JobCatalog(default_engine)
@@ -0,0 +1,227 @@
+"""
+Columnar Job Representation
+Stores a batch of job postings as NumPy arrays so all matching factors
+can be scored for every job at once
+"""
+
+from typing import List, Dict, Optional
+import numpy as np
+
+
+def round_scores(values: np.ndarray, ndigits: int = 2) -> np.ndarray:
+    """
+    Round an array exactly like Python's built-in round()
+    np.round works on the scaled binary value, so the rare near-tie
+    elements are re-rounded in Python to keep results identical
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * (10 ** ndigits)
+    ties = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    if ties.any():
+        for idx in np.flatnonzero(ties):
+            rounded[idx] = round(float(values[idx]), ndigits)
+    return rounded
+
+
+class CompiledJob:
+    """
+    A job posting with every matching input parsed and normalized once
+    Exposes job_id/title/company like JobPostingForMatch so results can be built from it
+    """
+
+    __slots__ = (
+        'job_id', 'title', 'company', 'skill_ids', 'raw_skill_count',
+        'salary_min', 'salary_max', 'has_salary', 'exp_min', 'exp_max',
+        'location_key', 'title_key'
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        title: str,
+        company: str,
+        skill_ids: tuple,
+        raw_skill_count: int,
+        salary_range: List[float],
+        experience_range: tuple,
+        location_key: str,
+        title_key: str
+    ):
+        self.job_id = job_id
+        self.title = title
+        self.company = company
+        self.skill_ids = skill_ids
+        self.raw_skill_count = raw_skill_count
+        if salary_range and len(salary_range) >= 2:
+            self.salary_min, self.salary_max = salary_range[0], salary_range[1]
+            self.has_salary = salary_range[1] > 0
+        else:
+            self.salary_min, self.salary_max, self.has_salary = 0.0, 0.0, False
+        self.exp_min, self.exp_max = experience_range
+        self.location_key = location_key
+        self.title_key = title_key
+
+    @classmethod
+    def from_posting(cls, engine, job, vocabulary) -> "CompiledJob":
+        """
+        Normalize skills, parse experience and normalize location/title for one posting
+        vocabulary: where the skill ids come from (a scratch view for request-supplied jobs)
+        """
+        return cls(
+            job_id=job.job_id,
+            title=job.title,
+            company=job.company,
+            skill_ids=tuple(sorted({vocabulary.skill_id(skill) for skill in job.required_skills})),
+            raw_skill_count=len(job.required_skills),
+            salary_range=job.salary_range,
+            experience_range=engine.parse_experience_range(job.experience_required),
+            location_key=job.location.lower().strip(),
+            title_key=job.title.lower().strip()
+        )
+
+
+class JobColumns:
+    """
+    Columnar view of a list of compiled jobs
+
+    Columns:
+    - Skills: CSR-style (job row, skill id) pairs over the skill vocabulary
+    - Salary: min/max arrays plus a validity mask
+    - Experience: parsed min/max arrays
+    - Location / Title / Company: integer ids into the distinct normalized values
+    """
+
+    def __init__(self, vocabulary, jobs: List[CompiledJob]):
+        self.jobs = jobs
+        self.vocabulary = vocabulary
+        n = len(jobs)
+
+        # Skills (columns are ids in the skill vocabulary)
+        self.skill_counts = np.array([len(job.skill_ids) for job in jobs], dtype=np.int64)
+        self.skill_rows = np.repeat(np.arange(n, dtype=np.int64), self.skill_counts)
+        self.skill_cols = np.fromiter(
+            (skill_id for job in jobs for skill_id in job.skill_ids),
+            dtype=np.int64,
+            count=int(self.skill_counts.sum())
+        )
+        self.skill_offsets = np.concatenate(([0], np.cumsum(self.skill_counts)))
+        self.raw_skill_counts = np.array([job.raw_skill_count for job in jobs], dtype=np.int64)
+        self._skill_postings: Optional[tuple] = None
+
+        # Salary
+        self.salary_min = np.array([job.salary_min for job in jobs], dtype=np.float64)
+        self.salary_max = np.array([job.salary_max for job in jobs], dtype=np.float64)
+        self.has_salary = np.array([job.has_salary for job in jobs], dtype=bool)
+
+        # Experience
+        self.exp_min = np.array([job.exp_min for job in jobs], dtype=np.int64)
+        self.exp_max = np.array([job.exp_max for job in jobs], dtype=np.int64)
+
+        # Location and title ids
+        self.location_names, self.location_ids = self._intern(job.location_key for job in jobs)
+        self.title_names, self.title_ids = self._intern(job.title_key for job in jobs)
+        self.company_names, self.company_ids = self._intern(job.company.lower().strip() for job in jobs)
+
+    @classmethod
+    def from_postings(cls, engine, postings: List) -> "JobColumns":
+        """
+        Compile raw JobPostingForMatch objects and lay them out as columns
+        Skill ids come from a scratch view, so the shared vocabulary does not grow
+        """
+        vocabulary = engine.vocabulary.scratch()
+        return cls(vocabulary, [CompiledJob.from_posting(engine, job, vocabulary) for job in postings])
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    @staticmethod
+    def _intern(values) -> tuple:
+        """Map each value to an integer id; returns (distinct_values, id_array)"""
+        index: Dict[str, int] = {}
+        ids = [index.setdefault(value, len(index)) for value in values]
+        return list(index), np.array(ids, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Factor scoring
+    # ------------------------------------------------------------------
+
+    def candidate_skill_mask(self, engine, candidate_skills: List[str]) -> np.ndarray:
+        """
+        Boolean mask over the skill vocabulary for the candidate's skills
+        Skills without an id are required by no row and are left out
+        """
+        ids = [skill_id for skill_id in map(self.vocabulary.lookup, candidate_skills) if skill_id is not None]
+        mask = np.zeros(len(self.vocabulary), dtype=bool)
+        mask[ids] = True
+        return mask
+
+    def skill_scores(self, skill_mask: np.ndarray) -> tuple:
+        """Returns (scores, matched_counts)"""
+        n = len(self.jobs)
+        matched = np.bincount(
+            self.skill_rows,
+            weights=skill_mask[self.skill_cols].astype(np.float64),
+            minlength=n
+        ).astype(np.int64)
+        scores = np.full(n, 100.0)
+        has_required = self.raw_skill_counts > 0
+        scores[has_required] = (matched[has_required] / self.skill_counts[has_required]) * 100
+        return scores, matched
+
+    def skill_credit_scores(self, credit: np.ndarray) -> np.ndarray:
+        """Mean per-skill credit (0..1 per vocabulary id) of each row's required skills, as a percentage"""
+        n = len(self.jobs)
+        earned = np.bincount(self.skill_rows, weights=credit[self.skill_cols], minlength=n)
+        scores = np.full(n, 100.0)
+        has_required = self.raw_skill_counts > 0
+        scores[has_required] = (earned[has_required] / self.skill_counts[has_required]) * 100
+        return scores
+
+    def location_scores(self, engine, preferred_locations: List[str]) -> np.ndarray:
+        table = np.array(
+            [engine.calculate_location_match(preferred_locations, loc) for loc in self.location_names],
+            dtype=np.float64
+        )
+        return table[self.location_ids] if len(table) else np.zeros(0)
+
+    def salary_scores(self, expected_salary: float) -> np.ndarray:
+        n = len(self.jobs)
+        scores = np.full(n, 50.0)
+        valid = self.has_salary
+        above = valid & (expected_salary > self.salary_max)
+        scores[valid] = 100.0
+        if above.any():
+            max_salary = self.salary_max[above]
+            excess_percentage = ((expected_salary - max_salary) / max_salary) * 100
+            scores[above] = np.maximum(0, 100 - excess_percentage)
+        return scores
+
+    def experience_scores(self, candidate_experience: int) -> np.ndarray:
+        scores = np.where(candidate_experience <= self.exp_max, 100.0, 90.0)
+        below = candidate_experience < self.exp_min
+        scores[below] = 100.0
+        partial = below & (self.exp_min > 0)
+        scores[partial] = (candidate_experience / self.exp_min[partial]) * 100
+        return scores
+
+    def role_scores(self, engine, preferred_roles: List[str]) -> np.ndarray:
+        table = np.array(
+            [engine.calculate_role_match(preferred_roles, title) for title in self.title_names],
+            dtype=np.float64
+        )
+        return table[self.title_ids] if len(table) else np.zeros(0)
+
+    def rows_with_skill(self, skill_id: int) -> np.ndarray:
+        """Rows requiring a skill id (inverted index over the skill columns, built on first use)"""
+        if self._skill_postings is None:
+            order = np.argsort(self.skill_cols, kind='stable')
+            self._skill_postings = (self.skill_cols[order], self.skill_rows[order])
+        cols, rows = self._skill_postings
+        return rows[np.searchsorted(cols, skill_id, 'left'):np.searchsorted(cols, skill_id, 'right')]
+
+    def job_skills(self, row: int, skill_mask: np.ndarray) -> tuple:
+        """Returns (matching_skills, missing_skills) for a single row"""
+        cols = self.skill_cols[self.skill_offsets[row]:self.skill_offsets[row + 1]]
+        matching = [self.vocabulary.name(c) for c in cols if skill_mask[c]]
+        missing = [self.vocabulary.name(c) for c in cols if not skill_mask[c]]
+        return matching, missing
@@ -1,35 +1,83 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+from contextlib import asynccontextmanager
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from datetime import datetime
 import json
-import re
 import uuid
 
+import numpy as np
+
 from models import (
     Base, engine, SessionLocal, 
-    Candidate, Job, Application, StatusHistory,
+    Candidate, CandidateProfile, Job, JobMatchProfile, Application, StatusHistory,
     StatusEnum, JobStatusEnum
 )
 from schemas import (
     CandidateCreate, CandidateResponse,
-    JobCreate, JobResponse,
+    JobCreate, JobResponse, JobStatusUpdate,
+    JobMatchProfileCreate, JobMatchProfileResponse,
     ApplicationSubmit, ApplicationStatusUpdate, ApplicationResponse, ApplicationWithHistory,
+    ApplicationImportResult, BulkStatusUpdate, BulkStatusUpdateResult,
     StatusHistoryResponse,
     ApplicationStats, JobApplicationStats, CandidateApplicationStats
 )
 from matching_engine import (
-    JobMatchingEngine, MatchingRequest, MatchingResponse,
-    CandidateMatchProfile, JobPostingForMatch
+    MatchingRequest, MatchingResponse,
+    CandidateMatchProfile, JobPostingForMatch, CatalogMatchRequest,
+    MatchMatrixRequest, MatchMatrixResponse,
+    CandidateRankingResponse, ProfileDelta, MatchSessionResponse, parse_match_fields,
+    JobMatchingEngine, engine as job_matching_engine
+)
+from substring_matcher import SubstringMatcher
+from taxonomy_registry import taxonomy_registry
+from job_catalog import catalog
+from job_columns import JobColumns
+from candidate_index import candidate_index
+from parallel_matching import parallel_matcher
+from match_session import match_sessions
+from application_stats import application_stats
+from entity_stats import entity_stats
+from application_import import application_importer, detect_format, parse_records
+from application_transitions import (
+    bulk_transition, is_valid_transition, TransitionConflict, MAX_BULK_TRANSITION
+)
+from application_pages import application_page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from match_executor import match_executor, ExecutorSaturated
+from match_cache import (
+    match_cache, candidate_fingerprint, jobs_fingerprint, SCOPE_CATALOG, SCOPE_JOBS
+)
+from metrics import metrics, instrument_engine, MetricsMiddleware, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from scoring_pipeline import (
+    PROFILES, PipelineScores, PreparedJobs, ScoringProfile, SkillContainmentFactor, parse_variants
 )
 
-app = FastAPI(title="Job Application Lifecycle Management", version="1.0.0")
+def init_db():
+    """Create tables (and indexes added to tables that already existed), then the dashboard counters"""
+    Base.metadata.create_all(bind=engine)
+    for index in Application.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+    # Build the dashboard counters once for a database created before they existed
+    with SessionLocal() as startup_db:
+        application_stats.initialize(startup_db)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema and counter setup runs when the server starts, never on import
+    init_db()
+    yield
+
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+app = FastAPI(title="Job Application Lifecycle Management", version="1.0.0", lifespan=lifespan)
+
+# Count and time every query issued through SessionLocal
+instrument_engine(engine)
 
 # Dependency
 def get_db():
@@ -39,37 +87,24 @@ def get_db():
     finally:
         db.close()
 
+@app.exception_handler(ExecutorSaturated)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturated):
+    """Shed load once the matching queue is full instead of letting latency grow unbounded"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
-
-# --- Enhanced Taxonomy ---
-TAXONOMY = {
-    "python": {"category": "Backend", "difficulty": 1},
-    "django": {"category": "Backend", "difficulty": 2},
-    "fastapi": {"category": "Backend", "difficulty": 2},
-    "react": {"category": "Frontend", "difficulty": 2},
-    "react.js": {"category": "Frontend", "difficulty": 2},
-    "javascript": {"category": "Frontend", "difficulty": 1},
-    "typescript": {"category": "Frontend", "difficulty": 2},
-    "aws": {"category": "DevOps", "difficulty": 3},
-    "docker": {"category": "DevOps", "difficulty": 2},
-    "kubernetes": {"category": "DevOps", "difficulty": 3},
-    "sql": {"category": "Database", "difficulty": 1},
-    "postgresql": {"category": "Database", "difficulty": 2},
-    "mongodb": {"category": "Database", "difficulty": 2},
-    "git": {"category": "Tools", "difficulty": 1},
-    "ci/cd": {"category": "DevOps", "difficulty": 2},
-    "system design": {"category": "Architecture", "difficulty": 3},
-    "java": {"category": "Backend", "difficulty": 2},
-    "spring boot": {"category": "Backend", "difficulty": 3},
-    "communication": {"category": "Soft Skills", "difficulty": 1},
-    "leadership": {"category": "Soft Skills", "difficulty": 2},
-}
+app.add_middleware(MetricsMiddleware)
 
 # --- Models ---
 class GapCandidateProfile(BaseModel):
@@ -129,16 +164,18 @@ def generate_radar_data(current_skills, required_skills):
     # Fixed Categories ensures the graph is always a pentagon/hexagon
     categories = ["Frontend", "Backend", "DevOps", "Database", "Tools"]
     data = []
+    taxonomy = taxonomy_registry.current
     
     cand_clean = [s.lower().strip() for s in current_skills]
     req_clean = [s.lower().strip() for s in required_skills]
+    cand_matcher = SubstringMatcher(cand_clean)
 
     for cat in categories:
         # 1. Find all required skills for this category
-        cat_reqs = [s for s in req_clean if TAXONOMY.get(s, {}).get("category") == cat]
+        cat_reqs = [s for s in req_clean if taxonomy.category(s) == cat]
         
         # 2. Count how many of those the candidate has
-        cat_matches = [s for s in cat_reqs if any(c in s or s in c for c in cand_clean)]
+        cat_matches = [s for s in cat_reqs if cand_matcher.matches(s)]
         
         # 3. Calculate Scores
         # If job doesn't need "DevOps", we still return 0 for graph shape stability
@@ -149,7 +186,7 @@ def generate_radar_data(current_skills, required_skills):
             cand_val = (len(cat_matches) / len(cat_reqs)) * 100
         else:
             # If candidate has skills in this category even if not required, give small points
-            has_general_skill = any(TAXONOMY.get(s, {}).get("category") == cat for s in cand_clean)
+            has_general_skill = any(taxonomy.category(s) == cat for s in cand_clean)
             if has_general_skill: cand_val = 50
 
         data.append({
@@ -193,20 +230,10 @@ async def analyze_gap(payload: GapAnalysisRequest):
     current_raw = [s.lower().strip() for s in candidate.current_skills]
     required_raw = [s.lower().strip() for s in target.required_skills]
     
-    matching = []
-    missing = []
-    
-    for req in required_raw:
-        found = False
-        for cur in current_raw:
-            if req == cur or req in cur or cur in req:
-                found = True
-                break
-        
-        if found:
-            matching.append(req.title())
-        else:
-            missing.append(req.title())
+    # One compiled matcher answers every required-skill containment check
+    matched_raw, missing_raw = SubstringMatcher(current_raw).split(required_raw)
+    matching = [req.title() for req in matched_raw]
+    missing = [req.title() for req in missing_raw]
             
     total_required = len(required_raw)
     
@@ -226,10 +253,11 @@ async def analyze_gap(payload: GapAnalysisRequest):
     roadmap = []
     
     missing_skill_objects = []
+    taxonomy = taxonomy_registry.current
     for skill in missing:
         key = skill.lower()
-        found_key = next((k for k in TAXONOMY if k in key), None)
-        info = TAXONOMY.get(found_key, {"category": "Technical", "difficulty": 1.5})
+        found_key = taxonomy.name_matcher.first_contained(key)
+        info = taxonomy.skills.get(found_key, {"category": "Technical", "difficulty": 1.5})
         
         time_needed = info.get("difficulty", 1) * 1.0 
         total_time += time_needed
@@ -275,32 +303,20 @@ async def analyze_gap(payload: GapAnalysisRequest):
     }
 
 # --- Standard Matching Logic ---
-def parse_experience(exp_str: str) -> tuple:
-    nums = re.findall(r'\d+', exp_str)
-    if not nums: return (0, 0)
-    if len(nums) == 1: return (int(nums[0]), int(nums[0]))
-    return (int(nums[0]), int(nums[1]))
-
-def calculate_score(candidate: CandidateMatchProfile, job: JobPosting):
-    W_SKILL = 0.50
-    W_LOC = 0.25
-    W_SALARY = 0.15
-    W_EXP = 0.10
-
-    job_skills = set(s.lower() for s in job.required_skills)
-    cand_skills = set(s.lower() for s in candidate.skills)
-    
-    if not job_skills:
-        skill_score = 100
-    else:
-        matches = 0
-        for req in job_skills:
-            for cur in cand_skills:
-                if req == cur or req in cur or cur in req:
-                    matches += 1
-                    break
-        skill_score = (matches / len(job_skills)) * 100
+# /matches is the "matches" profile of the shared scoring pipeline (50/25/15/10)
+
+MATCHES_PROFILE = PROFILES["matches"]
 
+def matches_profile(variants: Optional[str]) -> ScoringProfile:
+    """The /matches profile with per-factor variant overrides ("factor=fast,...")"""
+    try:
+        overrides = parse_variants(variants)
+        return MATCHES_PROFILE.with_variants(overrides) if overrides else MATCHES_PROFILE
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def match_payload(job: JobPosting, scores: PipelineScores, prepared: PreparedJobs, row: int):
+    skill_score = float(scores.factors["skill_containment"][row])
     if skill_score < 10:
         return {
             "job_id": job.job_id,
@@ -310,46 +326,47 @@ def calculate_score(candidate: CandidateMatchProfile, job: JobPosting):
             "recommendation_reason": "Not a fit: Critical skills missing."
         }
 
-    loc_score = 100 if any(l.lower() in job.location.lower() for l in candidate.preferred_locations) else 20
-    
-    salary_score = 0
-    job_max = job.salary_range[1] if len(job.salary_range) > 1 else job.salary_range[0]
-    if candidate.expected_salary <= job_max: salary_score = 100
-    elif candidate.expected_salary - job_max < 200000: salary_score = 50
-    
-    exp_min, exp_max = parse_experience(job.experience_required)
-    exp_score = 100 if exp_min <= candidate.experience_years <= exp_max + 1 else 40
-    
-    final_score = (skill_score * W_SKILL) + (loc_score * W_LOC) + (salary_score * W_SALARY) + (exp_score * W_EXP)
-
-    missing = []
-    for req in job_skills:
-        found = False
-        for cur in cand_skills:
-            if req == cur or req in cur or cur in req: found = True
-        if not found: missing.append(req.title())
+    final_score = float(scores.raw_total[row])
+    missing = SkillContainmentFactor.missing_skills(
+        scores.states["skill_containment"], prepared, row, scores.profile.variants["skill_containment"]
+    )
 
     return {
         "job_id": job.job_id,
-        "match_score": round(final_score, 1),
+        "match_score": float(scores.total[row]),
         "breakdown": {
             "skill_match": round(skill_score),
-            "location_match": round(loc_score),
-            "salary_match": round(salary_score),
-            "experience_match": round(exp_score)
+            "location_match": round(float(scores.factors["location_contains"][row])),
+            "salary_match": round(float(scores.factors["salary_ceiling"][row])),
+            "experience_match": round(float(scores.factors["experience_window"][row]))
         },
-        "missing_skills": missing,
+        "missing_skills": [req.title() for req in missing],
         "recommendation_reason": "Strong match" if final_score > 70 else "Partial match"
     }
 
+def calculate_score(candidate: CandidateMatchProfile, job: JobPosting, profile: ScoringProfile = MATCHES_PROFILE):
+    prepared = PreparedJobs(job_matching_engine, postings=[job])
+    return match_payload(job, job_matching_engine.pipeline.score(candidate, prepared, profile), prepared, 0)
+
 @app.post("/matches")
-async def get_matches(payload: MatchRequest):
-    results = []
-    for job in payload.jobs:
-        match_data = calculate_score(payload.candidate, job)
-        results.append(match_data)
-    results.sort(key=lambda x: x['match_score'], reverse=True)
-    return {"matches": results}
+async def get_matches(
+    payload: MatchRequest,
+    top_k: Optional[int] = Query(None, ge=1),
+    variants: Optional[str] = None
+):
+    # variants: per-factor implementation overrides, e.g. "skill_containment=fast"
+    # Every factor is scored for all jobs in one pass; payloads are built only for returned rows
+    profile = matches_profile(variants)
+    
+    def compute() -> list:
+        prepared = PreparedJobs(job_matching_engine, postings=payload.jobs)
+        scores = job_matching_engine.pipeline.score(payload.candidate, prepared, profile)
+        with metrics.timer(metrics.stage_latency, profile.name, "ranking"):
+            order = job_matching_engine.rank_rows(scores.total, np.arange(len(prepared)), top_k)
+        with metrics.timer(metrics.stage_latency, profile.name, "serialization"):
+            return [match_payload(payload.jobs[row], scores, prepared, row) for row in order]
+    
+    return {"matches": await match_executor.run(compute)}
 
 
 # ========================================
@@ -359,7 +376,7 @@ async def get_matches(payload: MatchRequest):
 # --- CANDIDATE ENDPOINTS ---
 
 @app.post("/candidates", response_model=CandidateResponse)
-async def create_candidate(candidate: CandidateCreate, db: Session = Depends(get_db)):
+def create_candidate(candidate: CandidateCreate, db: Session = Depends(get_db)):
     """Create a new candidate"""
     # Check if candidate already exists
     existing = db.query(Candidate).filter(Candidate.id == candidate.id).first()
@@ -368,13 +385,14 @@ async def create_candidate(candidate: CandidateCreate, db: Session = Depends(get
     
     db_candidate = Candidate(**candidate.dict())
     db.add(db_candidate)
+    application_stats.record_candidate(db)
     db.commit()
     db.refresh(db_candidate)
     return db_candidate
 
 
 @app.get("/candidates/{candidate_id}", response_model=CandidateResponse)
-async def get_candidate(candidate_id: str, db: Session = Depends(get_db)):
+def get_candidate(candidate_id: str, db: Session = Depends(get_db)):
     """Get candidate details"""
     candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
     if not candidate:
@@ -382,24 +400,51 @@ async def get_candidate(candidate_id: str, db: Session = Depends(get_db)):
     return candidate
 
 
+@app.put("/candidates/{candidate_id}/match-profile", response_model=CandidateMatchProfile)
+def upsert_candidate_match_profile(
+    candidate_id: str,
+    profile: CandidateMatchProfile,
+    db: Session = Depends(get_db)
+):
+    """Add or replace a candidate's matching profile; the candidate index is updated incrementally"""
+    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    
+    row = candidate.match_profile
+    if row is None:
+        row = CandidateProfile(candidate_id=candidate_id)
+        db.add(row)
+    candidate_index.store_profile(row, profile)
+    db.commit()
+    candidate_index.upsert(candidate_id, profile)
+    return profile
+
+
 # --- JOB ENDPOINTS ---
 
 @app.post("/jobs", response_model=JobResponse)
-async def create_job(job: JobCreate, db: Session = Depends(get_db)):
+def create_job(job: JobCreate, db: Session = Depends(get_db)):
     """Create a new job posting"""
     existing = db.query(Job).filter(Job.id == job.id).first()
     if existing:
         return existing
     
-    db_job = Job(**job.dict())
+    db_job = Job(**job.dict(exclude={"match_profile"}))
     db.add(db_job)
+    if job.match_profile:
+        profile = JobMatchProfile(job_id=job.id)
+        catalog.compile_profile(db_job, profile, job.match_profile)
+        db.add(profile)
+    application_stats.record_job(db)
     db.commit()
     db.refresh(db_job)
+    catalog.refresh(db_job)
     return db_job
 
 
 @app.get("/jobs/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str, db: Session = Depends(get_db)):
+def get_job(job_id: str, db: Session = Depends(get_db)):
     """Get job details"""
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
@@ -407,10 +452,56 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
     return job
 
 
+@app.patch("/jobs/{job_id}/status", response_model=JobResponse)
+def update_job_status(job_id: str, status_update: JobStatusUpdate, db: Session = Depends(get_db)):
+    """Open or close a job; the job catalog entry is recompiled"""
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    job.status = status_update.status
+    job.updated_at = datetime.utcnow()
+    db.commit()
+    db.refresh(job)
+    catalog.refresh(job)
+    return job
+
+
+@app.put("/jobs/{job_id}/match-profile", response_model=JobMatchProfileResponse)
+def upsert_job_match_profile(
+    job_id: str,
+    profile_data: JobMatchProfileCreate,
+    db: Session = Depends(get_db)
+):
+    """Add or replace a job's matching inputs; only this job's catalog entry is recompiled"""
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    profile = job.match_profile
+    if profile is None:
+        profile = JobMatchProfile(job_id=job_id)
+        db.add(profile)
+    catalog.compile_profile(job, profile, profile_data)
+    db.commit()
+    db.refresh(job)
+    catalog.refresh(job)
+    
+    return JobMatchProfileResponse(
+        job_id=job_id,
+        normalized_skills=json.loads(profile.normalized_skills),
+        experience_min=profile.experience_min,
+        experience_max=profile.experience_max,
+        location_normalized=profile.location_normalized,
+        title_normalized=profile.title_normalized,
+        compiled_at=profile.compiled_at
+    )
+
+
 # --- APPLICATION ENDPOINTS ---
 
 @app.post("/applications", response_model=ApplicationResponse, status_code=201)
-async def submit_application(app_submit: ApplicationSubmit, db: Session = Depends(get_db)):
+def submit_application(app_submit: ApplicationSubmit, db: Session = Depends(get_db)):
     """Submit a new application"""
     
     # Verify candidate and job exist
@@ -452,14 +543,42 @@ async def submit_application(app_submit: ApplicationSubmit, db: Session = Depend
     
     db.add(db_application)
     db.add(db_history)
+    application_stats.record_submission(db, db_application)
     db.commit()
+    entity_stats.invalidate_application(app_submit.job_id, app_submit.candidate_id)
     db.refresh(db_application)
     
     return db_application
 
 
+@app.post("/applications/import", response_model=ApplicationImportResult)
+async def import_applications(
+    request: Request,
+    format: Optional[str] = Query(
+        None, pattern="^(ndjson|csv)$", description="Upload format; defaults to the Content-Type (text/csv or NDJSON)"
+    ),
+    db: Session = Depends(get_db)
+):
+    """
+    Bulk-import applications from an NDJSON or CSV request body
+    
+    Each record has job_id and candidate_id, and optionally status (default
+    applied), applied_at and updated_at (ISO 8601). Rows are validated and
+    written in chunked transactions; the response lists every rejected row
+    with its 1-based record number and the reason.
+    """
+    body = await request.body()
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Import body must be UTF-8 text")
+    
+    records = parse_records(text, format or detect_format(request.headers.get("content-type")))
+    return await run_in_threadpool(application_importer.run, db, records)
+
+
 @app.get("/applications/{application_id}", response_model=ApplicationWithHistory)
-async def get_application_details(application_id: str, db: Session = Depends(get_db)):
+def get_application_details(application_id: str, db: Session = Depends(get_db)):
     """Get application details with full status history"""
     application = db.query(Application).filter(Application.id == application_id).first()
     if not application:
@@ -468,7 +587,7 @@ async def get_application_details(application_id: str, db: Session = Depends(get
 
 
 @app.patch("/applications/{application_id}/status", response_model=ApplicationWithHistory)
-async def update_application_status(
+def update_application_status(
     application_id: str,
     status_update: ApplicationStatusUpdate,
     db: Session = Depends(get_db)
@@ -479,24 +598,17 @@ async def update_application_status(
         raise HTTPException(status_code=404, detail="Application not found")
     
     # Validate status transition
-    valid_transitions = {
-        StatusEnum.APPLIED: [StatusEnum.SCREENING, StatusEnum.REJECTED],
-        StatusEnum.SCREENING: [StatusEnum.INTERVIEW_SCHEDULED, StatusEnum.REJECTED],
-        StatusEnum.INTERVIEW_SCHEDULED: [StatusEnum.INTERVIEW_COMPLETED, StatusEnum.REJECTED],
-        StatusEnum.INTERVIEW_COMPLETED: [StatusEnum.OFFERED, StatusEnum.REJECTED],
-        StatusEnum.OFFERED: [StatusEnum.REJECTED],
-        StatusEnum.REJECTED: []
-    }
-    
-    if status_update.status not in valid_transitions.get(application.status, []):
+    if not is_valid_transition(application.status, status_update.status):
         raise HTTPException(
             status_code=400,
             detail=f"Invalid transition from {application.status} to {status_update.status}"
         )
     
     old_status = application.status
+    previous_updated_at = application.updated_at
     application.status = status_update.status
     application.updated_at = datetime.utcnow()
+    application_stats.record_transition(db, application, old_status, previous_updated_at)
     
     # Create status history entry
     history_id = str(uuid.uuid4())
@@ -511,19 +623,70 @@ async def update_application_status(
     
     db.add(db_history)
     db.commit()
+    entity_stats.invalidate_application(application.job_id, application.candidate_id)
     db.refresh(application)
     
     return application
 
 
+PAGE_LIMIT_QUERY = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Applications per page")
+PAGE_CURSOR_QUERY = Query(None, description="X-Next-Cursor value from the previous page")
+
+
+def paginate_applications(query, response: Response, limit: int, cursor: Optional[str]):
+    """One keyset page of an application query; the next cursor goes in X-Next-Cursor"""
+    try:
+        applications, next_cursor = application_page(query, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return applications
+
+
+@app.patch("/applications/status", response_model=BulkStatusUpdateResult)
+def bulk_update_application_status(bulk_update: BulkStatusUpdate, db: Session = Depends(get_db)):
+    """
+    Move many applications to one status in a single transaction
+    
+    Applications that do not exist or whose current status does not allow the
+    transition are listed under `rejected`; all others are updated, each with
+    its own status history entry. 409 if some of them changed status
+    concurrently (nothing is written).
+    """
+    if not bulk_update.application_ids:
+        raise HTTPException(status_code=400, detail="Must provide at least one application id")
+    if len(bulk_update.application_ids) > MAX_BULK_TRANSITION:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BULK_TRANSITION} applications per bulk status update"
+        )
+    
+    try:
+        return bulk_transition(
+            db, bulk_update.application_ids, bulk_update.status,
+            notes=bulk_update.notes, changed_by=bulk_update.changed_by
+        )
+    except TransitionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
 @app.get("/candidates/{candidate_id}/applications", response_model=List[ApplicationResponse])
-async def get_candidate_applications(
+def get_candidate_applications(
     candidate_id: str,
+    response: Response,
     status: Optional[StatusEnum] = Query(None),
+    limit: int = PAGE_LIMIT_QUERY,
+    cursor: Optional[str] = PAGE_CURSOR_QUERY,
     db: Session = Depends(get_db)
 ):
-    """Get all applications for a candidate, optionally filtered by status"""
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    """
+    Get a candidate's applications, newest first, optionally filtered by status
+    
+    Returns one page of at most `limit` applications; when more remain, the
+    X-Next-Cursor response header holds the `cursor` for the next page
+    """
+    candidate = db.query(Candidate.id).filter(Candidate.id == candidate_id).first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
@@ -532,18 +695,25 @@ async def get_candidate_applications(
     if status:
         query = query.filter(Application.status == status)
     
-    applications = query.order_by(Application.applied_at.desc()).all()
-    return applications
+    return paginate_applications(query, response, limit, cursor)
 
 
 @app.get("/jobs/{job_id}/applications", response_model=List[ApplicationResponse])
-async def get_job_applications(
+def get_job_applications(
     job_id: str,
+    response: Response,
     status: Optional[StatusEnum] = Query(None),
+    limit: int = PAGE_LIMIT_QUERY,
+    cursor: Optional[str] = PAGE_CURSOR_QUERY,
     db: Session = Depends(get_db)
 ):
-    """Get all applications for a job, optionally filtered by status"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    """
+    Get a job's applications, newest first, optionally filtered by status
+    
+    Returns one page of at most `limit` applications; when more remain, the
+    X-Next-Cursor response header holds the `cursor` for the next page
+    """
+    job = db.query(Job.id).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -552,137 +722,39 @@ async def get_job_applications(
     if status:
         query = query.filter(Application.status == status)
     
-    applications = query.order_by(Application.applied_at.desc()).all()
-    return applications
+    return paginate_applications(query, response, limit, cursor)
 
 
 @app.get("/applications/stats/dashboard", response_model=ApplicationStats)
-async def get_application_stats(db: Session = Depends(get_db)):
-    """Get overall application statistics"""
-    total_applications = db.query(func.count(Application.id)).scalar()
-    total_candidates = db.query(func.count(Candidate.id)).scalar()
-    total_jobs = db.query(func.count(Job.id)).scalar()
-    
-    # Applications by status
-    by_status = {}
-    for status in StatusEnum:
-        count = db.query(func.count(Application.id)).filter(
-            Application.status == status
-        ).scalar()
-        by_status[status.value] = count
-    
-    # Applications by job (top jobs)
-    by_job_query = db.query(
-        Job.id,
-        Job.title,
-        func.count(Application.id).label("count")
-    ).join(Application).group_by(Job.id, Job.title).order_by(
-        func.count(Application.id).desc()
-    ).limit(10).all()
-    
-    by_job = {f"{job_id}:{title}": count for job_id, title, count in by_job_query}
-    
-    # Calculate average time to offer (in days)
-    offered_apps = db.query(Application).filter(
-        Application.status == StatusEnum.OFFERED
-    ).all()
-    
-    avg_time_to_offer = None
-    if offered_apps:
-        times = []
-        for app in offered_apps:
-            if app.status_history:
-                start = app.applied_at
-                end = app.updated_at
-                days = (end - start).days
-                times.append(days)
-        if times:
-            avg_time_to_offer = sum(times) / len(times)
-    
-    # Calculate offer acceptance rate
-    total_offers = db.query(func.count(Application.id)).filter(
-        Application.status == StatusEnum.OFFERED
-    ).scalar()
-    offer_rate = (total_offers / total_applications * 100) if total_applications > 0 else 0
-    
-    return ApplicationStats(
-        total_applications=total_applications or 0,
-        by_status=by_status,
-        by_job=by_job,
-        total_candidates=total_candidates or 0,
-        total_jobs=total_jobs or 0,
-        average_time_to_offer=avg_time_to_offer,
-        offer_acceptance_rate=round(offer_rate, 2)
-    )
+def get_application_stats(db: Session = Depends(get_db)):
+    """
+    Get overall application statistics
+    
+    Served from counters maintained with every application write, so the cost
+    does not grow with the number of applications
+    """
+    return application_stats.read(db)
 
 
 @app.get("/jobs/{job_id}/applications/stats", response_model=JobApplicationStats)
-async def get_job_application_stats(job_id: str, db: Session = Depends(get_db)):
+def get_job_application_stats(job_id: str, db: Session = Depends(get_db)):
     """Get application statistics for a specific job"""
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
+    stats = entity_stats.job_stats(db, job_id)
+    if stats is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    
-    total = db.query(func.count(Application.id)).filter(
-        Application.job_id == job_id
-    ).scalar()
-    
-    by_status = {}
-    for status in StatusEnum:
-        count = db.query(func.count(Application.id)).filter(
-            Application.job_id == job_id,
-            Application.status == status
-        ).scalar()
-        by_status[status.value] = count
-    
-    return JobApplicationStats(
-        job_id=job_id,
-        job_title=job.title,
-        total_applications=total or 0,
-        by_status=by_status
-    )
+    return stats
 
 
 @app.get("/candidates/{candidate_id}/applications/stats", response_model=CandidateApplicationStats)
-async def get_candidate_application_stats(
+def get_candidate_application_stats(
     candidate_id: str,
     db: Session = Depends(get_db)
 ):
     """Get application statistics for a specific candidate"""
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-    if not candidate:
+    stats = entity_stats.candidate_stats(db, candidate_id)
+    if stats is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
-    
-    total = db.query(func.count(Application.id)).filter(
-        Application.candidate_id == candidate_id
-    ).scalar()
-    
-    by_status = {}
-    for status in StatusEnum:
-        count = db.query(func.count(Application.id)).filter(
-            Application.candidate_id == candidate_id,
-            Application.status == status
-        ).scalar()
-        by_status[status.value] = count
-    
-    offers = db.query(func.count(Application.id)).filter(
-        Application.candidate_id == candidate_id,
-        Application.status == StatusEnum.OFFERED
-    ).scalar()
-    
-    rejections = db.query(func.count(Application.id)).filter(
-        Application.candidate_id == candidate_id,
-        Application.status == StatusEnum.REJECTED
-    ).scalar()
-    
-    return CandidateApplicationStats(
-        candidate_id=candidate_id,
-        candidate_name=candidate.name,
-        total_applications=total or 0,
-        by_status=by_status,
-        offers_received=offers or 0,
-        rejections=rejections or 0
-    )
+    return stats
 
 
 # --- HEALTH CHECK ---
@@ -693,12 +765,50 @@ async def health_check():
     return {"status": "healthy", "service": "Application Lifecycle Management"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Prometheus text-format metrics: per-route latency, jobs scored and DB queries
+    per request, per-stage matching time and DB statement counts/latency
+    """
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 # ============================================================================
 # --- MULTI-FACTOR JOB MATCHING ENGINE ---
 # ============================================================================
 
-@app.post("/api/match/candidate-to-jobs", response_model=MatchingResponse)
-async def match_candidate_to_jobs(request: MatchingRequest):
+# Same weights, but related skills (prerequisites, same category) earn partial credit
+partial_credit_engine = JobMatchingEngine(profile=PROFILES["api_match_partial"])
+
+SKILL_CREDIT_QUERY = Query(
+    "exact", pattern="^(exact|partial)$",
+    description="exact: only held skills count; partial: related skills earn fractional credit"
+)
+
+
+def scoring_engine(skill_credit: str) -> JobMatchingEngine:
+    return partial_credit_engine if skill_credit == "partial" else job_matching_engine
+
+
+def requested_fields(fields: Optional[str]) -> frozenset:
+    """Parse the `fields` query parameter; unknown names are a 400"""
+    try:
+        return parse_match_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/match/candidate-to-jobs", response_model=MatchingResponse, response_model_exclude_none=True)
+async def match_candidate_to_jobs(
+    request: MatchingRequest,
+    vectorized: bool = Query(False, description="Score all jobs with columnar array operations"),
+    top_k: Optional[int] = Query(None, ge=1, description="Return only the k best matches"),
+    parallel: bool = Query(False, description="Shard the job list across the matching process pool"),
+    fields: Optional[str] = Query(None, description="Comma-separated result parts to include: score, breakdown, skills, reason"),
+    cache: bool = Query(True, description="Serve repeated requests from the match-result cache"),
+    skill_credit: str = SKILL_CREDIT_QUERY,
+):
     """
     Multi-factor job matching endpoint
     
@@ -711,6 +821,15 @@ async def match_candidate_to_jobs(request: MatchingRequest):
     
     Args:
         request: MatchingRequest containing candidate profile and job list
+        vectorized: Use the columnar scoring mode (same scores, faster on large job lists)
+        top_k: Return only the k best matches; total_matches still counts every job
+        parallel: Split the job list across worker processes (same results as serial)
+        fields: Comma-separated subset of score, breakdown, skills, reason; parts not
+            requested are never computed and are omitted from each match
+        cache: Reuse the result of an identical earlier request (same canonical
+            candidate, same job list, same top_k and fields)
+        skill_credit: "partial" gives related skills fractional credit (always
+            scored column-wise in-process, so vectorized/parallel do not apply)
     
     Returns:
         MatchingResponse with ranked matches and detailed breakdowns
@@ -743,6 +862,8 @@ async def match_candidate_to_jobs(request: MatchingRequest):
           ]
         }
     """
+    selected_fields = requested_fields(fields)
+    
     try:
         # Validate input
         if not request.candidate.skills:
@@ -751,27 +872,282 @@ async def match_candidate_to_jobs(request: MatchingRequest):
         if not request.jobs:
             raise HTTPException(status_code=400, detail="Must provide at least one job")
         
-        # Initialize matching engine
-        engine = JobMatchingEngine()
+        scorer = scoring_engine(skill_credit)
+        
+        def compute() -> MatchingResponse:
+            if parallel and scorer is job_matching_engine:
+                return parallel_matcher.match_candidate_to_jobs(
+                    request.candidate, request.jobs, top_k=top_k, fields=selected_fields
+                )
+            
+            # Perform matching with the shared engine
+            return scorer.match_candidate_to_jobs(
+                request.candidate, request.jobs, vectorized=vectorized, top_k=top_k, fields=selected_fields
+            )
+        
+        if not cache:
+            return await match_executor.run(compute)
         
-        # Perform matching
-        response = engine.match_candidate_to_jobs(request.candidate, request.jobs)
+        # vectorized/parallel give identical results, so they share cache entries
+        def cached() -> MatchingResponse:
+            key = match_cache.make_key(
+                SCOPE_JOBS, jobs_fingerprint(request.jobs),
+                candidate_fingerprint(job_matching_engine, request.candidate),
+                top_k, tuple(sorted(selected_fields)), skill_credit
+            )
+            return match_cache.get_or_compute(key, compute)
         
-        return response
+        return await match_executor.run(cached)
     
+    except ExecutorSaturated:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Validation error: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Matching error: {str(e)}")
 
 
+# Match lines grouped into one chunk of the streamed response
+STREAM_CHUNK_LINES = 100
+
+
+def ndjson_match_stream(total_matches: int, matches):
+    """Yield NDJSON chunks: one ranked match per line, then a summary line"""
+    chunk = []
+    for match in matches:
+        chunk.append(match.model_dump_json(exclude_none=True))
+        if len(chunk) >= STREAM_CHUNK_LINES:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    chunk.append(json.dumps({"total_matches": total_matches}))
+    yield "\n".join(chunk) + "\n"
+
+
+@app.post("/api/match/candidate-to-jobs/stream")
+async def stream_candidate_to_jobs(
+    request: MatchingRequest,
+    top_k: Optional[int] = Query(None, ge=1, description="Return only the k best matches"),
+    fields: Optional[str] = Query(None, description="Comma-separated result parts to include: score, breakdown, skills, reason"),
+    skill_credit: str = SKILL_CREDIT_QUERY,
+):
+    """
+    Streaming variant of /api/match/candidate-to-jobs
+    
+    Responds with application/x-ndjson: one JobMatchResult per line in rank
+    order, followed by a final {"total_matches": N} line. Result objects are
+    built and serialized as the response is sent, so clients can render the
+    first matches while the rest are still streaming.
+    """
+    selected_fields = requested_fields(fields)
+    
+    if not request.candidate.skills:
+        raise HTTPException(status_code=400, detail="Candidate must have at least one skill")
+    
+    if not request.jobs:
+        raise HTTPException(status_code=400, detail="Must provide at least one job")
+    
+    # Scoring and ranking run on the executor; the lazy result iterator is
+    # consumed on Starlette's threadpool while the response streams
+    scorer = scoring_engine(skill_credit)
+    total, matches = await match_executor.run(
+        lambda: scorer.stream_candidate_to_jobs(
+            request.candidate, JobColumns.from_postings(scorer, request.jobs),
+            top_k=top_k, fields=selected_fields
+        )
+    )
+    return StreamingResponse(ndjson_match_stream(total, matches), media_type="application/x-ndjson")
+
+
+# Most candidate x job pairs /api/match/matrix scores without top_k (a min_score
+# floor does not bound the output: a low floor keeps every pair)
+MATCH_MATRIX_MAX_PAIRS = 1_000_000
+
+
+@app.post("/api/match/matrix", response_model=MatchMatrixResponse)
+async def match_matrix(
+    request: MatchMatrixRequest,
+    top_k: Optional[int] = Query(None, ge=1, description="Keep only each candidate's k best jobs"),
+    min_score: Optional[float] = Query(None, ge=0, le=100, description="Drop pairs scoring below this value"),
+    skill_credit: str = SKILL_CREDIT_QUERY,
+):
+    """
+    Bulk matching: score many candidates against many jobs in one call
+    
+    The job list is sent and compiled once for the whole candidate batch.
+    Results are compact [candidate_idx, job_idx, score] triples (indexes into
+    the request lists): every pair in job order, or each candidate's top_k
+    jobs in rank order. Scores equal /api/match/candidate-to-jobs.
+    """
+    if not request.candidates:
+        raise HTTPException(status_code=400, detail="Must provide at least one candidate")
+    
+    if not request.jobs:
+        raise HTTPException(status_code=400, detail="Must provide at least one job")
+    
+    pairs = len(request.candidates) * len(request.jobs)
+    if top_k is None and pairs > MATCH_MATRIX_MAX_PAIRS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Matrix of {pairs} pairs exceeds {MATCH_MATRIX_MAX_PAIRS}; use top_k"
+        )
+    
+    return await match_executor.run(
+        scoring_engine(skill_credit).match_matrix, request.candidates, request.jobs, top_k=top_k, min_score=min_score
+    )
+
+
+@app.post("/api/match/catalog", response_model=MatchingResponse, response_model_exclude_none=True)
+async def match_candidate_to_catalog(
+    request: CatalogMatchRequest,
+    top_k: Optional[int] = Query(None, ge=1, description="Return only the k best matches"),
+    fields: Optional[str] = Query(None, description="Comma-separated result parts to include: score, breakdown, skills, reason"),
+    db: Session = Depends(get_db)
+):
+    """
+    Match a candidate against the server-side job catalog
+    
+    Only the candidate (plus optional job_ids / locations / companies filters)
+    is sent; jobs are registered once via POST /jobs or
+    PUT /jobs/{job_id}/match-profile and kept pre-compiled on the server.
+    Results are cached per candidate until the catalog changes.
+    """
+    selected_fields = requested_fields(fields)
+    
+    if not request.candidate.skills:
+        raise HTTPException(status_code=400, detail="Candidate must have at least one skill")
+    
+    def compute() -> MatchingResponse:
+        catalog.ensure_loaded(db)
+        key = match_cache.make_key(
+            SCOPE_CATALOG, catalog.version,
+            candidate_fingerprint(job_matching_engine, request.candidate),
+            top_k, tuple(sorted(selected_fields)),
+            request.filters.model_dump_json() if request.filters else None
+        )
+        return match_cache.get_or_compute(
+            key, lambda: catalog.match(request.candidate, request.filters, top_k=top_k, fields=selected_fields)
+        )
+    
+    return await match_executor.run(compute)
+
+
+@app.post("/api/match/sessions", response_model=MatchSessionResponse, response_model_exclude_none=True)
+async def create_match_session(
+    request: CatalogMatchRequest,
+    top_k: Optional[int] = Query(None, ge=1, description="Return only the k best matches"),
+    fields: Optional[str] = Query(None, description="Comma-separated result parts to include: score, breakdown, skills, reason"),
+    db: Session = Depends(get_db)
+):
+    """
+    Start an incremental match session against the job catalog
+    
+    The per-factor scores are kept on the server; send profile edits to
+    PATCH /api/match/sessions/{session_id} to re-rank without rescoring everything.
+    """
+    selected_fields = requested_fields(fields)
+    if not request.candidate.skills:
+        raise HTTPException(status_code=400, detail="Candidate must have at least one skill")
+    
+    def compute() -> MatchSessionResponse:
+        catalog.ensure_loaded(db)
+        session = match_sessions.create(catalog, request.candidate, request.filters)
+        return session.response(top_k, selected_fields)
+    
+    return await match_executor.run(compute)
+
+
+@app.patch("/api/match/sessions/{session_id}", response_model=MatchSessionResponse, response_model_exclude_none=True)
+async def update_match_session(
+    session_id: str,
+    delta: ProfileDelta,
+    top_k: Optional[int] = Query(None, ge=1, description="Return only the k best matches"),
+    fields: Optional[str] = Query(None, description="Comma-separated result parts to include: score, breakdown, skills, reason"),
+    db: Session = Depends(get_db)
+):
+    """
+    Apply a profile edit (skills added/removed, location, role, salary or
+    experience changes) and re-rank; only the affected factor columns, and
+    for skills only the jobs requiring a changed skill, are rescored
+    """
+    selected_fields = requested_fields(fields)
+    session = match_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Match session not found or expired")
+    
+    def compute() -> MatchSessionResponse:
+        catalog.ensure_loaded(db)
+        return session.update(delta, top_k, selected_fields)
+    
+    try:
+        return await match_executor.run(compute)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.delete("/api/match/sessions/{session_id}")
+async def delete_match_session(session_id: str):
+    """Close a match session and free its scores"""
+    if not match_sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail="Match session not found or expired")
+    return {"message": "Match session closed"}
+
+
+@app.get("/api/match/profiles")
+async def get_scoring_profiles():
+    """Named scoring profiles: factor weights and the implementation variant of each factor"""
+    return {"profiles": [profile.describe() for profile in PROFILES.values()]}
+
+
+@app.get("/api/match/cache/stats")
+async def get_match_cache_stats():
+    """Match-result cache counters (hits, misses, evictions, expirations) and memory use"""
+    return match_cache.stats()
+
+
+@app.get("/api/match/executor/stats")
+async def get_match_executor_stats():
+    """Matching executor load: busy workers, queued requests, completed and rejected counts"""
+    return match_executor.stats()
+
+
+@app.get("/api/match/jobs/{job_id}/candidates", response_model=CandidateRankingResponse, response_model_exclude_none=True)
+async def match_job_to_candidates(
+    job_id: str,
+    top_k: Optional[int] = Query(50, ge=1, description="Return only the k best candidates"),
+    min_overlap: int = Query(1, ge=0, description="Minimum number of shared required skills"),
+    fields: Optional[str] = Query(None, description="Comma-separated result parts to include: score, breakdown, skills, reason"),
+    db: Session = Depends(get_db)
+):
+    """
+    Rank stored candidates for a job (reverse matching)
+    
+    Uses the skill -> candidate inverted index so only candidates sharing at
+    least min_overlap required skills are scored, with the standard WEIGHTS.
+    """
+    selected_fields = requested_fields(fields)
+    
+    def compute() -> CandidateRankingResponse:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if job.match_profile is None:
+            raise HTTPException(status_code=400, detail="Job has no match profile")
+        
+        candidate_index.ensure_loaded(db)
+        posting = catalog.posting_from_row(job, job.match_profile)
+        return candidate_index.rank_candidates(
+            posting, top_k=top_k, min_overlap=min_overlap, fields=selected_fields
+        )
+    
+    return await match_executor.run(compute)
+
+
 @app.get("/api/match/engine/weights")
 async def get_matching_weights():
     """Get the weights used in the matching algorithm"""
-    engine = JobMatchingEngine()
     return {
-        "weights": engine.WEIGHTS,
-        "total": sum(engine.WEIGHTS.values()),
+        "weights": job_matching_engine.WEIGHTS,
+        "total": sum(job_matching_engine.WEIGHTS.values()),
         "description": {
             "skill": "Technical skill alignment (40%)",
             "location": "Location preference match (20%)",
@@ -780,3 +1156,39 @@ async def get_matching_weights():
             "role": "Job title preference match (10%)"
         }
     }
+
+
+# --- SKILL TAXONOMY ---
+
+@app.get("/api/taxonomy")
+async def get_taxonomy():
+    """Current skill taxonomy version and its skills"""
+    taxonomy = taxonomy_registry.current
+    return {
+        "version": taxonomy.version,
+        "checksum": taxonomy.checksum,
+        "total_skills": len(taxonomy),
+        "skills": taxonomy.skills
+    }
+
+
+@app.post("/api/taxonomy/reload")
+def reload_taxonomy(db: Session = Depends(get_db)):
+    """
+    Reload taxonomy.json without a restart
+    
+    The new version replaces the old one atomically; stored job profiles are
+    renormalized under it here, and the job catalog and candidate index are
+    rebuilt on their next use. An invalid file leaves the current version in place.
+    """
+    try:
+        taxonomy = taxonomy_registry.reload()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Taxonomy reload failed: {str(e)}")
+    recompiled = catalog.recompile_profiles(db)
+    return {
+        "version": taxonomy.version,
+        "checksum": taxonomy.checksum,
+        "total_skills": len(taxonomy),
+        "recompiled_profiles": recompiled
+    }
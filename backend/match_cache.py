@@ -0,0 +1,184 @@
+"""
+Match Result Cache
+In-process LRU/TTL cache of MatchingResponse objects keyed by a canonical
+candidate fingerprint plus the version of the job set that was matched
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from matching_engine import JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch, MatchingResponse
+from job_catalog import catalog
+from taxonomy_registry import taxonomy_registry
+
+# Defaults, overridable through the environment
+DEFAULT_MAX_BYTES = int(os.environ.get("MATCH_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+DEFAULT_TTL_SECONDS = float(os.environ.get("MATCH_CACHE_TTL_SECONDS", 300))
+
+# Approximate in-memory cost of one cached response and of each match in it,
+# on top of the lengths of the strings they hold
+RESPONSE_OVERHEAD_BYTES = 200
+MATCH_OVERHEAD_BYTES = 600
+STRING_OVERHEAD_BYTES = 50
+
+# Key scopes: catalog entries are dropped when the catalog changes
+SCOPE_CATALOG = "catalog"
+SCOPE_JOBS = "jobs"
+
+
+def candidate_fingerprint(engine: JobMatchingEngine, candidate: CandidateMatchProfile) -> str:
+    """
+    Canonical hash of everything in a profile that affects matching
+    Skills are normalized and deduplicated, locations and roles lowercased;
+    all lists are sorted, so reordering a profile does not change the key
+    """
+    canonical = [
+        sorted({engine.normalize_skill(skill) for skill in candidate.skills}),
+        candidate.experience_years,
+        sorted({location.lower().strip() for location in candidate.preferred_locations}),
+        sorted({role.lower().strip() for role in candidate.preferred_roles}),
+        candidate.expected_salary
+    ]
+    return hashlib.sha1(json.dumps(canonical).encode()).hexdigest()
+
+
+def jobs_fingerprint(jobs: List[JobPostingForMatch]) -> str:
+    """Content hash of a request-supplied job list (its 'version')"""
+    digest = hashlib.sha1()
+    for job in jobs:
+        digest.update(job.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+def estimate_size(response: MatchingResponse) -> int:
+    """Approximate bytes held by a cached response"""
+    size = RESPONSE_OVERHEAD_BYTES
+    for match in response.matches:
+        size += MATCH_OVERHEAD_BYTES + len(match.job_id) + len(match.job_title) + len(match.company)
+        for skills in (match.matching_skills, match.missing_skills):
+            if skills:
+                size += sum(STRING_OVERHEAD_BYTES + len(skill) for skill in skills)
+        if match.recommendation_reason:
+            size += len(match.recommendation_reason)
+    return size
+
+
+class MatchCache:
+    """
+    LRU cache with a time-to-live and a memory bound
+
+    - Keys are (scope, version, candidate fingerprint, *params)
+    - Entries older than ttl_seconds are treated as misses and dropped
+    - The least recently used entries are evicted while the estimated size
+      exceeds max_bytes; a single response larger than the bound is not stored
+    - Cached responses are shared between callers and must not be mutated
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[tuple, Tuple[float, int, MatchingResponse]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(scope: str, version: Hashable, fingerprint: str, *params: Hashable) -> tuple:
+        """Cache key; params are any request options that change the response (top_k, fields, ...)"""
+        return (scope, version, fingerprint) + params
+
+    def get(self, key: tuple) -> Optional[MatchingResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, _, response = entry
+            if self._clock() >= expires_at:
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, key: tuple, response: MatchingResponse):
+        size = estimate_size(response)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (self._clock() + self.ttl_seconds, size, response)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], MatchingResponse]) -> MatchingResponse:
+        """Return the cached response for key, computing and storing it on a miss"""
+        response = self.get(key)
+        if response is None:
+            response = compute()
+            self.put(key, response)
+        return response
+
+    def _drop(self, key: tuple):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def invalidate(self, scope: str):
+        """Drop every entry in a scope (its job set changed)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == scope]:
+                self._drop(key)
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+
+
+# Singleton instance
+match_cache = MatchCache()
+
+# Catalog matches are stale once the catalog changes; every key depends on the taxonomy
+catalog.subscribe(lambda version: match_cache.invalidate(SCOPE_CATALOG))
+taxonomy_registry.subscribe(lambda taxonomy: match_cache.clear())
@@ -0,0 +1,119 @@
+"""
+Bounded Match Executor
+Runs CPU-heavy matching (and the blocking DB loads it needs) on worker threads
+so the event loop keeps serving; admission is capped and overflow is rejected
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+# Defaults, overridable through the environment
+DEFAULT_WORKERS = int(os.environ.get("MATCH_EXECUTOR_WORKERS", min(4, os.cpu_count() or 1)))
+DEFAULT_MAX_QUEUE = int(os.environ.get("MATCH_EXECUTOR_MAX_QUEUE", 32))
+DEFAULT_RETRY_AFTER_SECONDS = int(os.environ.get("MATCH_EXECUTOR_RETRY_AFTER", 1))
+
+T = TypeVar("T")
+
+
+class ExecutorSaturated(RuntimeError):
+    """Raised when every worker is busy and the wait queue is full"""
+
+    def __init__(self, pending: int, retry_after: int):
+        super().__init__(f"Matching capacity exhausted ({pending} requests in progress); retry later")
+        self.pending = pending
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """
+    Thread pool with queue-depth admission control
+
+    - workers: threads running submitted work
+    - max_queue: submissions allowed to wait for a free worker; beyond
+      workers + max_queue in flight, run() raises ExecutorSaturated
+    - Work keeps its slot until it finishes, even if the awaiting request
+      was cancelled, so the limit reflects real load
+    - The caller's context variables (e.g. per-request metrics) are
+      visible inside the worker
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        retry_after: int = DEFAULT_RETRY_AFTER_SECONDS
+    ):
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.retry_after = retry_after
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="match")
+        return self._executor
+
+    def _admit(self):
+        with self._lock:
+            if self.pending >= self.capacity:
+                self.rejected += 1
+                raise ExecutorSaturated(self.pending, self.retry_after)
+            self.pending += 1
+
+    def _call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        with self._lock:
+            self.running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.pending -= 1
+                self.completed += 1
+
+    async def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run fn(*args, **kwargs) on a worker thread and await its result"""
+        self._admit()
+        context = contextvars.copy_context()
+        try:
+            with self._lock:
+                future = self._pool().submit(context.run, self._call, fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+            raise
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self.running,
+                "queued": self.pending - self.running,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+# Singleton instance
+match_executor = BoundedExecutor()
@@ -0,0 +1,264 @@
+"""
+Incremental Match Sessions
+Keeps a candidate's per-factor score columns over the job catalog so a profile
+edit only rescores the factor columns, and the skill rows, it actually changes
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from job_catalog import JobCatalog
+from job_columns import round_scores
+from matching_engine import (
+    CandidateMatchProfile, CatalogFilters, MatchSessionResponse, ProfileDelta, MATCH_FIELDS
+)
+from scoring_pipeline import PreparedJobs
+
+# Defaults, overridable through the environment
+DEFAULT_MAX_BYTES = int(os.environ.get("MATCH_SESSION_MAX_BYTES", 256 * 1024 * 1024))
+DEFAULT_TTL_SECONDS = float(os.environ.get("MATCH_SESSION_TTL_SECONDS", 1800))
+
+# Candidate attribute -> the single factor column it feeds
+ATTRIBUTE_FACTORS = {
+    "preferred_locations": "location",
+    "preferred_roles": "role",
+    "expected_salary": "salary",
+    "experience_years": "experience",
+}
+
+# Factor order of the score_columns tuple used to build results
+RESULT_FACTORS = ("skill", "location", "salary", "experience", "role")
+
+
+class MatchSession:
+    """
+    A candidate's factor score columns over one catalog snapshot
+
+    - factors: rounded score array per factor of the engine profile; overall: weighted total
+    - skill_mask / matched: candidate skill ids and matched required-skill counts per row
+    - apply(): a skill edit rescores only the rows requiring an added or removed
+      skill; an attribute edit rescores that factor's column; overall is
+      re-weighted for the rescored rows only
+    - A catalog change since the last call triggers a full rescore
+    """
+
+    def __init__(
+        self,
+        catalog: JobCatalog,
+        candidate: CandidateMatchProfile,
+        filters: Optional[CatalogFilters] = None
+    ):
+        self.session_id = uuid.uuid4().hex
+        self.catalog = catalog
+        self.engine = catalog.engine
+        self.candidate = candidate
+        self.filters = filters
+        self._lock = threading.Lock()
+        self.rescore()
+
+    @property
+    def nbytes(self) -> int:
+        arrays = list(self.factors.values()) + [self.overall, self.skill_mask, self.matched]
+        if self.mask is not None:
+            arrays.append(self.mask)
+        return sum(array.nbytes for array in arrays)
+
+    def rescore(self):
+        """Score every factor for every row of the current catalog"""
+        self.version = self.catalog.version
+        self.columns = self.catalog.columns()
+        self.prepared = PreparedJobs(self.engine, columns=self.columns)
+        self.mask = self.catalog.filter_mask(self.columns, self.filters)
+
+        scores = self.engine.pipeline.score(self.candidate, self.prepared, self.engine.profile)
+        self.factors = scores.factors
+        self.overall = scores.total
+        self.skill_mask = scores.states['skill'].mask
+        self.matched = scores.states['skill'].matched
+        self.recomputed = {factor: len(self.columns) for factor in self.factors}
+
+    def _updated_candidate(self, delta: ProfileDelta) -> CandidateMatchProfile:
+        normalize = self.engine.normalize_skill
+        removed = {normalize(skill) for skill in delta.skills_removed}
+        skills = [skill for skill in self.candidate.skills if normalize(skill) not in removed]
+        present = {normalize(skill) for skill in skills}
+        for skill in delta.skills_added:
+            if normalize(skill) not in present:
+                present.add(normalize(skill))
+                skills.append(skill)
+        if not skills:
+            raise ValueError("Candidate must have at least one skill")
+
+        update = {"skills": skills}
+        for attribute in ATTRIBUTE_FACTORS:
+            value = getattr(delta, attribute)
+            if value is not None:
+                update[attribute] = value
+        return self.candidate.model_copy(update=update)
+
+    def _round(self, values: np.ndarray) -> np.ndarray:
+        digits = self.engine.profile.round_factors
+        return values if digits is None else round_scores(values, digits)
+
+    def _update_skills(self, previous: CandidateMatchProfile) -> np.ndarray:
+        """Adjust matched counts for changed skill ids; returns the rescored rows"""
+        vocabulary = self.columns.vocabulary
+        # Skills without an id are required by no row
+        old_ids = set(map(vocabulary.lookup, previous.skills)) - {None}
+        new_ids = set(map(vocabulary.lookup, self.candidate.skills)) - {None}
+        if len(vocabulary) > len(self.skill_mask):
+            self.skill_mask = np.concatenate(
+                (self.skill_mask, np.zeros(len(vocabulary) - len(self.skill_mask), dtype=bool))
+            )
+
+        hits = []
+        for skill_ids, present, step in ((new_ids - old_ids, True, 1), (old_ids - new_ids, False, -1)):
+            for skill_id in skill_ids:
+                self.skill_mask[skill_id] = present
+                rows = self.columns.rows_with_skill(skill_id)
+                self.matched[rows] += step
+                hits.append(rows)
+
+        rows = np.unique(np.concatenate(hits)) if hits else np.zeros(0, dtype=np.int64)
+        if len(rows):
+            # Rows with a changed skill always have required skills
+            self.factors['skill'][rows] = self._round((self.matched[rows] / self.columns.skill_counts[rows]) * 100)
+        return rows
+
+    def apply(self, delta: ProfileDelta):
+        """Apply a profile edit, rescoring only what it affects (see recomputed)"""
+        previous, self.candidate = self.candidate, self._updated_candidate(delta)
+        if self.catalog.version != self.version:
+            self.rescore()
+            return
+
+        self.recomputed = {}
+        rows = self._update_skills(previous)
+        if len(rows):
+            self.recomputed['skill'] = len(rows)
+
+        full = False
+        for attribute, factor in ATTRIBUTE_FACTORS.items():
+            if getattr(self.candidate, attribute) != getattr(previous, attribute):
+                values = self.engine.pipeline.factor(factor).fast(None, self.candidate, self.prepared)
+                self.factors[factor] = self._round(values)
+                self.recomputed[factor] = len(self.columns)
+                full = True
+
+        profile = self.engine.profile
+        if full:
+            self.overall = self.engine.pipeline.combine(self.factors, profile)[1]
+        elif len(rows):
+            self.overall[rows] = self.engine.pipeline.combine(
+                {factor: values[rows] for factor, values in self.factors.items()}, profile
+            )[1]
+
+    def response(self, top_k: Optional[int] = None, fields: frozenset = MATCH_FIELDS) -> MatchSessionResponse:
+        rows = np.arange(len(self.columns)) if self.mask is None else np.flatnonzero(self.mask)
+        order = self.engine.rank_rows(self.overall, rows, top_k)
+        scored = (self.skill_mask, self.matched) + tuple(self.factors[f] for f in RESULT_FACTORS) + (self.overall,)
+        return MatchSessionResponse(
+            session_id=self.session_id,
+            catalog_version=self.version,
+            matches=list(self.engine.ranked_results(self.columns, scored, order, fields)),
+            total_matches=len(rows),
+            recomputed=self.recomputed
+        )
+
+    def update(
+        self,
+        delta: ProfileDelta,
+        top_k: Optional[int] = None,
+        fields: frozenset = MATCH_FIELDS
+    ) -> MatchSessionResponse:
+        """Apply a profile edit and return the re-ranked matches"""
+        with self._lock:
+            self.apply(delta)
+            return self.response(top_k, fields)
+
+
+class MatchSessionStore:
+    """
+    Open match sessions by id, with a time-to-live and a memory bound
+
+    - A session not used for ttl_seconds expires
+    - The least recently used sessions are evicted while their score
+      columns exceed max_bytes in total
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._sessions: "OrderedDict[str, Tuple[float, MatchSession]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(
+        self,
+        catalog: JobCatalog,
+        candidate: CandidateMatchProfile,
+        filters: Optional[CatalogFilters] = None
+    ) -> MatchSession:
+        session = MatchSession(catalog, candidate, filters)
+        with self._lock:
+            self._sessions[session.session_id] = (self._clock() + self.ttl_seconds, session)
+            self._evict()
+        return session
+
+    def get(self, session_id: str) -> Optional[MatchSession]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            expires_at, session = entry
+            if self._clock() >= expires_at:
+                del self._sessions[session_id]
+                self.expirations += 1
+                return None
+            self._sessions[session_id] = (self._clock() + self.ttl_seconds, session)
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def _bytes(self) -> int:
+        return sum(session.nbytes for _, session in self._sessions.values())
+
+    def _evict(self):
+        # The newest session is always kept
+        while len(self._sessions) > 1 and self._bytes() > self.max_bytes:
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "bytes": self._bytes(),
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+# Singleton instance
+match_sessions = MatchSessionStore()
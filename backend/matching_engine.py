@@ -4,9 +4,17 @@ Implements weighted scoring algorithm for job-candidate compatibility
 """
 
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from enum import Enum
-import re
+import numpy as np
+
+from experience_parser import parse_experience
+from job_columns import JobColumns
+from metrics import metrics
+from scoring_pipeline import PROFILES, PreparedJobs, ScoringPipeline, ScoringProfile
+from skill_vocabulary import SkillVocabulary
+from taxonomy_registry import CompiledTaxonomy, TaxonomyRegistry, taxonomy_registry
+from ranking import select_top_k
 
 
 # ============================================================================
@@ -52,15 +60,15 @@ class MatchBreakdown(BaseModel):
 
 
 class JobMatchResult(BaseModel):
-    """Result of matching a candidate to a job"""
+    """Result of matching a candidate to a job (optional parts are None when not requested)"""
     job_id: str
     job_title: str
     company: str
     match_score: float
-    breakdown: MatchBreakdown
-    missing_skills: List[str]
-    matching_skills: List[str]
-    recommendation_reason: str
+    breakdown: Optional[MatchBreakdown] = None
+    missing_skills: Optional[List[str]] = None
+    matching_skills: Optional[List[str]] = None
+    recommendation_reason: Optional[str] = None
 
 
 class MatchingRequest(BaseModel):
@@ -75,6 +83,93 @@ class MatchingResponse(BaseModel):
     total_matches: int
 
 
+class CandidateMatchResult(BaseModel):
+    """Result of matching a stored candidate to a job"""
+    candidate_id: str
+    match_score: float
+    breakdown: Optional[MatchBreakdown] = None
+    missing_skills: Optional[List[str]] = None
+    matching_skills: Optional[List[str]] = None
+    recommendation_reason: Optional[str] = None
+
+
+class CandidateRankingResponse(BaseModel):
+    """Response with ranked candidates for a job"""
+    job_id: str
+    matches: List[CandidateMatchResult]
+    total_candidates: int  # Candidates that passed the skill-overlap filter
+
+
+class CatalogFilters(BaseModel):
+    """Optional filters applied to the server-side job catalog"""
+    job_ids: Optional[List[str]] = None
+    locations: Optional[List[str]] = None
+    companies: Optional[List[str]] = None
+
+
+class CatalogMatchRequest(BaseModel):
+    """Request payload for matching against the job catalog"""
+    candidate: CandidateMatchProfile
+    filters: Optional[CatalogFilters] = None
+
+
+class MatchMatrixRequest(BaseModel):
+    """Request payload for bulk candidates x jobs matching"""
+    candidates: List[CandidateMatchProfile]
+    jobs: List[JobPostingForMatch]
+
+
+class MatchMatrixResponse(BaseModel):
+    """Bulk match scores as compact (candidate_idx, job_idx, score) triples"""
+    matches: List[Tuple[int, int, float]]
+    total_candidates: int
+    total_jobs: int
+
+
+class ProfileDelta(BaseModel):
+    """Edit to a match session's candidate; omitted fields stay unchanged"""
+    skills_added: List[str] = []
+    skills_removed: List[str] = []
+    preferred_locations: Optional[List[str]] = None
+    preferred_roles: Optional[List[str]] = None
+    expected_salary: Optional[float] = None
+    experience_years: Optional[int] = None
+
+
+class MatchSessionResponse(MatchingResponse):
+    """Ranked catalog matches of a match session"""
+    session_id: str
+    catalog_version: int
+    # Factor -> number of job rows rescored for this response
+    recomputed: Dict[str, int]
+
+
+# Result parts selectable with `fields`; job identity and match_score are always returned
+# - breakdown: per-factor scores
+# - skills: matching_skills and missing_skills
+# - reason: recommendation_reason
+MATCH_FIELDS = frozenset({'score', 'breakdown', 'skills', 'reason'})
+
+
+def parse_match_fields(fields) -> frozenset:
+    """
+    Validate a field projection given as a comma-separated string or an iterable
+    None or an empty selection means every field
+    """
+    if fields is None:
+        return MATCH_FIELDS
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    selected = frozenset(field.strip().lower() for field in fields if field.strip())
+    unknown = selected - MATCH_FIELDS
+    if unknown:
+        raise ValueError(
+            f"Unknown match fields: {', '.join(sorted(unknown))} "
+            f"(allowed: {', '.join(sorted(MATCH_FIELDS))})"
+        )
+    return selected or MATCH_FIELDS
+
+
 # ============================================================================
 # MATCHING ENGINE IMPLEMENTATION
 # ============================================================================
@@ -100,43 +195,44 @@ class JobMatchingEngine:
         'role': 0.10
     }
     
-    def __init__(self):
-        self.skill_taxonomy = self._build_skill_taxonomy()
-    
-    def _build_skill_taxonomy(self) -> Dict[str, Dict[str, Any]]:
-        """Build skill taxonomy for matching"""
-        return {
-            'python': {'category': 'Backend', 'aliases': ['py']},
-            'fastapi': {'category': 'Backend', 'aliases': ['fast-api']},
-            'django': {'category': 'Backend', 'aliases': []},
-            'nodejs': {'category': 'Backend', 'aliases': ['node', 'node.js']},
-            'javascript': {'category': 'Frontend', 'aliases': ['js']},
-            'react': {'category': 'Frontend', 'aliases': ['react.js']},
-            'typescript': {'category': 'Frontend', 'aliases': ['ts']},
-            'postgresql': {'category': 'Database', 'aliases': ['postgres', 'pg']},
-            'mongodb': {'category': 'Database', 'aliases': []},
-            'docker': {'category': 'DevOps', 'aliases': []},
-            'kubernetes': {'category': 'DevOps', 'aliases': ['k8s']},
-            'aws': {'category': 'Cloud', 'aliases': []},
-            'gcp': {'category': 'Cloud', 'aliases': ['google cloud']},
-            'azure': {'category': 'Cloud', 'aliases': []},
-            'git': {'category': 'Tools', 'aliases': []},
-        }
+    # Slack added to score upper bounds to absorb rounding of the factor scores
+    SCORE_BOUND_MARGIN = 0.01
+    
+    def __init__(
+        self,
+        vocabulary: Optional[SkillVocabulary] = None,
+        registry: Optional[TaxonomyRegistry] = None,
+        profile: Optional[ScoringProfile] = None
+    ):
+        # Taxonomy tables are shared through the registry; pass vocabulary to pin one
+        self.registry = registry or taxonomy_registry
+        self._vocabulary = vocabulary
+        # Columnar scoring runs through the shared pipeline with the /api/match weights
+        self.pipeline = ScoringPipeline(self)
+        self.profile = profile or PROFILES["api_match"]
+    
+    @property
+    def taxonomy(self) -> CompiledTaxonomy:
+        """Current compiled taxonomy"""
+        return self.registry.current
+    
+    @property
+    def skill_taxonomy(self) -> Dict[str, Dict[str, Any]]:
+        """Skill taxonomy for matching (canonical name -> category, aliases, ...)"""
+        return self.taxonomy.skills
+    
+    @property
+    def vocabulary(self) -> SkillVocabulary:
+        return self._vocabulary or self.taxonomy.vocabulary
+    
+    @property
+    def standard_factors(self) -> bool:
+        """True when the profile scores exactly the WEIGHTS factors (the rules of the per-job path)"""
+        return self.profile.slots == {factor: factor for factor in self.WEIGHTS}
     
     def normalize_skill(self, skill: str) -> str:
-        """Normalize skill name for comparison"""
-        normalized = skill.lower().strip()
-        
-        # Check direct taxonomy match
-        if normalized in self.skill_taxonomy:
-            return normalized
-        
-        # Check aliases
-        for skill_key, skill_data in self.skill_taxonomy.items():
-            if normalized in skill_data['aliases']:
-                return skill_key
-        
-        return normalized
+        """Normalize skill name for comparison (direct taxonomy match, then aliases)"""
+        return self.vocabulary.normalize(skill)
     
     def calculate_skill_match(self, candidate_skills: List[str], required_skills: List[str]) -> tuple:
         """
@@ -146,18 +242,32 @@ class JobMatchingEngine:
         if not required_skills:
             return 100.0, [], []
         
-        # Normalize all skills
-        candidate_normalized = set(self.normalize_skill(s) for s in candidate_skills)
-        required_normalized = set(self.normalize_skill(s) for s in required_skills)
+        # Encode normalized skills as vectors (request skills never grow the shared vocabulary)
+        vocabulary = self.vocabulary.scratch()
+        candidate_vector = vocabulary.encode(candidate_skills)
+        required_vector = vocabulary.encode(required_skills)
+        
+        return self.calculate_skill_match_encoded(candidate_vector, required_vector, vocabulary)
+    
+    def calculate_skill_match_encoded(
+        self, candidate_vector, required_vector, vocabulary: Optional[SkillVocabulary] = None
+    ) -> tuple:
+        """
+        Skill match on pre-encoded vocabulary vectors
+        vocabulary: the vocabulary that encoded both vectors (defaults to the current one)
+        Returns: (score, matching_skills, missing_skills)
+        """
+        vocabulary = vocabulary or self.vocabulary
         
         # Find matches
-        matching = candidate_normalized.intersection(required_normalized)
-        missing = required_normalized - candidate_normalized
+        matching = vocabulary.intersection(required_vector, candidate_vector)
+        missing = vocabulary.difference(required_vector, candidate_vector)
         
         # Calculate percentage
-        match_percentage = (len(matching) / len(required_normalized)) * 100 if required_normalized else 100.0
+        required_count = vocabulary.size(required_vector)
+        match_percentage = (vocabulary.size(matching) / required_count) * 100 if required_count else 100.0
         
-        return match_percentage, list(matching), list(missing)
+        return match_percentage, vocabulary.decode(matching), vocabulary.decode(missing)
     
     def calculate_location_match(self, preferred_locations: List[str], job_location: str) -> float:
         """
@@ -183,26 +293,10 @@ class JobMatchingEngine:
     
     def parse_experience_range(self, experience_str: str) -> tuple:
         """
-        Parse experience range string
+        Parse experience range string ("0-2 years", "2-5 yrs", "5+ years", "3 years")
         Returns: (min_years, max_years)
         """
-        # Handle various formats: "0-2 years", "2-5 yrs", "5+ years", "3 years"
-        experience_str = experience_str.lower().strip()
-        
-        # Extract numbers
-        numbers = re.findall(r'\d+', experience_str)
-        
-        if not numbers:
-            return 0, 99
-        
-        if len(numbers) == 1:
-            # Single number - could be exact or minimum
-            if '+' in experience_str:
-                return int(numbers[0]), 99
-            else:
-                return int(numbers[0]), int(numbers[0])
-        
-        return int(numbers[0]), int(numbers[1])
+        return parse_experience(experience_str).bounds
     
     def calculate_experience_match(self, candidate_experience: int, experience_required: str) -> float:
         """
@@ -210,7 +304,11 @@ class JobMatchingEngine:
         Returns: score (0-100)
         """
         min_required, max_required = self.parse_experience_range(experience_required)
-        
+        return self.experience_match_for_range(candidate_experience, min_required, max_required)
+    
+    @staticmethod
+    def experience_match_for_range(candidate_experience: int, min_required: int, max_required: int) -> float:
+        """Experience match percentage against an already parsed range"""
         if candidate_experience < min_required:
             # Below minimum - score based on how close
             return (candidate_experience / min_required) * 100 if min_required > 0 else 100.0
@@ -273,105 +371,390 @@ class JobMatchingEngine:
     
     def calculate_overall_score(self, breakdown: MatchBreakdown) -> float:
         """Calculate weighted overall score"""
+        return self.weighted_score(
+            breakdown.skill_match,
+            breakdown.location_match,
+            breakdown.salary_match,
+            breakdown.experience_match,
+            breakdown.role_match
+        )
+    
+    def weighted_score(self, skill, location, salary, experience, role):
+        """Weighted sum of the factor scores (scalars or arrays)"""
+        return (
+            skill * self.WEIGHTS['skill'] +
+            location * self.WEIGHTS['location'] +
+            salary * self.WEIGHTS['salary'] +
+            experience * self.WEIGHTS['experience'] +
+            role * self.WEIGHTS['role']
+        )
+    
+    def score_factors(self, candidate: CandidateMatchProfile, job: JobPostingForMatch, skill_score: float) -> tuple:
+        """Rounded (skill, location, salary, experience, role) scores for a job given its skill score"""
         return (
-            breakdown.skill_match * self.WEIGHTS['skill'] +
-            breakdown.location_match * self.WEIGHTS['location'] +
-            breakdown.salary_match * self.WEIGHTS['salary'] +
-            breakdown.experience_match * self.WEIGHTS['experience'] +
-            breakdown.role_match * self.WEIGHTS['role']
+            round(skill_score, 2),
+            round(self.calculate_location_match(candidate.preferred_locations, job.location), 2),
+            round(self.calculate_salary_match(candidate.expected_salary, job.salary_range), 2),
+            round(self.calculate_experience_match(candidate.experience_years, job.experience_required), 2),
+            round(self.calculate_role_match(candidate.preferred_roles, job.title), 2)
         )
     
+    def score_job(self, candidate: CandidateMatchProfile, job: JobPostingForMatch, skill_score: float) -> float:
+        """
+        Rounded overall score for a job given its skill score, without building result objects
+        Same arithmetic as match_candidate_to_job
+        """
+        return round(self.weighted_score(*self.score_factors(candidate, job, skill_score)), 2)
+    
+    def score_upper_bound(self, skill_score: float) -> float:
+        """Upper bound on the overall score: exact skill contribution plus the maximum of every other factor"""
+        others = sum(weight for factor, weight in self.WEIGHTS.items() if factor != 'skill')
+        return round(skill_score, 2) * self.WEIGHTS['skill'] + 100 * others + self.SCORE_BOUND_MARGIN
+    
+    def build_recommendation_reason(
+        self,
+        matching_count: int,
+        missing_count: int,
+        required_count: int,
+        location_score: float,
+        skill_score: Optional[float] = None
+    ) -> str:
+        """
+        Generate the human-readable recommendation reason
+        skill_score: the skill slot's score when a partial-credit factor fills it; credit
+        it gives beyond the exact matches is attributed to related skills
+        """
+        exact_count = matching_count + missing_count
+        exact_score = (matching_count / exact_count) * 100 if exact_count else 100.0
+        related = skill_score is not None and skill_score > round(exact_score, 2)
+        
+        if matching_count == required_count:
+            reason = f"Perfect skill alignment with {matching_count}/{required_count} matching skills."
+        elif matching_count == 0 and related:
+            reason = f"No exact skill matches; related skills credited for a {skill_score:g}% skill match."
+        elif matching_count == 0:
+            reason = f"No skill matches. Missing {missing_count} required skills."
+        else:
+            reason = f"Strong skill alignment with {matching_count}/{required_count} matching skills."
+            if related:
+                reason += f" Related skills credited for a {skill_score:g}% skill match."
+        
+        if location_score == 100:
+            reason += " Preferred location match."
+        
+        return reason
+    
     def match_candidate_to_job(
         self, 
         candidate: CandidateMatchProfile, 
-        job: JobPostingForMatch
+        job: JobPostingForMatch,
+        fields: frozenset = MATCH_FIELDS
     ) -> JobMatchResult:
         """
         Match a single candidate to a job
+        fields: result parts to build (see MATCH_FIELDS); the others are left as None
         Returns: JobMatchResult with scores and breakdown
         """
-        # Calculate individual scores
-        skill_score, matching_skills, missing_skills = self.calculate_skill_match(
-            candidate.skills, 
-            job.required_skills
-        )
-        
-        location_score = self.calculate_location_match(
-            candidate.preferred_locations, 
-            job.location
-        )
-        
-        salary_score = self.calculate_salary_match(
-            candidate.expected_salary, 
-            job.salary_range
-        )
-        
-        experience_score = self.calculate_experience_match(
-            candidate.experience_years, 
-            job.experience_required
-        )
-        
-        role_score = self.calculate_role_match(
-            candidate.preferred_roles, 
-            job.title
-        )
-        
-        # Create breakdown
-        breakdown = MatchBreakdown(
-            skill_match=round(skill_score, 2),
-            location_match=round(location_score, 2),
-            salary_match=round(salary_score, 2),
-            experience_match=round(experience_score, 2),
-            role_match=round(role_score, 2)
-        )
-        
-        # Calculate overall score
-        overall_score = self.calculate_overall_score(breakdown)
-        
-        # Generate recommendation reason
-        if len(matching_skills) == len(job.required_skills):
-            reason = f"Perfect skill alignment with {len(matching_skills)}/{len(job.required_skills)} matching skills."
-        elif len(matching_skills) == 0:
-            reason = f"No skill matches. Missing {len(missing_skills)} required skills."
-        else:
-            reason = f"Strong skill alignment with {len(matching_skills)}/{len(job.required_skills)} matching skills."
-        
-        if location_score == 100:
-            reason += " Preferred location match."
-        
-        return JobMatchResult(
+        # Calculate individual scores (skills stay encoded until needed)
+        vocabulary = self.vocabulary.scratch()
+        required_vector = vocabulary.encode(job.required_skills)
+        candidate_vector = vocabulary.encode(candidate.skills)
+        required_count = vocabulary.size(required_vector)
+        matched_count = vocabulary.overlap(required_vector, candidate_vector)
+        skill_score = (matched_count / required_count) * 100 if required_count else 100.0
+        
+        factors = self.score_factors(candidate, job, skill_score)
+        return self.build_job_result(job, factors, fields, vocabulary, candidate_vector, required_vector)
+    
+    def build_job_result(
+        self,
+        job: JobPostingForMatch,
+        factors: tuple,
+        fields: frozenset,
+        vocabulary: SkillVocabulary,
+        candidate_vector,
+        required_vector
+    ) -> JobMatchResult:
+        """
+        Result for a job from its already computed score_factors(); nothing is rescored
+        vocabulary: the vocabulary that encoded both skill vectors (decoded only for 'skills' and 'reason')
+        """
+        # Overall score from the rounded factor scores
+        result = JobMatchResult(
             job_id=job.job_id,
             job_title=job.title,
             company=job.company,
-            match_score=round(overall_score, 2),
-            breakdown=breakdown,
-            missing_skills=missing_skills,
-            matching_skills=matching_skills,
-            recommendation_reason=reason
+            match_score=round(self.weighted_score(*factors), 2)
         )
+        
+        # Build only the requested explanation parts
+        if 'breakdown' in fields:
+            result.breakdown = MatchBreakdown(
+                skill_match=factors[0],
+                location_match=factors[1],
+                salary_match=factors[2],
+                experience_match=factors[3],
+                role_match=factors[4]
+            )
+        if 'skills' in fields or 'reason' in fields:
+            matching = vocabulary.intersection(required_vector, candidate_vector)
+            missing = vocabulary.difference(required_vector, candidate_vector)
+            if 'skills' in fields:
+                result.matching_skills = vocabulary.decode(matching)
+                result.missing_skills = vocabulary.decode(missing)
+            if 'reason' in fields:
+                # Location scores are whole numbers, so the rounded factor is the raw score
+                result.recommendation_reason = self.build_recommendation_reason(
+                    vocabulary.size(matching), vocabulary.size(missing), len(job.required_skills), factors[1]
+                )
+        
+        return result
     
     def match_candidate_to_jobs(
         self, 
         candidate: CandidateMatchProfile, 
-        jobs: List[JobPostingForMatch]
+        jobs: List[JobPostingForMatch],
+        vectorized: bool = False,
+        top_k: Optional[int] = None,
+        fields: frozenset = MATCH_FIELDS
     ) -> MatchingResponse:
         """
         Match candidate to multiple jobs and return ranked results
+        Set vectorized=True to score the whole list with columnar array operations
+        Set top_k to return only the k best matches (total_matches still counts every job)
+        Set fields to build only part of each result (see MATCH_FIELDS)
         Returns: MatchingResponse with sorted matches
         """
+        # The per-job path implements the standard factors only; other profiles score column-wise
+        if vectorized or not self.standard_factors:
+            return self.match_candidate_to_jobs_vectorized(
+                candidate, JobColumns.from_postings(self, jobs), top_k=top_k, fields=fields
+            )
+        
+        if top_k is not None:
+            return self.match_candidate_to_top_jobs(candidate, jobs, top_k, fields)
+        
         matches = []
         
-        for job in jobs:
-            match_result = self.match_candidate_to_job(candidate, job)
-            matches.append(match_result)
+        with metrics.timer(metrics.stage_latency, "per_job", "scoring"):
+            for job in jobs:
+                match_result = self.match_candidate_to_job(candidate, job, fields)
+                matches.append(match_result)
+        metrics.record_jobs_scored("per_job", len(jobs))
         
         # Sort by match score (descending)
-        matches.sort(key=lambda x: x.match_score, reverse=True)
+        with metrics.timer(metrics.stage_latency, "per_job", "ranking"):
+            matches.sort(key=lambda x: x.match_score, reverse=True)
         
         return MatchingResponse(
             matches=matches,
             total_matches=len(matches)
         )
+    
+    def match_candidate_to_top_jobs(
+        self,
+        candidate: CandidateMatchProfile,
+        jobs: List[JobPostingForMatch],
+        top_k: int,
+        fields: frozenset = MATCH_FIELDS
+    ) -> MatchingResponse:
+        """
+        Top-K variant of match_candidate_to_jobs
+        Each job gets a cheap upper bound from its exact skill overlap; jobs whose
+        bound cannot beat the current k-th best are never fully scored, and
+        result objects are only built for the k returned jobs.
+        """
+        vocabulary = self.vocabulary.scratch()
+        with metrics.timer(metrics.stage_latency, "per_job", "skill"):
+            candidate_vector = vocabulary.encode(candidate.skills)
+            required_vectors = [vocabulary.encode(job.required_skills) for job in jobs]
+            skill_scores = [
+                (vocabulary.overlap(required, candidate_vector) / vocabulary.size(required)) * 100
+                if vocabulary.size(required) else 100.0
+                for required in required_vectors
+            ]
+        metrics.record_jobs_scored("per_job", len(jobs))
+        
+        # Full scoring of the jobs that survive the bound is counted as ranking;
+        # their factor scores are kept so results are built without rescoring
+        factors: Dict[int, tuple] = {}
+        
+        def score_row(i: int) -> float:
+            factors[i] = self.score_factors(candidate, jobs[i], skill_scores[i])
+            return round(self.weighted_score(*factors[i]), 2)
+        
+        with metrics.timer(metrics.stage_latency, "per_job", "ranking"):
+            ranked = select_top_k([self.score_upper_bound(score) for score in skill_scores], top_k, score_row)
+        
+        with metrics.timer(metrics.stage_latency, "per_job", "serialization"):
+            matches = [
+                self.build_job_result(jobs[i], factors[i], fields, vocabulary, candidate_vector, required_vectors[i])
+                for _, i in ranked
+            ]
+        return MatchingResponse(
+            matches=matches,
+            total_matches=len(jobs)
+        )
+    
+    def match_candidate_to_jobs_vectorized(
+        self,
+        candidate: CandidateMatchProfile,
+        columns: JobColumns,
+        mask: Optional[np.ndarray] = None,
+        top_k: Optional[int] = None,
+        fields: frozenset = MATCH_FIELDS
+    ) -> MatchingResponse:
+        """
+        Columnar variant of match_candidate_to_jobs
+        All five factors and the weighted sum are computed as array operations;
+        result objects are only built for the returned rows.
+        Produces the same scores and ordering as the per-job path.
+        mask: optional boolean array restricting which rows are ranked
+        top_k: return only the k best rows (partial selection instead of a full sort)
+        fields: result parts to build for the returned rows (see MATCH_FIELDS)
+        """
+        total, matches = self.stream_candidate_to_jobs(candidate, columns, mask, top_k, fields)
+        with metrics.timer(metrics.stage_latency, "columnar", "serialization"):
+            matches = list(matches)
+        return MatchingResponse(
+            matches=matches,
+            total_matches=total
+        )
+    
+    def score_columns(
+        self,
+        candidate: CandidateMatchProfile,
+        columns: JobColumns,
+        prepared: Optional[PreparedJobs] = None
+    ) -> tuple:
+        """
+        Rounded per-factor and overall score arrays for every row, from the scoring pipeline
+        prepared: optional PreparedJobs over columns reused across a batch of candidates;
+        the location, role, salary and experience arrays depend only on one candidate
+        attribute each, so they are computed once per distinct value
+        Returns: (skill_mask, matched_counts, skill, location, salary, experience, role, overall)
+        """
+        if prepared is None:
+            prepared = PreparedJobs(self, columns=columns)
+        scores = self.pipeline.score(candidate, prepared, self.profile)
+        slots = self.profile.slots
+        skill_state = scores.states[slots['skill']]
+        factors = {slot: scores.factors[name] for slot, name in slots.items()}
+        return (
+            skill_state.mask, skill_state.matched,
+            factors['skill'], factors['location'], factors['salary'], factors['experience'], factors['role'],
+            scores.total
+        )
+    
+    @staticmethod
+    def rank_rows(overall: np.ndarray, rows: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+        """
+        Rows ordered by score (descending), optionally cut to the top_k
+        Stable sort keeps the per-job path's tie order
+        """
+        if top_k is not None and top_k < len(rows):
+            # Keep every row tied with the k-th best so the stable sort resolves ties by index
+            kth_best = -np.partition(-overall[rows], top_k - 1)[top_k - 1] if top_k > 0 else np.inf
+            rows = rows[overall[rows] >= kth_best]
+        order = rows[np.argsort(-overall[rows], kind='stable')]
+        if top_k is not None:
+            order = order[:top_k]
+        return order
+    
+    def stream_candidate_to_jobs(
+        self,
+        candidate: CandidateMatchProfile,
+        columns: JobColumns,
+        mask: Optional[np.ndarray] = None,
+        top_k: Optional[int] = None,
+        fields: frozenset = MATCH_FIELDS
+    ) -> Tuple[int, Iterator[JobMatchResult]]:
+        """
+        Score all rows up front, then build ranked results lazily
+        Explanations (breakdown, skill lists, reason) are only built for the
+        rows actually yielded, and only for the requested fields
+        Returns: (total_matches, iterator of JobMatchResult in rank order)
+        """
+        scored = self.score_columns(candidate, columns)
+        rows = np.arange(len(columns)) if mask is None else np.flatnonzero(mask)
+        with metrics.timer(metrics.stage_latency, "columnar", "ranking"):
+            order = self.rank_rows(scored[-1], rows, top_k)
+        return len(rows), self.ranked_results(columns, scored, order, fields)
+    
+    def ranked_results(
+        self,
+        columns: JobColumns,
+        scored: tuple,
+        order: np.ndarray,
+        fields: frozenset = MATCH_FIELDS
+    ) -> Iterator[JobMatchResult]:
+        """
+        Lazily build JobMatchResult objects for already ranked rows
+        scored: the score_columns tuple the rows were ranked by
+        """
+        skill_mask, matched_counts, skill, location, salary, experience, role, overall = scored
+        # A partial-credit factor in the skill slot can score above the exact matches
+        partial_skill = self.profile.slots['skill'] != 'skill'
+        for row in order:
+            job = columns.jobs[row]
+            result = JobMatchResult(
+                job_id=job.job_id,
+                job_title=job.title,
+                company=job.company,
+                match_score=float(overall[row])
+            )
+            if 'breakdown' in fields:
+                result.breakdown = MatchBreakdown(
+                    skill_match=float(skill[row]),
+                    location_match=float(location[row]),
+                    salary_match=float(salary[row]),
+                    experience_match=float(experience[row]),
+                    role_match=float(role[row])
+                )
+            if 'skills' in fields:
+                result.matching_skills, result.missing_skills = columns.job_skills(row, skill_mask)
+            if 'reason' in fields:
+                matching_count = int(matched_counts[row])
+                result.recommendation_reason = self.build_recommendation_reason(
+                    matching_count, int(columns.skill_counts[row]) - matching_count,
+                    int(columns.raw_skill_counts[row]), float(location[row]),
+                    float(skill[row]) if partial_skill else None
+                )
+            yield result
+    
+    def match_matrix(
+        self,
+        candidates: List[CandidateMatchProfile],
+        jobs: List[JobPostingForMatch],
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None
+    ) -> MatchMatrixResponse:
+        """
+        Score a batch of candidates against a batch of jobs in one pass
+        Jobs are compiled into columns once and reused for every candidate;
+        location and role scores are shared by candidates with the same preferences.
+        top_k: keep each candidate's k best jobs, in rank order (otherwise job order)
+        min_score: drop pairs scoring below this value
+        Returns: MatchMatrixResponse of (candidate_idx, job_idx, score) triples
+        """
+        columns = JobColumns.from_postings(self, jobs)
+        prepared = PreparedJobs(self, columns=columns)
+        all_rows = np.arange(len(columns))
+        
+        matches = []
+        for candidate_idx, candidate in enumerate(candidates):
+            overall = self.score_columns(candidate, columns, prepared)[-1]
+            rows = all_rows if min_score is None else np.flatnonzero(overall >= min_score)
+            if top_k is not None:
+                rows = self.rank_rows(overall, rows, top_k)
+            matches.extend(zip([candidate_idx] * len(rows), rows.tolist(), overall[rows].tolist()))
+        
+        return MatchMatrixResponse(
+            matches=matches,
+            total_candidates=len(candidates),
+            total_jobs=len(jobs)
+        )
+
 
 
 # Singleton instance
@@ -0,0 +1,269 @@
+"""
+Runtime Metrics
+Counters and histograms rendered in the Prometheus text format on /metrics;
+recording is a bucket lookup and a few increments, formatting only happens on scrape
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Set METRICS_ENABLED=0 to turn all recording into no-ops
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STAGE_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+JOB_COUNT_BUCKETS = (0, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """Monotonic counter per label combination"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0):
+        if not METRICS_ENABLED:
+            return
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            yield f"{self.name}{_labels(self.labels, label_values)} {_number(value)}"
+
+
+class Histogram:
+    """Bucketed observations (count, sum, cumulative buckets) per label combination"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        # label values -> [per-bucket counts (last one is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        if not METRICS_ENABLED:
+            return
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return series[2] if series else 0
+
+    def total(self, *label_values: str) -> float:
+        series = self._series.get(label_values)
+        return series[1] if series else 0.0
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            series = sorted((labels, [list(s[0]), s[1], s[2]]) for labels, s in self._series.items())
+        for label_values, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = 'le="' + ("+Inf" if bound == float("inf") else _number(bound)) + '"'
+                yield f"{self.name}_bucket{_labels(self.labels, label_values, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labels, label_values)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labels, label_values)} {count}"
+
+
+class RequestStats:
+    """Work attributed to the HTTP request being served"""
+    __slots__ = ('jobs_scored', 'db_queries', 'db_seconds')
+
+    def __init__(self):
+        self.jobs_scored = 0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class MetricsRegistry:
+    """
+    Named metrics plus per-request attribution
+
+    - timer(): context manager observing elapsed seconds into a histogram
+    - record_jobs_scored() / record_query(): global totals, also added to the
+      current request's RequestStats when one is active
+    - render(): every metric in the Prometheus text exposition format
+    """
+
+    def __init__(self):
+        self._metrics: List = []
+
+        self.http_requests = self.register(Counter(
+            "http_requests_total", "HTTP requests served", ("method", "route", "status")))
+        self.http_latency = self.register(Histogram(
+            "http_request_duration_seconds", "HTTP request latency", ("method", "route")))
+        self.http_jobs_scored = self.register(Histogram(
+            "http_request_jobs_scored", "Jobs scored while serving one request", ("route",), JOB_COUNT_BUCKETS))
+        self.http_db_queries = self.register(Histogram(
+            "http_request_db_queries", "Database queries issued while serving one request", ("route",),
+            QUERY_COUNT_BUCKETS))
+        self.stage_latency = self.register(Histogram(
+            "matching_stage_duration_seconds", "Time spent per matching stage (factor, ranking, serialization)",
+            ("path", "stage"), STAGE_BUCKETS))
+        self.jobs_scored = self.register(Counter(
+            "matching_jobs_scored_total", "Job rows scored by the matching engine", ("path",)))
+        self.db_queries = self.register(Counter(
+            "db_queries_total", "Database statements executed", ("operation",)))
+        self.db_latency = self.register(Histogram(
+            "db_query_duration_seconds", "Database statement latency", ("operation",), STAGE_BUCKETS))
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    @contextmanager
+    def timer(self, histogram: Histogram, *label_values: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - started, *label_values)
+
+    def record_jobs_scored(self, path: str, count: int):
+        self.jobs_scored.inc(path, amount=count)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.jobs_scored += count
+
+    def record_query(self, operation: str, seconds: float):
+        self.db_queries.inc(operation)
+        self.db_latency.observe(seconds, operation)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.db_queries += 1
+            stats.db_seconds += seconds
+
+    @contextmanager
+    def request_scope(self) -> Iterator[RequestStats]:
+        """Attribute engine and database work done inside the block to one request"""
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            _request_stats.reset(token)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+def instrument_engine(db_engine, registry: Optional[MetricsRegistry] = None):
+    """Count and time every statement executed through a SQLAlchemy engine"""
+    from sqlalchemy import event
+
+    registry = registry or metrics
+
+    @event.listens_for(db_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(db_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+        registry.record_query(operation, time.perf_counter() - started)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status, jobs scored and DB queries per route
+    Routes are labelled by their path template, so ids do not create new series;
+    streamed responses are timed until their last chunk
+    """
+
+    def __init__(self, app, registry: Optional[MetricsRegistry] = None):
+        self.app = app
+        self.registry = registry or metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        started = time.perf_counter()
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        with registry.request_scope() as stats:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = scope.get("route")
+                route = getattr(route, "path", "unmatched")
+                method = scope.get("method", "")
+                registry.http_latency.observe(time.perf_counter() - started, method, route)
+                registry.http_requests.inc(method, route, str(status[0]))
+                registry.http_jobs_scored.observe(stats.jobs_scored, route)
+                registry.http_db_queries.observe(stats.db_queries, route)
+
+
+# Singleton instance
+metrics = MetricsRegistry()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Integer, Text, Enum, ForeignKey, create_engine
+from sqlalchemy import Column, String, DateTime, Integer, Float, Text, Enum, ForeignKey, Index, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
@@ -8,6 +8,10 @@ Base = declarative_base()
 
 # Database Setup
 DATABASE_URL = "sqlite:///./applications.db"
+# check_same_thread=False: the matching endpoints (/api/match/catalog, the
+# sessions endpoints, /api/match/jobs/{id}/candidates) use their request's
+# Session on match_executor threads, not the thread that opened it; a Session
+# is still only used by one thread at a time
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -41,6 +45,23 @@ class Candidate(Base):
     
     # Relationships
     applications = relationship("Application", back_populates="candidate")
+    match_profile = relationship("CandidateProfile", back_populates="candidate", uselist=False, cascade="all, delete-orphan")
+
+
+class CandidateProfile(Base):
+    """Matching profile of a candidate, indexed for job-to-candidates ranking"""
+    __tablename__ = "candidate_match_profiles"
+    
+    candidate_id = Column(String, ForeignKey("candidates.id"), primary_key=True)
+    skills = Column(Text, default="[]")  # JSON list as posted
+    experience_years = Column(Integer, default=0)
+    preferred_locations = Column(Text, default="[]")  # JSON list
+    preferred_roles = Column(Text, default="[]")  # JSON list
+    expected_salary = Column(Float, default=0.0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relationships
+    candidate = relationship("Candidate", back_populates="match_profile")
 
 
 class Job(Base):
@@ -57,6 +78,30 @@ class Job(Base):
     
     # Relationships
     applications = relationship("Application", back_populates="job")
+    match_profile = relationship("JobMatchProfile", back_populates="job", uselist=False, cascade="all, delete-orphan")
+
+
+class JobMatchProfile(Base):
+    """Matching inputs for a job, stored raw and pre-compiled for the job catalog"""
+    __tablename__ = "job_match_profiles"
+    
+    job_id = Column(String, ForeignKey("jobs.id"), primary_key=True)
+    required_skills = Column(Text, default="[]")  # JSON list as posted
+    experience_required = Column(String, default="")
+    location = Column(String, default="")
+    salary_min = Column(Float, nullable=True)
+    salary_max = Column(Float, nullable=True)
+    
+    # Compiled fields
+    normalized_skills = Column(Text, default="[]")  # JSON list of normalized skill names
+    experience_min = Column(Integer, default=0)
+    experience_max = Column(Integer, default=99)
+    location_normalized = Column(String, index=True)
+    title_normalized = Column(String)
+    compiled_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relationships
+    job = relationship("Job", back_populates="match_profile")
 
 
 class Application(Base):
@@ -70,6 +115,12 @@ class Application(Base):
     applied_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Keyset pagination order of the per-job and per-candidate application lists
+    __table_args__ = (
+        Index("ix_applications_job_page", "job_id", "applied_at", "id"),
+        Index("ix_applications_candidate_page", "candidate_id", "applied_at", "id"),
+    )
+    
     # Relationships
     candidate = relationship("Candidate", back_populates="applications")
     job = relationship("Job", back_populates="applications")
@@ -92,5 +143,18 @@ class StatusHistory(Base):
     application = relationship("Application", back_populates="status_history")
 
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
+class ApplicationStatsCounter(Base):
+    """Dashboard counter kept up to date with every application write (see application_stats.py)"""
+    __tablename__ = "application_stats"
+    
+    name = Column(String, primary_key=True)
+    value = Column(Integer, default=0, nullable=False)
+
+
+class JobApplicationCount(Base):
+    """Running number of applications per job, for the dashboard's top jobs"""
+    __tablename__ = "job_application_counts"
+    
+    job_id = Column(String, ForeignKey("jobs.id"), primary_key=True)
+    applications = Column(Integer, default=0, nullable=False, index=True)
+
@@ -0,0 +1,116 @@
+"""
+Multi-Process Sharded Matching
+Splits a large job list across a process pool; each worker keeps a warm
+JobMatchingEngine (on the caller's taxonomy version) and returns only its shard's top-K
+"""
+
+import heapq
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from matching_engine import (
+    JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch, MatchingResponse, MATCH_FIELDS
+)
+from taxonomy_registry import taxonomy_registry
+
+# Defaults, overridable through the environment
+DEFAULT_WORKERS = int(os.environ.get("MATCH_WORKERS", os.cpu_count() or 1))
+DEFAULT_SHARD_SIZE = int(os.environ.get("MATCH_SHARD_SIZE", 5000))
+
+# Per-process engine, built once by the pool initializer
+_worker_engine: Optional[JobMatchingEngine] = None
+
+
+def _init_worker():
+    global _worker_engine
+    _worker_engine = JobMatchingEngine()
+
+
+def _match_shard(
+    candidate: CandidateMatchProfile,
+    jobs: List[JobPostingForMatch],
+    top_k: Optional[int],
+    vectorized: bool,
+    fields: frozenset = MATCH_FIELDS,
+    taxonomy: Optional[Tuple[str, dict]] = None
+) -> list:
+    """
+    Rank one shard and return its (local top-K) results in ranked order
+    taxonomy: (checksum, data) of the caller's taxonomy, installed if this worker's differs
+    """
+    engine = _worker_engine or JobMatchingEngine()
+    if taxonomy is not None and engine.taxonomy.checksum != taxonomy[0]:
+        engine.registry.load_data(taxonomy[1])
+    return engine.match_candidate_to_jobs(
+        candidate, jobs, vectorized=vectorized, top_k=top_k, fields=fields
+    ).matches
+
+
+class ParallelMatcher:
+    """
+    Process-pool matcher
+
+    - workers: number of worker processes
+    - shard_size: jobs per task; lists no longer than one shard run in-process
+    - Results are identical to the serial path: shards are contiguous slices,
+      each returned in (score desc, position) order, and merged stably
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, shard_size: int = DEFAULT_SHARD_SIZE, vectorized: bool = True):
+        self.workers = max(1, workers)
+        self.shard_size = max(1, shard_size)
+        self.vectorized = vectorized
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker
+                )
+            return self._executor
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def match_candidate_to_jobs(
+        self,
+        candidate: CandidateMatchProfile,
+        jobs: List[JobPostingForMatch],
+        top_k: Optional[int] = None,
+        fields: frozenset = MATCH_FIELDS
+    ) -> MatchingResponse:
+        """Match a candidate against jobs split across the process pool"""
+        if len(jobs) <= self.shard_size:
+            matches = _match_shard(candidate, jobs, top_k, self.vectorized, fields)
+            return MatchingResponse(matches=matches, total_matches=len(jobs))
+
+        pool = self._pool()
+        current = taxonomy_registry.current
+        taxonomy = (current.checksum, current.source)
+        futures = [
+            pool.submit(
+                _match_shard, candidate, jobs[start:start + self.shard_size],
+                top_k, self.vectorized, fields, taxonomy
+            )
+            for start in range(0, len(jobs), self.shard_size)
+        ]
+        shard_results = [future.result() for future in futures]
+
+        # heapq.merge breaks ties by shard order, which keeps the serial tie order
+        merged = heapq.merge(*shard_results, key=lambda match: -match.match_score)
+        matches = list(merged) if top_k is None else [m for _, m in zip(range(top_k), merged)]
+        return MatchingResponse(matches=matches, total_matches=len(jobs))
+
+
+# Singleton instance
+parallel_matcher = ParallelMatcher()
@@ -0,0 +1,43 @@
+"""
+Top-K Ranking
+Bounded-heap selection with score upper bounds and early termination
+"""
+
+import heapq
+from typing import Callable, List, Sequence, Tuple
+
+
+def select_top_k(
+    bounds: Sequence[float],
+    k: int,
+    score: Callable[[int], float]
+) -> List[Tuple[float, int]]:
+    """
+    Select the k best items without scoring all of them
+
+    bounds: an upper bound on each item's exact score (must never be below it)
+    score:  computes the exact score of item i
+
+    Items are visited in descending bound order, popped lazily from a heap of
+    bounds (O(n) to build, so the bounds are never fully sorted); once the next
+    bound cannot beat the current k-th best score, every remaining item is skipped.
+    Returns [(score, index)] ordered like a stable descending sort of all
+    scores, i.e. ties keep their original index order.
+    """
+    if k <= 0:
+        return []
+
+    pending = [(-bound, i) for i, bound in enumerate(bounds)]
+    heapq.heapify(pending)
+    heap: List[Tuple[float, int]] = []  # (score, -index); heap[0] is the current k-th best
+    while pending:
+        neg_bound, i = heapq.heappop(pending)
+        if len(heap) == k and -neg_bound < heap[0][0]:
+            break
+        item = (score(i), -i)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    return sorted(((s, -neg_index) for s, neg_index in heap), key=lambda x: (-x[0], x[1]))
@@ -41,12 +41,34 @@ class CandidateResponse(BaseModel):
 
 
 # --- Job Schemas ---
+class JobMatchProfileCreate(BaseModel):
+    required_skills: List[str]
+    experience_required: str = ""
+    location: str = ""
+    salary_range: List[float] = []  # [min, max]
+
+
+class JobMatchProfileResponse(BaseModel):
+    job_id: str
+    normalized_skills: List[str]
+    experience_min: int
+    experience_max: int
+    location_normalized: str
+    title_normalized: str
+    compiled_at: datetime
+
+
 class JobCreate(BaseModel):
     id: str
     title: str
     company: str
     description: Optional[str] = None
     status: JobStatusEnum = JobStatusEnum.OPEN
+    match_profile: Optional[JobMatchProfileCreate] = None
+
+
+class JobStatusUpdate(BaseModel):
+    status: JobStatusEnum
 
 
 class JobResponse(BaseModel):
@@ -88,6 +110,39 @@ class ApplicationStatusUpdate(BaseModel):
     changed_by: Optional[str] = None
 
 
+class BulkStatusUpdate(BaseModel):
+    application_ids: List[str]
+    status: StatusEnum
+    notes: Optional[str] = None
+    changed_by: Optional[str] = None
+
+
+class BulkTransitionRejection(BaseModel):
+    application_id: str
+    current_status: Optional[StatusEnum] = None  # None when the application does not exist
+    error: str
+
+
+class BulkStatusUpdateResult(BaseModel):
+    status: StatusEnum
+    updated: List[str]
+    rejected: List[BulkTransitionRejection]
+
+
+class ApplicationImportError(BaseModel):
+    row: int  # 1-based record number in the uploaded file (CSV header excluded)
+    job_id: Optional[str] = None
+    candidate_id: Optional[str] = None
+    error: str
+
+
+class ApplicationImportResult(BaseModel):
+    total_rows: int
+    imported: int
+    failed: int
+    errors: List[ApplicationImportError]
+
+
 class ApplicationResponse(BaseModel):
     id: str
     job_id: str
@@ -0,0 +1,504 @@
+"""
+Unified Scoring Pipeline
+Registered factor scorers run over pre-normalized jobs in one fused pass;
+/matches and /api/match are named weight profiles on the same pipeline
+"""
+
+from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from experience_parser import experience_intervals
+from job_columns import JobColumns, round_scores
+from metrics import metrics
+from skill_similarity import SkillSimilarity
+from substring_matcher import SubstringMatcher
+
+# Every factor has an exact (row-by-row reference) and a fast (columnar) implementation
+VARIANTS = ("exact", "fast")
+
+# Factor name -> scorer class; add new factors with @register_factor
+FACTORS: Dict[str, Type["Factor"]] = {}
+
+
+def register_factor(cls: Type["Factor"]) -> Type["Factor"]:
+    FACTORS[cls.name] = cls
+    return cls
+
+
+class PreparedJobs:
+    """
+    A job batch normalized once and shared by every factor and candidate
+
+    - columns: compiled JobColumns (built from the postings on first use)
+    - postings: raw postings, when the batch came from a request
+    - cache: per-batch memo for factor tables that depend on one candidate attribute
+    """
+
+    def __init__(self, engine, postings: Optional[List] = None, columns: Optional[JobColumns] = None):
+        if postings is None and columns is None:
+            raise ValueError("PreparedJobs needs postings or columns")
+        self.engine = engine
+        self.postings = postings
+        self._columns = columns
+        self.cache: Dict[tuple, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.postings) if self.postings is not None else len(self._columns)
+
+    @property
+    def columns(self) -> JobColumns:
+        if self._columns is None:
+            self._columns = JobColumns.from_postings(self.engine, self.postings)
+        return self._columns
+
+    # Raw lowercase fields used by the /matches factors
+
+    @cached_property
+    def skill_lists(self) -> List[List[str]]:
+        return [list(dict.fromkeys(s.lower() for s in job.required_skills)) for job in self.postings]
+
+    @cached_property
+    def locations(self) -> List[str]:
+        return [job.location.lower() for job in self.postings]
+
+    @cached_property
+    def salary_ceilings(self) -> np.ndarray:
+        return np.array([
+            job.salary_range[1] if len(job.salary_range) > 1 else job.salary_range[0]
+            for job in self.postings
+        ], dtype=np.float64)
+
+    @cached_property
+    def experience_windows(self) -> Tuple[np.ndarray, np.ndarray]:
+        return experience_intervals((job.experience_required for job in self.postings), stated=True)
+
+
+class Factor(ABC):
+    """
+    One scoring factor
+
+    - prepare(): per-candidate state, computed once before scoring any job
+    - exact(): score of a single row (the reference rule)
+    - fast(): scores of every row at once; defaults to exact() row by row
+    - slot: the result field the factor reports as (defaults to its name), so
+      an alternative rule can stand in for a standard factor
+    """
+
+    name = ""
+    slot: Optional[str] = None
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def prepare(self, candidate, jobs: PreparedJobs) -> Any:
+        return None
+
+    @abstractmethod
+    def exact(self, state, candidate, jobs: PreparedJobs, row: int) -> float:
+        """Score of one row, 0-100"""
+
+    def fast(self, state, candidate, jobs: PreparedJobs) -> np.ndarray:
+        return np.array([self.exact(state, candidate, jobs, row) for row in range(len(jobs))], dtype=np.float64)
+
+
+def _memo(jobs: PreparedJobs, key: tuple, compute) -> np.ndarray:
+    value = jobs.cache.get(key)
+    if value is None:
+        value = jobs.cache[key] = compute()
+    return value
+
+
+# ============================================================================
+# /api/match FACTORS (JobMatchingEngine rules, on compiled jobs)
+# ============================================================================
+
+class SkillState:
+    """Candidate skill mask over the vocabulary plus matched counts per row"""
+    __slots__ = ('mask', 'matched')
+
+    def __init__(self, mask: np.ndarray, rows: int):
+        self.mask = mask
+        self.matched = np.zeros(rows, dtype=np.int64)
+
+
+@register_factor
+class SkillFactor(Factor):
+    """Share of required (normalized) skills the candidate has"""
+    name = "skill"
+
+    def prepare(self, candidate, jobs):
+        return SkillState(jobs.columns.candidate_skill_mask(self.engine, candidate.skills), len(jobs))
+
+    def exact(self, state, candidate, jobs, row):
+        job = jobs.columns.jobs[row]
+        matched = sum(1 for skill_id in job.skill_ids if state.mask[skill_id])
+        state.matched[row] = matched
+        return (matched / len(job.skill_ids)) * 100 if job.raw_skill_count else 100.0
+
+    def fast(self, state, candidate, jobs):
+        scores, state.matched = jobs.columns.skill_scores(state.mask)
+        return scores
+
+
+class PartialSkillState(SkillState):
+    """SkillState plus the candidate's credit per vocabulary id"""
+    __slots__ = ('credit',)
+
+    def __init__(self, mask: np.ndarray, rows: int, credit: np.ndarray):
+        super().__init__(mask, rows)
+        self.credit = credit
+
+
+@register_factor
+class PartialSkillFactor(SkillFactor):
+    """
+    Mean credit over required skills: 1 for a skill held, fractional credit for
+    related ones from the taxonomy's precomputed similarity matrix; matched
+    counts (and so skill lists and reasons) stay exact
+    """
+    name = "skill_partial"
+    slot = "skill"
+
+    def prepare(self, candidate, jobs):
+        columns = jobs.columns
+        similarity = self.engine.taxonomy.skill_similarity
+        if similarity.vocabulary is not columns.vocabulary.shared:
+            # Columns interned with a pinned vocabulary get their own matrix
+            similarity = _memo(
+                jobs, (self.name, "similarity"),
+                lambda: SkillSimilarity(self.engine.taxonomy, columns.vocabulary.shared)
+            )
+        mask = columns.candidate_skill_mask(self.engine, candidate.skills)
+        return PartialSkillState(mask, len(jobs), similarity.credits(mask))
+
+    def exact(self, state, candidate, jobs, row):
+        job = jobs.columns.jobs[row]
+        state.matched[row] = sum(1 for skill_id in job.skill_ids if state.mask[skill_id])
+        credit = sum(state.credit[skill_id] for skill_id in job.skill_ids)
+        return (credit / len(job.skill_ids)) * 100 if job.raw_skill_count else 100.0
+
+    def fast(self, state, candidate, jobs):
+        columns = jobs.columns
+        state.matched = columns.skill_scores(state.mask)[1]
+        return columns.skill_credit_scores(state.credit)
+
+
+@register_factor
+class LocationFactor(Factor):
+    """Preferred location match (remote always matches)"""
+    name = "location"
+
+    def exact(self, state, candidate, jobs, row):
+        return self.engine.calculate_location_match(candidate.preferred_locations, jobs.columns.jobs[row].location_key)
+
+    def fast(self, state, candidate, jobs):
+        key = (self.name, frozenset(loc.lower().strip() for loc in candidate.preferred_locations))
+        return _memo(jobs, key, lambda: jobs.columns.location_scores(self.engine, candidate.preferred_locations))
+
+
+@register_factor
+class SalaryFactor(Factor):
+    """Expected salary against the job's range"""
+    name = "salary"
+
+    def exact(self, state, candidate, jobs, row):
+        job = jobs.columns.jobs[row]
+        if not job.has_salary:
+            return 50.0
+        return self.engine.calculate_salary_match(candidate.expected_salary, [job.salary_min, job.salary_max])
+
+    def fast(self, state, candidate, jobs):
+        key = (self.name, candidate.expected_salary)
+        return _memo(jobs, key, lambda: jobs.columns.salary_scores(candidate.expected_salary))
+
+
+@register_factor
+class ExperienceFactor(Factor):
+    """Years of experience against the job's parsed range"""
+    name = "experience"
+
+    def exact(self, state, candidate, jobs, row):
+        job = jobs.columns.jobs[row]
+        return self.engine.experience_match_for_range(candidate.experience_years, job.exp_min, job.exp_max)
+
+    def fast(self, state, candidate, jobs):
+        key = (self.name, candidate.experience_years)
+        return _memo(jobs, key, lambda: jobs.columns.experience_scores(candidate.experience_years))
+
+
+@register_factor
+class RoleFactor(Factor):
+    """Preferred role against the job title"""
+    name = "role"
+
+    def exact(self, state, candidate, jobs, row):
+        return self.engine.calculate_role_match(candidate.preferred_roles, jobs.columns.jobs[row].title)
+
+    def fast(self, state, candidate, jobs):
+        key = (self.name, frozenset(role.lower().strip() for role in candidate.preferred_roles))
+        return _memo(jobs, key, lambda: jobs.columns.role_scores(self.engine, candidate.preferred_roles))
+
+
+# ============================================================================
+# /matches FACTORS (substring rules, on raw postings)
+# ============================================================================
+
+@register_factor
+class SkillContainmentFactor(Factor):
+    """
+    Share of required skills contained in, or containing, a candidate skill
+    fast is approximate: it only counts exact (lowercase) skill names
+    """
+    name = "skill_containment"
+
+    def prepare(self, candidate, jobs):
+        return SubstringMatcher(dict.fromkeys(s.lower() for s in candidate.skills))
+
+    def exact(self, state, candidate, jobs, row):
+        skills = jobs.skill_lists[row]
+        if not skills:
+            return 100
+        return (sum(1 for skill in skills if state.matches(skill)) / len(skills)) * 100
+
+    def fast(self, state, candidate, jobs):
+        names = set(state.names)
+        return np.array([
+            (sum(1 for skill in skills if skill in names) / len(skills)) * 100 if skills else 100
+            for skills in jobs.skill_lists
+        ], dtype=np.float64)
+
+    @staticmethod
+    def missing_skills(state, jobs, row: int, variant: str) -> List[str]:
+        skills = jobs.skill_lists[row]
+        if variant == "fast":
+            names = set(state.names)
+            return [skill for skill in skills if skill not in names]
+        return state.split(skills)[1]
+
+
+@register_factor
+class LocationContainsFactor(Factor):
+    """100 when a preferred location occurs in the job location, else 20"""
+    name = "location_contains"
+
+    def prepare(self, candidate, jobs):
+        return [location.lower() for location in candidate.preferred_locations]
+
+    def exact(self, state, candidate, jobs, row):
+        location = jobs.locations[row]
+        return 100 if any(preferred in location for preferred in state) else 20
+
+    def fast(self, state, candidate, jobs):
+        # One check per distinct job location
+        table: Dict[str, float] = {}
+        for location in jobs.locations:
+            if location not in table:
+                table[location] = 100 if any(preferred in location for preferred in state) else 20
+        return np.array([table[location] for location in jobs.locations], dtype=np.float64)
+
+
+@register_factor
+class SalaryCeilingFactor(Factor):
+    """100 up to the job's maximum salary, 50 within 200k above it, else 0"""
+    name = "salary_ceiling"
+
+    def exact(self, state, candidate, jobs, row):
+        job_max = jobs.salary_ceilings[row]
+        if candidate.expected_salary <= job_max: return 100
+        elif candidate.expected_salary - job_max < 200000: return 50
+        return 0
+
+    def fast(self, state, candidate, jobs):
+        job_max = jobs.salary_ceilings
+        expected = candidate.expected_salary
+        return np.where(expected <= job_max, 100.0, np.where(expected - job_max < 200000, 50.0, 0.0))
+
+
+@register_factor
+class ExperienceWindowFactor(Factor):
+    """100 inside the experience range (one extra year allowed), else 40"""
+    name = "experience_window"
+
+    def exact(self, state, candidate, jobs, row):
+        exp_min, exp_max = jobs.experience_windows
+        return 100 if exp_min[row] <= candidate.experience_years <= exp_max[row] + 1 else 40
+
+    def fast(self, state, candidate, jobs):
+        exp_min, exp_max = jobs.experience_windows
+        years = candidate.experience_years
+        return np.where((exp_min <= years) & (years <= exp_max + 1), 100.0, 40.0)
+
+
+# ============================================================================
+# PROFILES AND PIPELINE
+# ============================================================================
+
+class ScoringProfile:
+    """
+    A named weighting of registered factors
+
+    - weights: factor name -> weight; factors are summed in this order
+    - variants: factor name -> "exact" or "fast" (default "exact")
+    - round_factors: digits each factor is rounded to before weighting (None keeps raw scores)
+    - round_total: digits of the final score
+    - gate: (factor, threshold) - rows scoring below threshold on that factor get 0
+    """
+
+    def __init__(
+        self,
+        name: str,
+        weights: Dict[str, float],
+        variants: Optional[Dict[str, str]] = None,
+        round_factors: Optional[int] = None,
+        round_total: int = 2,
+        gate: Optional[Tuple[str, float]] = None
+    ):
+        if not weights:
+            raise ValueError("A scoring profile needs at least one factor")
+        unknown = [factor for factor in weights if factor not in FACTORS]
+        if unknown:
+            raise ValueError(f"Unknown scoring factors: {', '.join(unknown)}")
+        self.name = name
+        self.weights = dict(weights)
+        self.variants = {factor: "exact" for factor in weights}
+        self.variants.update(self._checked(variants or {}))
+        self.round_factors = round_factors
+        self.round_total = round_total
+        self.gate = gate
+        # result field -> factor filling it
+        self.slots = {FACTORS[factor].slot or factor: factor for factor in weights}
+
+    def _checked(self, variants: Dict[str, str]) -> Dict[str, str]:
+        for factor, variant in variants.items():
+            if factor not in self.weights:
+                raise ValueError(f"Factor '{factor}' is not part of the '{self.name}' profile")
+            if variant not in VARIANTS:
+                raise ValueError(f"Unknown variant '{variant}' for factor '{factor}' (allowed: {', '.join(VARIANTS)})")
+        return variants
+
+    def with_variants(self, variants: Dict[str, str]) -> "ScoringProfile":
+        """Copy of this profile with some factors switched to another implementation"""
+        return ScoringProfile(
+            self.name, self.weights, {**self.variants, **self._checked(variants)},
+            self.round_factors, self.round_total, self.gate
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        return {"name": self.name, "weights": self.weights, "variants": self.variants}
+
+
+PROFILES: Dict[str, ScoringProfile] = {
+    "api_match": ScoringProfile(
+        "api_match",
+        {"skill": 0.40, "location": 0.20, "salary": 0.15, "experience": 0.15, "role": 0.10},
+        variants={"skill": "fast", "location": "fast", "salary": "fast", "experience": "fast", "role": "fast"},
+        round_factors=2,
+        round_total=2
+    ),
+    # /api/match weights with partial credit for related skills (opt-in)
+    "api_match_partial": ScoringProfile(
+        "api_match_partial",
+        {"skill_partial": 0.40, "location": 0.20, "salary": 0.15, "experience": 0.15, "role": 0.10},
+        variants={"skill_partial": "fast", "location": "fast", "salary": "fast", "experience": "fast", "role": "fast"},
+        round_factors=2,
+        round_total=2
+    ),
+    "matches": ScoringProfile(
+        "matches",
+        {"skill_containment": 0.50, "location_contains": 0.25, "salary_ceiling": 0.15, "experience_window": 0.10},
+        variants={"location_contains": "fast", "salary_ceiling": "fast", "experience_window": "fast"},
+        round_total=1,
+        gate=("skill_containment", 10)
+    ),
+}
+
+
+def parse_variants(variants: Optional[str]) -> Dict[str, str]:
+    """Parse "factor=variant,factor=variant" overrides"""
+    parsed = {}
+    for item in (variants or "").split(","):
+        if not item.strip():
+            continue
+        factor, sep, variant = item.partition("=")
+        if not sep:
+            raise ValueError(f"Expected factor=variant, got '{item.strip()}'")
+        parsed[factor.strip()] = variant.strip()
+    return parsed
+
+
+class PipelineScores:
+    """Per-factor score arrays, the weighted total, and each factor's candidate state"""
+    __slots__ = ('factors', 'raw_total', 'total', 'states', 'profile')
+
+    def __init__(self, factors, raw_total, total, states, profile):
+        self.factors: Dict[str, np.ndarray] = factors
+        self.raw_total: np.ndarray = raw_total
+        self.total: np.ndarray = total
+        self.states: Dict[str, Any] = states
+        self.profile: ScoringProfile = profile
+
+
+class ScoringPipeline:
+    """
+    Runs a profile's factors for one candidate over a prepared job batch
+
+    fast factors produce whole columns; all exact factors are evaluated
+    together in a single loop over the rows
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._factors: Dict[str, Factor] = {}
+
+    def factor(self, name: str) -> Factor:
+        factor = self._factors.get(name)
+        if factor is None:
+            factor = self._factors[name] = FACTORS[name](self.engine)
+        return factor
+
+    def score(self, candidate, jobs: PreparedJobs, profile: ScoringProfile) -> PipelineScores:
+        n = len(jobs)
+        states: Dict[str, Any] = {}
+        factors: Dict[str, np.ndarray] = {}
+        row_factors = []
+
+        stage_latency = metrics.stage_latency
+        for name in profile.weights:
+            factor = self.factor(name)
+            with metrics.timer(stage_latency, profile.name, name):
+                state = states[name] = factor.prepare(candidate, jobs)
+                if profile.variants[name] == "fast":
+                    factors[name] = factor.fast(state, candidate, jobs)
+                else:
+                    factors[name] = np.empty(n, dtype=np.float64)
+                    row_factors.append((factors[name], factor.exact, state))
+
+        # One fused pass over the rows for every exact factor (timed as a single stage)
+        if row_factors:
+            with metrics.timer(stage_latency, profile.name, "exact_pass"):
+                for row in range(n):
+                    for column, exact, state in row_factors:
+                        column[row] = exact(state, candidate, jobs, row)
+
+        if profile.round_factors is not None:
+            factors = {name: round_scores(values, profile.round_factors) for name, values in factors.items()}
+
+        metrics.record_jobs_scored(profile.name, n)
+        raw_total, total = self.combine(factors, profile)
+        return PipelineScores(factors, raw_total, total, states, profile)
+
+    @staticmethod
+    def combine(factors: Dict[str, np.ndarray], profile: ScoringProfile) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted (raw, rounded and gated) totals of factor arrays, summed in profile order"""
+        raw_total = None
+        for name, weight in profile.weights.items():
+            raw_total = factors[name] * weight if raw_total is None else raw_total + factors[name] * weight
+        total = round_scores(raw_total, profile.round_total)
+
+        if profile.gate is not None:
+            gate_factor, threshold = profile.gate
+            total = np.where(factors[gate_factor] < threshold, 0.0, total)
+        return raw_total, total
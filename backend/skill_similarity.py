@@ -0,0 +1,107 @@
+"""
+Skill Similarity Matrix
+Partial credit between related taxonomy skills (prerequisite links and shared
+category), precomputed once per taxonomy version over the interned vocabulary
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Credit a candidate skill gives toward a required skill it is related to
+CREDIT_SUCCESSOR = 0.75     # candidate knows a skill built on the required one (FastAPI -> Python)
+CREDIT_PREREQUISITE = 0.5   # candidate knows a prerequisite of the required one (Docker -> Kubernetes)
+CREDIT_SAME_CATEGORY = 0.25
+
+
+class SkillSimilarity:
+    """
+    Sparse similarity between vocabulary ids of one taxonomy version
+
+    - links: CSR rows per candidate skill id -> (required skill ids, credit)
+      built from direct prerequisite / successor pairs
+    - category_ids: category of every taxonomy skill (-1 for other ids), so
+      same-category credit needs no pairwise storage
+    - credits(): per-vocabulary-id credit for one candidate (1.0 for skills
+      held, the best related credit otherwise); a job's partial skill score
+      is the mean credit of its required skills
+    """
+
+    def __init__(self, taxonomy, vocabulary=None):
+        self.vocabulary = vocabulary or taxonomy.vocabulary
+        skill_id = self.vocabulary.intern
+        ids = {key: skill_id(key) for key in taxonomy.skills}
+        self.size = max(ids.values()) + 1 if ids else 0
+
+        categories: Dict[str, int] = {}
+        self.category_ids = np.full(self.size, -1, dtype=np.int64)
+        for key, category in taxonomy.categories.items():
+            self.category_ids[ids[key]] = categories.setdefault(category, len(categories))
+
+        # candidate skill -> {required skill: credit}; the larger credit wins for a pair
+        links: Dict[int, Dict[int, float]] = {}
+        for key, prerequisites in taxonomy.prerequisites.items():
+            for prerequisite in prerequisites:
+                self._link(links, ids[key], ids[prerequisite], CREDIT_SUCCESSOR)
+                self._link(links, ids[prerequisite], ids[key], CREDIT_PREREQUISITE)
+
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for row in range(self.size):
+            targets = sorted(links.get(row, {}).items())
+            indices.extend(target for target, _ in targets)
+            data.extend(credit for _, credit in targets)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.data = np.array(data, dtype=np.float64)
+
+    @staticmethod
+    def _link(links: Dict[int, Dict[int, float]], held: int, required: int, credit: float):
+        if held != required:
+            row = links.setdefault(held, {})
+            row[required] = max(row.get(required, 0.0), credit)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    def links(self, skill_id: int) -> List[Tuple[int, float]]:
+        """(required skill id, credit) pairs a held skill links to"""
+        if skill_id >= self.size:
+            return []
+        start, end = self.indptr[skill_id], self.indptr[skill_id + 1]
+        return list(zip(self.indices[start:end].tolist(), self.data[start:end].tolist()))
+
+    def credits(self, skill_mask: np.ndarray) -> np.ndarray:
+        """Credit per vocabulary id for a candidate skill mask"""
+        credit = skill_mask.astype(np.float64)
+        held = np.flatnonzero(skill_mask[:self.size])
+        if not len(held):
+            return credit
+
+        categories = self.category_ids[held]
+        categories = categories[categories >= 0]
+        if len(categories):
+            same = np.isin(self.category_ids, categories)
+            credit[:self.size][same] = np.maximum(credit[:self.size][same], CREDIT_SAME_CATEGORY)
+
+        starts, ends = self.indptr[held], self.indptr[held + 1]
+        if (ends > starts).any():
+            spans = [np.arange(start, end) for start, end in zip(starts, ends) if end > start]
+            positions = np.concatenate(spans)
+            np.maximum.at(credit, self.indices[positions], self.data[positions])
+        return credit
+
+    def similarity(self, held: str, required: str) -> float:
+        """Credit one held skill gives toward one required skill"""
+        held_key, required_key = self.vocabulary.normalize(held), self.vocabulary.normalize(required)
+        if held_key == required_key:
+            return 1.0
+        held_id, required_id = self.vocabulary.get_id(held_key), self.vocabulary.get_id(required_key)
+        if held_id is None or required_id is None or max(held_id, required_id) >= self.size:
+            return 0.0
+        mask = np.zeros(self.size, dtype=bool)
+        mask[held_id] = True
+        return float(self.credits(mask)[required_id])
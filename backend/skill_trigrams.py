@@ -0,0 +1,113 @@
+"""
+Trigram Skill Index
+Resolves unknown skill spellings ("Postgres 15", "ReactJS", "kubernets") to the
+closest taxonomy name or alias by character-trigram similarity
+"""
+
+import os
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Minimum Dice similarity between trigram sets for a fuzzy resolution; at 0.6
+# related but distinct skills ("JavaFX", "React Native", "Docker Compose") pass
+DEFAULT_THRESHOLD = float(os.environ.get("SKILL_FUZZY_THRESHOLD", 0.7))
+
+# The best skill must beat the runner-up by this much, or the spelling is ambiguous
+DEFAULT_MARGIN = float(os.environ.get("SKILL_FUZZY_MARGIN", 0.15))
+
+# Shorter names/aliases ("js", "pg") are only ever matched exactly
+MIN_TERM_LENGTH = 3
+
+# Per-lookup work bound: characters considered
+MAX_QUERY_LENGTH = 64
+
+_TOKEN_SEPARATORS = re.compile(r"[\s,;:()\[\]/_-]+")
+_VERSION_TOKEN = re.compile(r"^v?\d+(\.\d+)*\+?$")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Character trigrams of a string padded like pg_trgm ("  word ")"""
+    padded = "  " + text + " "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    """
+    Inverted trigram index over taxonomy spellings
+
+    - terms: spelling (canonical name or alias, normalized) -> canonical name
+    - lookup(): best canonical name whose spelling scores at least threshold
+      and at least margin more than any other canonical name, else None. The
+      whole string is scored as written and with version numbers such as "15"
+      or "v3" dropped; words are never matched on their own, so "SQL Server"
+      or "AWS Lambda" do not collapse into "sql" or "aws"
+    - Cost per lookup is bounded by MAX_QUERY_LENGTH trigrams, each one
+      posting-list scan; no edit distance against the whole taxonomy
+    """
+
+    def __init__(self, terms: Dict[str, str], threshold: float = DEFAULT_THRESHOLD, margin: float = DEFAULT_MARGIN):
+        self.threshold = threshold
+        self.margin = margin
+        self._canonical: List[str] = []
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for term, canonical in terms.items():
+            if len(term) < MIN_TERM_LENGTH:
+                continue
+            term_id = len(self._canonical)
+            grams = trigrams(term)
+            self._canonical.append(canonical)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(term_id)
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Best similarity per canonical name sharing a trigram with text, in term order"""
+        grams = trigrams(text)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for term_id in self._postings.get(gram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+
+        scores: Dict[str, float] = {}
+        size = len(grams)
+        for term_id in sorted(shared):
+            canonical = self._canonical[term_id]
+            score = 2.0 * shared[term_id] / (size + self._sizes[term_id])
+            if score > scores.get(canonical, 0.0):
+                scores[canonical] = score
+        return scores
+
+    def best(self, text: str) -> Tuple[float, Optional[str]]:
+        """Highest-similarity (score, canonical) for one string; ties keep the earlier term"""
+        best_score, best = 0.0, None
+        for canonical, score in self.scores(text).items():
+            if score > best_score:
+                best_score, best = score, canonical
+        return best_score, best
+
+    def lookup(self, text: str) -> Optional[str]:
+        """Canonical name for an unknown, already lowercased skill string, or None"""
+        text = " ".join(text.split())[:MAX_QUERY_LENGTH]
+        if len(text) < MIN_TERM_LENGTH or not self._canonical:
+            return None
+
+        tokens = [token for token in _TOKEN_SEPARATORS.split(text) if token]
+        without_versions = " ".join(token for token in tokens if not _VERSION_TOKEN.match(token))
+
+        scores = self.scores(text)
+        if without_versions and without_versions != text:
+            for canonical, score in self.scores(without_versions).items():
+                scores[canonical] = max(scores.get(canonical, 0.0), score)
+        if not scores:
+            return None
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])
+        best, best_score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best_score < self.threshold or best_score - runner_up < self.margin:
+            return None
+        return best
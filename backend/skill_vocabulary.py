@@ -0,0 +1,261 @@
+"""
+Interned Skill Vocabulary
+Maps every normalized skill (and its aliases) to a small integer id once,
+so skill sets can be stored as bitsets and compared with bitwise operations
+"""
+
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Iterable, Union
+
+from skill_trigrams import TrigramIndex, DEFAULT_THRESHOLD
+
+# Above this many interned skills, skill vectors are stored as sorted id
+# tuples instead of int bitsets (a bitset is as wide as the largest id)
+BITSET_MAX_VOCABULARY = 4096
+
+# Set SKILL_FUZZY_MATCHING=1 to resolve unknown spellings through the trigram
+# index; off by default, so unknown skills are kept exactly as written
+FUZZY_MATCHING = os.environ.get("SKILL_FUZZY_MATCHING", "0") == "1"
+
+# Memoized fuzzy resolutions per vocabulary
+FUZZY_CACHE_SIZE = int(os.environ.get("SKILL_FUZZY_CACHE_SIZE", 16384))
+
+SkillVector = Union[int, tuple]
+
+
+def popcount(bits: int) -> int:
+    """Number of set bits in a bitset"""
+    return bin(bits).count("1")
+
+
+class SkillVocabulary:
+    """
+    Shared skill vocabulary
+
+    - normalize(): lowercase/strip, then resolve taxonomy aliases (dict lookup);
+      with fuzzy matching on, a miss falls back to the trigram index (memoized),
+      and a skill with no close taxonomy spelling is kept as written
+    - intern(): assign a stable small integer id to a normalized skill; only
+      taxonomy entries and catalog job skills are interned here (thread-safe)
+    - scratch(): request-scoped view for skills supplied with a request
+    - encode()/decode(): convert skill lists to and from skill vectors
+    """
+
+    def __init__(
+        self,
+        taxonomy: Optional[Dict[str, Dict[str, Any]]] = None,
+        fuzzy_threshold: Optional[float] = None,
+        fuzzy: Optional[bool] = None
+    ):
+        # fuzzy defaults to SKILL_FUZZY_MATCHING, or on when a threshold is given
+        if fuzzy is None:
+            fuzzy = FUZZY_MATCHING or fuzzy_threshold is not None
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._canonical: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.fuzzy_threshold = (fuzzy_threshold or DEFAULT_THRESHOLD) if fuzzy else None
+        self._fuzzy_index: Optional[TrigramIndex] = None
+        self.resolve_fuzzy = lru_cache(maxsize=FUZZY_CACHE_SIZE)(self._resolve_fuzzy)
+        if taxonomy:
+            self.add_taxonomy(taxonomy)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    def add_taxonomy(self, taxonomy: Dict[str, Dict[str, Any]]):
+        """Intern taxonomy skills and register their aliases"""
+        # Aliases first so a direct taxonomy name always wins over an alias
+        for key, data in taxonomy.items():
+            for alias in data.get('aliases', []):
+                self._canonical.setdefault(alias, key)
+        for key in taxonomy:
+            self._canonical[key] = key
+            self.intern(key)
+        self._fuzzy_index = None
+        self.resolve_fuzzy.cache_clear()
+
+    @property
+    def fuzzy_index(self) -> TrigramIndex:
+        """Trigram index over every taxonomy name and alias, built on first use"""
+        index = self._fuzzy_index
+        if index is None:
+            index = self._fuzzy_index = TrigramIndex(self._canonical, self.fuzzy_threshold)
+        return index
+
+    def _resolve_fuzzy(self, normalized: str) -> str:
+        return self.fuzzy_index.lookup(normalized) or normalized
+
+    def intern(self, key: str) -> int:
+        """Return the id for an already-normalized key, assigning one if new"""
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(key)
+                if skill_id is None:
+                    # Name first, so a reader that finds the id can always resolve it
+                    skill_id = len(self._names)
+                    self._names.append(key)
+                    self._ids[key] = skill_id
+        return skill_id
+
+    def get_id(self, key: str) -> Optional[int]:
+        """Return the id for a normalized key without interning it"""
+        return self._ids.get(key)
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    @property
+    def shared(self) -> "SkillVocabulary":
+        """The long-lived vocabulary behind this one (itself)"""
+        return self
+
+    def scratch(self) -> "ScratchVocabulary":
+        """Throwaway view that ids request skills without growing this vocabulary"""
+        return ScratchVocabulary(self)
+
+    def normalize(self, skill: str) -> str:
+        """Normalize skill name for comparison"""
+        normalized = skill.lower().strip()
+        canonical = self._canonical.get(normalized)
+        if canonical is not None:
+            return canonical
+        if self.fuzzy_threshold is None or not self._canonical:
+            return normalized
+        return self.resolve_fuzzy(normalized)
+
+    def skill_id(self, skill: str) -> int:
+        """Normalize a raw skill name and return its id"""
+        return self.intern(self.normalize(skill))
+
+    def lookup(self, skill: str) -> Optional[int]:
+        """Normalize a raw skill name and return its id, or None if it has none"""
+        return self.get_id(self.normalize(skill))
+
+    # ------------------------------------------------------------------
+    # Skill vectors
+    # ------------------------------------------------------------------
+
+    def encode(self, skills: Iterable[str], normalize: bool = True) -> SkillVector:
+        """
+        Encode skills as a bitset (small vocabulary) or sorted id tuple (large vocabulary)
+        Set normalize=False when the keys are already normalized
+        """
+        intern = self.skill_id if normalize else self.intern
+        ids = {intern(skill) for skill in skills}
+        if len(self) <= BITSET_MAX_VOCABULARY:
+            bits = 0
+            for skill_id in ids:
+                bits |= 1 << skill_id
+            return bits
+        return tuple(sorted(ids))
+
+    def decode(self, vector: SkillVector) -> List[str]:
+        """Skill names for a vector, in id order"""
+        return [self.name(skill_id) for skill_id in self.ids(vector)]
+
+    @staticmethod
+    def ids(vector: SkillVector) -> tuple:
+        """Sorted ids contained in a vector"""
+        if isinstance(vector, tuple):
+            return vector
+        ids = []
+        while vector:
+            lowest = vector & -vector
+            ids.append(lowest.bit_length() - 1)
+            vector ^= lowest
+        return tuple(ids)
+
+    @staticmethod
+    def size(vector: SkillVector) -> int:
+        if isinstance(vector, tuple):
+            return len(vector)
+        return popcount(vector)
+
+    @staticmethod
+    def intersection(a: SkillVector, b: SkillVector) -> SkillVector:
+        if isinstance(a, int) and isinstance(b, int):
+            return a & b
+        b_ids = set(SkillVocabulary.ids(b))
+        return tuple(i for i in SkillVocabulary.ids(a) if i in b_ids)
+
+    @staticmethod
+    def difference(a: SkillVector, b: SkillVector) -> SkillVector:
+        if isinstance(a, int) and isinstance(b, int):
+            return a & ~b
+        b_ids = set(SkillVocabulary.ids(b))
+        return tuple(i for i in SkillVocabulary.ids(a) if i not in b_ids)
+
+    @staticmethod
+    def overlap(a: SkillVector, b: SkillVector) -> int:
+        """Number of skills shared by two vectors"""
+        if isinstance(a, int) and isinstance(b, int):
+            return popcount(a & b)
+        return len(set(SkillVocabulary.ids(a)).intersection(SkillVocabulary.ids(b)))
+
+
+class ScratchVocabulary(SkillVocabulary):
+    """
+    Request-scoped view of a shared vocabulary
+
+    - Skills the shared vocabulary knows keep their shared ids
+    - Other skills get ids after the shared ones that live only in this view,
+      so request-supplied skills never grow the shared vocabulary
+    - Normalization (aliases, fuzzy matching) is the shared vocabulary's
+    - Owned by one request, so interning takes no lock
+    """
+
+    def __init__(self, base: SkillVocabulary):
+        self.base = base
+        # Shared ids interned after this view was taken would collide with its own
+        self._offset = len(base)
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def __len__(self) -> int:
+        return self._offset + len(self._names)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get_id(key) is not None
+
+    @property
+    def shared(self) -> SkillVocabulary:
+        return self.base
+
+    @property
+    def fuzzy_threshold(self) -> Optional[float]:
+        return self.base.fuzzy_threshold
+
+    def add_taxonomy(self, taxonomy: Dict[str, Dict[str, Any]]):
+        raise TypeError("Taxonomies are added to the shared vocabulary")
+
+    def scratch(self) -> "ScratchVocabulary":
+        return ScratchVocabulary(self.base)
+
+    def intern(self, key: str) -> int:
+        skill_id = self.get_id(key)
+        if skill_id is None:
+            skill_id = self._offset + len(self._names)
+            self._ids[key] = skill_id
+            self._names.append(key)
+        return skill_id
+
+    def get_id(self, key: str) -> Optional[int]:
+        skill_id = self.base.get_id(key)
+        if skill_id is not None and skill_id < self._offset:
+            return skill_id
+        return self._ids.get(key)
+
+    def name(self, skill_id: int) -> str:
+        if skill_id < self._offset:
+            return self.base.name(skill_id)
+        return self._names[skill_id - self._offset]
+
+    def normalize(self, skill: str) -> str:
+        return self.base.normalize(skill)
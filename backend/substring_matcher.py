@@ -0,0 +1,159 @@
+"""
+Substring Skill Matcher
+Compiles a set of skill names once so the `req in cur or cur in req` containment
+test against all of them takes one linear scan of the query
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Joins the names in the suffix automaton; a query containing it falls back to a plain scan
+SEPARATOR = "\x00"
+
+
+class SubstringMatcher:
+    """
+    Multi-pattern containment matcher over a fixed list of names
+
+    - Aho-Corasick automaton: which names occur inside a query
+    - Suffix automaton over the joined names: whether a query occurs inside any name
+    - matches(query) is True when either holds (same semantics as
+      any(query in name or name in query for name in names)), memoized per query
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = list(names)
+        self._cache: Dict[str, bool] = {}
+        self._build_aho_corasick()
+        self._build_suffix_automaton()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ------------------------------------------------------------------
+    # Aho-Corasick automaton (names contained in the query)
+    # ------------------------------------------------------------------
+
+    def _build_aho_corasick(self):
+        goto: List[Dict[str, int]] = [{}]
+        first: List[Optional[int]] = [None]  # lowest name index ending at each state
+        for index, name in enumerate(self.names):
+            state = 0
+            for ch in name:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    first.append(None)
+                state = nxt
+            if first[state] is None:
+                first[state] = index
+
+        # Breadth-first failure links; each state's output also covers its failure chain
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f][ch] if ch in goto[f] and goto[f][ch] != nxt else 0
+                inherited = first[fail[nxt]]
+                if inherited is not None and (first[nxt] is None or inherited < first[nxt]):
+                    first[nxt] = inherited
+                queue.append(nxt)
+
+        self._goto, self._fail, self._first = goto, fail, first
+
+    def _scan(self, text: str, stop_at_first: bool) -> Optional[int]:
+        """Lowest index of a name contained in text (any one if stop_at_first)"""
+        goto, fail, first = self._goto, self._fail, self._first
+        best = first[0]  # the empty name is contained in everything
+        if best is not None and stop_at_first:
+            return best
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            found = first[state]
+            if found is not None:
+                if stop_at_first:
+                    return found
+                if best is None or found < best:
+                    best = found
+        return best
+
+    # ------------------------------------------------------------------
+    # Suffix automaton (query contained in a name)
+    # ------------------------------------------------------------------
+
+    def _build_suffix_automaton(self):
+        trans: List[Dict[str, int]] = [{}]
+        link = [-1]
+        length = [0]
+        last = 0
+        for ch in SEPARATOR.join(self.names):
+            cur = len(trans)
+            trans.append({})
+            link.append(-1)
+            length.append(length[last] + 1)
+            p = last
+            while p != -1 and ch not in trans[p]:
+                trans[p][ch] = cur
+                p = link[p]
+            if p == -1:
+                link[cur] = 0
+            else:
+                q = trans[p][ch]
+                if length[p] + 1 == length[q]:
+                    link[cur] = q
+                else:
+                    clone = len(trans)
+                    trans.append(dict(trans[q]))
+                    link.append(link[q])
+                    length.append(length[p] + 1)
+                    while p != -1 and trans[p].get(ch) == q:
+                        trans[p][ch] = clone
+                        p = link[p]
+                    link[q] = clone
+                    link[cur] = clone
+            last = cur
+        self._trans = trans
+
+    def _inside_name(self, query: str) -> bool:
+        if not self.names:
+            return False
+        if SEPARATOR in query:
+            return any(query in name for name in self.names)
+        trans = self._trans
+        state = 0
+        for ch in query:
+            state = trans[state].get(ch)
+            if state is None:
+                return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def matches(self, query: str) -> bool:
+        """True if query contains, or is contained in, any name"""
+        result = self._cache.get(query)
+        if result is None:
+            result = self._inside_name(query) or self._scan(query, stop_at_first=True) is not None
+            self._cache[query] = result
+        return result
+
+    def split(self, queries: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Partition queries into (matched, missing) in one pass, keeping their order"""
+        matched, missing = [], []
+        for query in queries:
+            (matched if self.matches(query) else missing).append(query)
+        return matched, missing
+
+    def first_contained(self, text: str) -> Optional[str]:
+        """The earliest-listed name occurring inside text, or None"""
+        index = self._scan(text, stop_at_first=False)
+        return None if index is None else self.names[index]
@@ -0,0 +1,164 @@
+"""
+Skill Taxonomy Registry
+Loads taxonomy.json once into compiled lookup tables shared by every engine
+and endpoint; reload() swaps in a new version atomically
+"""
+
+import hashlib
+import json
+import os
+import threading
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from skill_similarity import SkillSimilarity
+from skill_vocabulary import SkillVocabulary
+from substring_matcher import SubstringMatcher
+
+TAXONOMY_PATH = os.environ.get(
+    "TAXONOMY_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy.json")
+)
+
+
+class CompiledTaxonomy:
+    """
+    One immutable taxonomy version
+
+    - skills: canonical name -> {category, difficulty, time_months, aliases, prerequisites},
+      in file order
+    - aliases: every canonical name and alias -> canonical name
+    - categories / difficulty / prerequisites: canonical name -> value
+    - vocabulary: skill vocabulary built from these aliases, with its trigram
+      index for misspelled or versioned skill names
+    - name_matcher: substring matcher over the canonical names, in file order
+    - skill_similarity: sparse partial-credit matrix over the vocabulary (built on first use)
+    - checksum: content hash, identical for identical taxonomy data
+    """
+
+    def __init__(self, data: Dict[str, Any], version: int):
+        skills_data = data.get("skills")
+        if not isinstance(skills_data, dict) or not skills_data:
+            raise ValueError("Taxonomy must contain a non-empty 'skills' object")
+
+        self.version = version
+        self.source = data
+        self.checksum = hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        self.display_names: Dict[str, str] = {}
+        self.skills: Dict[str, Dict[str, Any]] = {}
+
+        for name, entry in skills_data.items():
+            key = name.lower().strip()
+            if key in self.skills:
+                raise ValueError(f"Duplicate taxonomy skill: {name}")
+            self.display_names[key] = name
+            self.skills[key] = {
+                "category": entry.get("category", "Technical"),
+                "difficulty": entry.get("difficulty", 1),
+                "time_months": entry.get("time_months"),
+                "aliases": [alias.lower().strip() for alias in entry.get("aliases", [])],
+                "prerequisites": [p.lower().strip() for p in entry.get("prerequisites", [])],
+            }
+
+        self.names: Tuple[str, ...] = tuple(self.skills)
+        self.categories = {key: info["category"] for key, info in self.skills.items()}
+        self.difficulty = {key: info["difficulty"] for key, info in self.skills.items()}
+
+        # Direct names win over aliases, as in the skill vocabulary
+        self.aliases: Dict[str, str] = {}
+        for key, info in self.skills.items():
+            for alias in info["aliases"]:
+                self.aliases.setdefault(alias, key)
+        self.aliases.update({key: key for key in self.skills})
+
+        self.prerequisites: Dict[str, Tuple[str, ...]] = {}
+        for key, info in self.skills.items():
+            resolved = []
+            for prerequisite in info["prerequisites"]:
+                if prerequisite not in self.aliases:
+                    raise ValueError(f"Unknown prerequisite '{prerequisite}' for skill '{key}'")
+                resolved.append(self.aliases[prerequisite])
+            self.prerequisites[key] = tuple(resolved)
+
+        self.vocabulary = SkillVocabulary(self.skills)
+        self.name_matcher = SubstringMatcher(self.names)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    @cached_property
+    def skill_similarity(self) -> SkillSimilarity:
+        return SkillSimilarity(self)
+
+    def canonical(self, skill: str) -> str:
+        """Normalize a raw skill name (lowercase/strip, resolve aliases, then fuzzy spellings)"""
+        return self.vocabulary.normalize(skill)
+
+    def category(self, skill: str, default: Optional[str] = None) -> Optional[str]:
+        return self.categories.get(self.canonical(skill), default)
+
+    def skill_difficulty(self, skill: str, default=None):
+        return self.difficulty.get(self.canonical(skill), default)
+
+    def skill_prerequisites(self, skill: str) -> Tuple[str, ...]:
+        return self.prerequisites.get(self.canonical(skill), ())
+
+
+class TaxonomyRegistry:
+    """
+    Process-wide holder of the current CompiledTaxonomy
+
+    - current: compiled on first use, then shared by every engine and endpoint
+    - reload(): compiles the file again and swaps the reference in one step;
+      readers holding the previous version keep a consistent snapshot
+    - subscribe(): callbacks run after each swap so caches derived from the
+      taxonomy (catalog, candidate index) can rebuild
+    """
+
+    def __init__(self, path: str = TAXONOMY_PATH):
+        self.path = path
+        self._current: Optional[CompiledTaxonomy] = None
+        self._listeners: List[Callable[[CompiledTaxonomy], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> CompiledTaxonomy:
+        current = self._current
+        if current is None:
+            with self._lock:
+                if self._current is None:
+                    self._current = CompiledTaxonomy(self._read(self.path), 1)
+                current = self._current
+        return current
+
+    @property
+    def version(self) -> int:
+        return self.current.version
+
+    @staticmethod
+    def _read(path: str) -> Dict[str, Any]:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def reload(self, path: Optional[str] = None) -> CompiledTaxonomy:
+        """Re-read the taxonomy file; the previous version stays active if it is invalid"""
+        return self.load_data(self._read(path or self.path))
+
+    def load_data(self, data: Dict[str, Any]) -> CompiledTaxonomy:
+        """Compile taxonomy data and make it the current version"""
+        with self._lock:
+            version = self._current.version + 1 if self._current is not None else 1
+            compiled = CompiledTaxonomy(data, version)
+            self._current = compiled
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(compiled)
+        return compiled
+
+    def subscribe(self, listener: Callable[[CompiledTaxonomy], None]):
+        """Call listener(compiled) after every reload"""
+        with self._lock:
+            self._listeners.append(listener)
+
+
+# Singleton instance
+taxonomy_registry = TaxonomyRegistry()
@@ -0,0 +1,112 @@
+"""
+Unit tests for the bulk application import
+"""
+
+import json
+import time
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import sessionmaker
+
+from application_import import ApplicationImporter, parse_records, FORMAT_CSV
+from application_stats import ApplicationStatsStore, application_stats
+from models import Application, Candidate, Job, StatusHistory
+
+
+class TestApplicationImport:
+    """Test suite for ApplicationImporter and POST /applications/import"""
+
+    @pytest.fixture
+    def client(self, client):
+        for c in range(3):
+            client.post("/candidates", json={"id": f"C{c}", "name": f"n{c}", "email": f"c{c}@x.com"})
+        client.post("/jobs", json={"id": "J0", "title": "Job 0", "company": "co", "description": "d"})
+        return client
+
+    def test_ndjson_import_reports_each_rejected_row(self, client, db_engine):
+        """Valid rows are written with history and counters; every other row is reported"""
+        client.post("/applications", json={"candidate_id": "C2", "job_id": "J0"})
+        lines = [
+            {"job_id": "J0", "candidate_id": "C0", "status": "offered",
+             "applied_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-08T00:00:00Z"},
+            {"job_id": "J0", "candidate_id": "C1"},
+            {"job_id": "J0", "candidate_id": "C0"},
+            {"job_id": "J0", "candidate_id": "C2"},
+            {"job_id": "J9", "candidate_id": "C0"},
+            {"job_id": "J0"},
+            {"job_id": "J0", "candidate_id": "C1", "status": "hired"},
+        ]
+        body = "\n".join(json.dumps(line) for line in lines) + "\n\nnot json\n[1]\n"
+        response = client.post("/applications/import", content=body, headers={"Content-Type": "application/x-ndjson"})
+        assert response.status_code == 200
+        result = response.json()
+        assert (result["total_rows"], result["imported"], result["failed"]) == (9, 2, 7)
+        assert [(error["row"], error["error"]) for error in result["errors"]] == [
+            (3, "Duplicate of row 1"),
+            (4, "Already applied to this job"),
+            (5, "Job not found"),
+            (6, "Missing candidate_id"),
+            (7, "Invalid status: hired"),
+            (8, "Invalid JSON"),
+            (9, "Expected a JSON object"),
+        ]
+
+        db = sessionmaker(bind=db_engine)()
+        offered = db.query(Application).filter(Application.candidate_id == "C0").one()
+        assert offered.status.value == "offered" and (offered.updated_at - offered.applied_at).days == 7
+        assert db.query(StatusHistory).count() == 3
+        dashboard = client.get("/applications/stats/dashboard").json()
+        assert dashboard["total_applications"] == 3 and dashboard["average_time_to_offer"] == 7
+        counters = ApplicationStatsStore.compute(db)
+        assert dashboard["by_status"] == {
+            name.split(":")[1]: value for name, value in counters.items() if name.startswith("status:")
+        }
+        db.close()
+        assert client.get("/jobs/J0/applications/stats").json()["total_applications"] == 3
+
+    def test_csv_import(self, client):
+        body = "job_id,candidate_id,status\nJ0,C0,screening\nJ0,C1,\nJ0,C2,rejected\n"
+        result = client.post("/applications/import", content=body, headers={"Content-Type": "text/csv"}).json()
+        assert (result["total_rows"], result["imported"], result["failed"]) == (3, 3, 0)
+        by_status = client.get("/jobs/J0/applications/stats").json()["by_status"]
+        assert (by_status["screening"], by_status["applied"], by_status["rejected"]) == (1, 1, 1)
+
+    def test_set_based_queries_per_chunk(self, db_engine):
+        """Query count grows with the number of chunks, not the number of rows"""
+        db = sessionmaker(bind=db_engine)()
+        db.execute(insert(Job), [{"id": f"J{j}", "title": "t", "company": "co"} for j in range(10)])
+        db.execute(insert(Candidate), [{"id": f"C{c}", "name": "n", "email": f"c{c}@x.com"} for c in range(100)])
+        db.commit()
+
+        application_stats.initialize(db)
+        statements = []
+        event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        body = "job_id,candidate_id\n" + "".join(f"J{j},C{c}\n" for j in range(10) for c in range(100))
+        result = ApplicationImporter(chunk_size=250).run(db, parse_records(body, FORMAT_CSV))
+        assert (result.imported, result.failed) == (1000, 0)
+        # per chunk: jobs, candidates, existing pairs, 2 inserts, 2 counter and 3 per-job count statements
+        assert len(statements) <= 4 * 10
+        assert sum("INSERT INTO applications" in statement for statement in statements) == 4
+        assert db.query(Application).count() == db.query(StatusHistory).count() == 1000
+        assert application_stats.read(db).total_applications == 1000
+        db.close()
+
+    def test_large_import_throughput(self, db_engine):
+        """20k rows import well inside the 100k-rows-per-minute target"""
+        db = sessionmaker(bind=db_engine)()
+        db.execute(insert(Job), [{"id": f"J{j}", "title": "t", "company": "co"} for j in range(100)])
+        db.execute(insert(Candidate), [{"id": f"C{c}", "name": "n", "email": f"c{c}@x.com"} for c in range(200)])
+        db.commit()
+        body = "".join(
+            json.dumps({"job_id": f"J{j}", "candidate_id": f"C{c}"}) + "\n" for j in range(100) for c in range(200)
+        )
+        started = time.perf_counter()
+        result = ApplicationImporter().run(db, parse_records(body, "ndjson"))
+        assert result.imported == 20000
+        assert time.perf_counter() - started < 12
+        db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
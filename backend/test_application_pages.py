@@ -0,0 +1,92 @@
+"""
+Unit tests for keyset-paginated application lists
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from application_pages import decode_cursor, encode_cursor
+from models import Application, Candidate, Job, StatusEnum
+
+APPLIED_AT = datetime(2024, 1, 1)
+
+
+class TestApplicationPages:
+    """Test suite for application_page and the per-job / per-candidate list endpoints"""
+
+    @pytest.fixture(autouse=True)
+    def applicants(self, db_engine):
+        """45 applicants for J0, several sharing one applied_at so ties are broken by id"""
+        db = sessionmaker(bind=db_engine)()
+        db.add(Job(id="J0", title="Backend Developer", company="co", description="d"))
+        for i in range(45):
+            db.add(Candidate(id=f"C{i:02d}", name=f"n{i}", email=f"c{i}@x.com"))
+            db.add(Application(
+                id=f"A{i:02d}", job_id="J0", candidate_id=f"C{i:02d}",
+                status=StatusEnum.REJECTED if i % 3 == 0 else StatusEnum.APPLIED,
+                applied_at=APPLIED_AT + timedelta(hours=i // 4)
+            ))
+        db.commit()
+        db.close()
+
+    def walk(self, client, url, limit, **filters):
+        pages, cursor = [], None
+        while True:
+            params = dict(filters, limit=limit)
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get(url, params=params)
+            assert response.status_code == 200
+            pages.append(response.json())
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                return pages
+
+    def test_pages_cover_every_application_once(self, client):
+        """Walking the cursors yields every application exactly once, newest first"""
+        pages = self.walk(client, "/jobs/J0/applications", limit=10)
+        assert [len(page) for page in pages] == [10, 10, 10, 10, 5]
+        rows = [row for page in pages for row in page]
+        assert [row["id"] for row in rows] == sorted([f"A{i:02d}" for i in range(45)], key=lambda a: (
+            APPLIED_AT + timedelta(hours=int(a[1:]) // 4), a
+        ), reverse=True)
+        assert rows[0]["job"]["title"] == "Backend Developer" and rows[0]["candidate"]["id"] == rows[0]["candidate_id"]
+
+        rejected = [row for page in self.walk(client, "/jobs/J0/applications", 4, status="rejected") for row in page]
+        assert [row["id"] for row in rejected] == [row["id"] for row in rows if row["status"] == "rejected"]
+
+        candidate = client.get("/candidates/C07/applications")
+        assert [row["id"] for row in candidate.json()] == ["A07"] and "x-next-cursor" not in candidate.headers
+
+    def test_page_query_count_is_constant(self, client, db_engine):
+        """Every page costs the same two queries (entity check, joined page), whatever its size or position"""
+        statements = []
+        event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        counts = []
+        for limit in (1, 10, 45):
+            cursor = None
+            for _ in range(2):
+                statements.clear()
+                response = client.get("/jobs/J0/applications", params={"limit": limit, "cursor": cursor})
+                counts.append(len(statements))
+                cursor = response.headers.get("x-next-cursor")
+        assert counts == [2] * len(counts)
+        assert "JOIN" in statements[-1] and "LIMIT" in statements[-1]
+
+    def test_invalid_requests(self, client):
+        """Bad cursors and limits are 400/422; unknown entities are 404"""
+        assert client.get("/jobs/J0/applications", params={"cursor": "not-a-cursor"}).status_code == 400
+        assert client.get("/jobs/J0/applications", params={"limit": 0}).status_code == 422
+        assert client.get("/jobs/J0/applications", params={"limit": 501}).status_code == 422
+        assert client.get("/jobs/missing/applications").status_code == 404
+
+        application = Application(id="A99", applied_at=APPLIED_AT)
+        assert decode_cursor(encode_cursor(application)) == (APPLIED_AT, "A99")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
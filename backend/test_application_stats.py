@@ -0,0 +1,141 @@
+"""
+Unit tests for the maintained application dashboard counters
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import main
+from application_stats import ApplicationStatsStore, application_stats
+from models import Application, ApplicationStatsCounter, StatusEnum
+
+FLOW = ["screening", "interview_scheduled", "interview_completed", "offered"]
+
+
+class TestApplicationStats:
+    """Test suite for ApplicationStatsStore and the dashboard endpoint"""
+
+    def populate(self, client, db_engine, candidates=4, jobs=3, prefix=""):
+        """Applications in every status; the two offers are made 3 and 10 days after applying"""
+        for c in range(candidates):
+            client.post("/candidates", json={"id": f"{prefix}C{c}", "name": f"n{c}", "email": f"{prefix}c{c}@x.com"})
+        for j in range(jobs):
+            client.post("/jobs", json={"id": f"{prefix}J{j}", "title": f"Job {j}", "company": "co", "description": "d"})
+        ids = []
+        for c in range(candidates):
+            for j in range(jobs):
+                if (c + j) % 4 != 3:
+                    response = client.post(
+                        "/applications", json={"candidate_id": f"{prefix}C{c}", "job_id": f"{prefix}J{j}"}
+                    )
+                    ids.append(response.json()["id"])
+
+        db = sessionmaker(bind=db_engine)()
+        for i, application_id in enumerate(ids[:2]):
+            db.get(Application, application_id).applied_at = datetime.utcnow() - timedelta(days=3 + 7 * i)
+        db.commit()
+        db.close()
+
+        for i, application_id in enumerate(ids):
+            for status in FLOW[:i % len(FLOW)] if i >= 2 else FLOW:
+                client.patch(f"/applications/{application_id}/status", json={"status": status})
+        client.patch(f"/applications/{ids[-1]}/status", json={"status": "rejected"})
+        return ids
+
+    def test_counters_match_recomputation(self, client, db_engine):
+        """Counters maintained write by write equal a full recomputation from the tables"""
+        self.populate(client, db_engine)
+        stats = client.get("/applications/stats/dashboard").json()
+
+        db = sessionmaker(bind=db_engine)()
+        assert stats == ApplicationStatsStore.assemble(
+            ApplicationStatsStore.compute(db), [(k.split(":")[0], k.split(":")[1], v) for k, v in stats["by_job"].items()]
+        ).model_dump()
+        application_stats.rebuild(db)
+        db.commit()
+        db.close()
+        assert client.get("/applications/stats/dashboard").json() == stats
+
+        assert stats["total_applications"] == 9 and stats["total_candidates"] == 4 and stats["total_jobs"] == 3
+        assert sum(stats["by_status"].values()) == 9
+        assert stats["average_time_to_offer"] == (3 + 10) / 2
+        assert list(stats["by_job"].values()) == sorted(stats["by_job"].values(), reverse=True)
+
+    def test_offer_withdrawn_leaves_average(self, client, db_engine):
+        """Moving an application out of offered takes its days out of the average"""
+        ids = self.populate(client, db_engine)
+        before = client.get("/applications/stats/dashboard").json()
+        client.patch(f"/applications/{ids[0]}/status", json={"status": "rejected"})
+        after = client.get("/applications/stats/dashboard").json()
+        assert after["by_status"]["offered"] == before["by_status"]["offered"] - 1
+        assert after["by_status"]["rejected"] == before["by_status"]["rejected"] + 1
+
+        db = sessionmaker(bind=db_engine)()
+        offers = ApplicationStatsStore.compute(db)
+        db.close()
+        expected = offers["offer_days_total"] / offers["offer_days_count"] if offers["offer_days_count"] else None
+        assert after["average_time_to_offer"] == expected
+
+    def test_rolled_back_write_leaves_counters(self, client, db_engine):
+        """Counter deltas share the write's transaction"""
+        self.populate(client, db_engine)
+        before = client.get("/applications/stats/dashboard").json()
+
+        db = sessionmaker(bind=db_engine)()
+        application = Application(id="X", job_id="J0", candidate_id="C3", status=StatusEnum.APPLIED)
+        db.add(application)
+        application_stats.record_submission(db, application)
+        db.rollback()
+        db.close()
+
+        assert client.patch("/applications/missing/status", json={"status": "screening"}).status_code == 404
+        assert client.get("/applications/stats/dashboard").json() == before
+
+    def test_dashboard_read_is_constant_size(self, client, db_engine):
+        """The dashboard issues the same two queries however many applications exist"""
+        statements = []
+        event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        self.populate(client, db_engine, candidates=2, jobs=2)
+        statements.clear()
+        client.get("/applications/stats/dashboard")
+        small = len(statements)
+
+        self.populate(client, db_engine, candidates=12, jobs=10, prefix="more")
+        statements.clear()
+        client.get("/applications/stats/dashboard")
+        assert len(statements) == small == 2
+        assert not any("GROUP BY" in statement for statement in statements)
+
+    def test_missing_counters_are_rebuilt(self, client, db_engine):
+        """A database without counter rows is rebuilt on the next read"""
+        self.populate(client, db_engine)
+        expected = client.get("/applications/stats/dashboard").json()
+        db = sessionmaker(bind=db_engine)()
+        db.query(ApplicationStatsCounter).delete()
+        db.commit()
+        db.close()
+        assert client.get("/applications/stats/dashboard").json() == expected
+
+    def test_schema_and_counters_are_built_at_startup(self, monkeypatch):
+        """The server's startup, not the import of main, creates the tables and counters"""
+        db_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        monkeypatch.setattr(main, "engine", db_engine)
+        monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=db_engine))
+        assert not inspect(db_engine).get_table_names()
+
+        with TestClient(main.app):
+            pass
+        assert "application_stats" in inspect(db_engine).get_table_names()
+        db = sessionmaker(bind=db_engine)()
+        assert db.query(ApplicationStatsCounter).count() > 0
+        db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,120 @@
+"""
+Unit tests for bulk application status transitions
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+import application_transitions
+from application_stats import ApplicationStatsStore
+from application_transitions import bulk_transition, TransitionConflict
+from models import Application, StatusEnum, StatusHistory
+
+
+class TestApplicationTransitions:
+    """Test suite for bulk_transition and PATCH /applications/status"""
+
+    @pytest.fixture
+    def client(self, client):
+        client.post("/jobs", json={"id": "J0", "title": "Job 0", "company": "co", "description": "d"})
+        for c in range(6):
+            client.post("/candidates", json={"id": f"C{c}", "name": f"n{c}", "email": f"c{c}@x.com"})
+        return client
+
+    def applications(self, client):
+        ids = [
+            client.post("/applications", json={"candidate_id": f"C{c}", "job_id": "J0"}).json()["id"]
+            for c in range(6)
+        ]
+        client.patch(f"/applications/{ids[4]}/status", json={"status": "screening"})
+        client.patch(f"/applications/{ids[5]}/status", json={"status": "rejected"})
+        return ids
+
+    def test_bulk_transition_reports_rejected_ids(self, client, db_engine):
+        """Valid applications move with history entries; invalid and unknown ids are rejected"""
+        ids = self.applications(client)
+        response = client.patch("/applications/status", json={
+            "application_ids": ids + ["missing", ids[0]], "status": "screening", "changed_by": "recruiter-1"
+        })
+        assert response.status_code == 200
+        result = response.json()
+        assert result["updated"] == ids[:4]
+        assert [(r["application_id"], r["current_status"], r["error"].split(" from")[0]) for r in result["rejected"]] == [
+            (ids[4], "screening", "Invalid transition"),
+            (ids[5], "rejected", "Invalid transition"),
+            ("missing", None, "Application not found"),
+        ]
+
+        details = client.get(f"/applications/{ids[0]}").json()
+        assert details["status"] == "screening"
+        assert [(h["old_status"], h["new_status"], h["changed_by"]) for h in details["status_history"]][-1] == (
+            "applied", "screening", "recruiter-1"
+        )
+
+        dashboard = client.get("/applications/stats/dashboard").json()
+        assert dashboard["by_status"]["screening"] == 5 and dashboard["by_status"]["applied"] == 0
+        db = sessionmaker(bind=db_engine)()
+        counters = ApplicationStatsStore.compute(db)
+        db.close()
+        assert counters["status:screening"] == 5
+        assert client.get("/jobs/J0/applications/stats").json()["by_status"]["screening"] == 5
+
+    def test_bulk_transition_is_set_based(self, client, db_engine):
+        """The statement count does not depend on how many applications move"""
+        ids = self.applications(client)
+        statements = []
+        event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        client.patch("/applications/status", json={"application_ids": ids, "status": "rejected"})
+        writes = [s for s in statements if s.startswith(("UPDATE applications", "INSERT INTO status_history"))]
+        assert len(writes) == 2
+        assert len(statements) <= 6
+
+    def race(self, client, db_engine, competing_status, target):
+        """Run a bulk transition while another write moves the first application to competing_status"""
+        ids = self.applications(client)
+        db = sessionmaker(bind=db_engine)()
+        history = db.query(StatusHistory).count()
+        raced = []
+
+        def competing_write(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE applications") and not raced:
+                raced.append(statement)
+                cursor.execute("UPDATE applications SET status = ? WHERE id = ?", (competing_status, ids[0]))
+
+        event.listen(db_engine, "before_cursor_execute", competing_write)
+        try:
+            with pytest.raises(TransitionConflict):
+                bulk_transition(db, ids[:2], target)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", competing_write)
+
+        assert db.query(StatusHistory).count() == history
+        assert {status for status, in db.query(Application.status).filter(Application.id.in_(ids[:2]))} == {
+            StatusEnum.APPLIED
+        }
+        db.close()
+        return ids
+
+    def test_concurrent_change_rolls_back(self, client, db_engine):
+        """If a validated application changes status before the UPDATE, nothing is written"""
+        ids = self.race(client, db_engine, "REJECTED", StatusEnum.SCREENING)
+        response = client.patch("/applications/status", json={"application_ids": ids[:2], "status": "screening"})
+        assert response.json()["updated"] == ids[:2]
+
+    def test_change_to_another_valid_source_conflicts(self, client, db_engine):
+        """A row moved to a different status that also allows the target still conflicts"""
+        self.race(client, db_engine, "SCREENING", StatusEnum.REJECTED)
+        dashboard = client.get("/applications/stats/dashboard").json()
+        assert dashboard["by_status"]["rejected"] == 1 and dashboard["by_status"]["applied"] == 4
+
+    def test_request_limits(self, client):
+        """Empty and oversized id lists are refused before touching the database"""
+        assert client.patch("/applications/status", json={"application_ids": [], "status": "screening"}).status_code == 400
+        too_many = ["a"] * (application_transitions.MAX_BULK_TRANSITION + 1)
+        response = client.patch("/applications/status", json={"application_ids": too_many, "status": "screening"})
+        assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,72 @@
+"""
+Unit tests for the matching benchmark suite (generator, runner, comparison)
+"""
+
+import copy
+import json
+import pytest
+from benchmark_matching import SyntheticData, run_benchmarks, compare, main
+
+
+@pytest.fixture(scope="module")
+def results():
+    return run_benchmarks(
+        [200, 500], ["engine_per_job", "engine_vectorized"],
+        requests=3, max_object_jobs=300, log=lambda line: None
+    )
+
+
+class TestBenchmarkSuite:
+    """Test suite for benchmark_matching"""
+
+    def test_generator_is_deterministic(self):
+        first, second = SyntheticData(seed=5), SyntheticData(seed=5)
+        assert [job.model_dump() for job in first.jobs(300)] == [job.model_dump() for job in second.jobs(300)]
+        assert first.candidates(20) == second.candidates(20)
+        assert first.jobs(50) != SyntheticData(seed=6).jobs(50)
+
+        # Realistic shapes: skewed skill frequencies, some postings without salary
+        jobs = first.jobs(2000)
+        assert any(not job.salary_range for job in jobs)
+        counts = {}
+        for job in jobs:
+            for skill in job.required_skills:
+                counts[skill] = counts.get(skill, 0) + 1
+        assert max(counts.values()) > 20 * sorted(counts.values())[len(counts) // 2]
+
+    def test_results_shape(self, results):
+        measured = [r for r in results["results"] if "skipped" not in r]
+        skipped = [r for r in results["results"] if "skipped" in r]
+        assert [(r["scenario"], r["jobs"]) for r in skipped] == [("engine_per_job", 500)]
+        for result in measured:
+            assert result["requests"] == 3
+            assert 0 < result["latency_ms"]["p50"] <= result["latency_ms"]["p99"]
+            assert result["jobs_per_second"] > 0 and result["request_peak_bytes"] > 0
+        assert results["meta"]["seed"] == 42
+
+    def test_compare_flags_regressions(self, results):
+        """Slower or larger runs beyond the threshold are regressions; faster ones are not"""
+        assert not any(row["regression"] for row in compare(results, results))
+
+        slower = copy.deepcopy(results)
+        for result in slower["results"]:
+            if result.get("scenario") == "engine_vectorized" and result["jobs"] == 500:
+                result["latency_ms"]["p99"] *= 1.5
+                result["jobs_per_second"] *= 2
+        rows = compare(slower, results, threshold=0.1)
+        flagged = [(row["scenario"], row["jobs"], row["metric"]) for row in rows if row["regression"]]
+        assert flagged == [("engine_vectorized", 500, "latency_ms.p99")]
+
+    def test_cli_exit_code(self, results, tmp_path):
+        baseline = copy.deepcopy(results)
+        for result in baseline["results"]:
+            if "skipped" not in result:
+                result["jobs_per_second"] *= 1000
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps(baseline))
+        args = ["--scales", "200", "--scenarios", "engine_vectorized", "--requests", "2", "--compare", str(path)]
+        assert main(args) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
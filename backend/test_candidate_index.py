@@ -0,0 +1,125 @@
+"""
+Unit tests for the candidate inverted index (job-to-candidates matching)
+"""
+
+import random
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Base, Candidate, CandidateProfile
+from matching_engine import JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch
+from candidate_index import CandidateIndex
+from testing_helpers import SKILL_POOL, LOCATIONS, TITLES
+
+
+def make_candidates(count, seed=4):
+    rng = random.Random(seed)
+    return {
+        f"C{i:04d}": CandidateMatchProfile(
+            skills=rng.sample(SKILL_POOL, rng.randint(1, 5)),
+            experience_years=rng.randint(0, 10),
+            preferred_locations=rng.sample(LOCATIONS, rng.randint(0, 2)),
+            preferred_roles=rng.sample(TITLES, rng.randint(0, 2)),
+            expected_salary=rng.randrange(300000, 2500000, 50000)
+        )
+        for i in range(count)
+    }
+
+
+class TestCandidateIndex:
+    """Test suite for CandidateIndex"""
+
+    @pytest.fixture
+    def engine(self):
+        return JobMatchingEngine()
+
+    @pytest.fixture
+    def candidates(self):
+        return make_candidates(300)
+
+    @pytest.fixture
+    def index(self, engine, candidates):
+        db_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=db_engine)
+        db = sessionmaker(bind=db_engine)()
+        for candidate_id, profile in candidates.items():
+            db.add(Candidate(id=candidate_id, name=candidate_id, email=f"{candidate_id}@example.com"))
+            db.add(CandidateIndex.store_profile(CandidateProfile(candidate_id=candidate_id), profile))
+        db.commit()
+        index = CandidateIndex(engine)
+        index.load(db)
+        db.close()
+        return index
+
+    @pytest.fixture
+    def job(self):
+        return JobPostingForMatch(
+            job_id="J001",
+            title="Backend Developer",
+            required_skills=["Python", "FastAPI", "PostgreSQL", "Docker"],
+            experience_required="2-5 years",
+            location="Bangalore",
+            salary_range=[800000, 1500000],
+            company="TechCorp"
+        )
+
+    def brute_force(self, engine, candidates, job, min_overlap=1):
+        results = []
+        for candidate_id in sorted(candidates):
+            result = engine.match_candidate_to_job(candidates[candidate_id], job)
+            if len(result.matching_skills) >= min_overlap:
+                results.append((candidate_id, result.match_score))
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results
+
+    def test_rank_matches_brute_force(self, engine, index, candidates, job):
+        """Index ranking equals scoring every overlapping candidate directly"""
+        expected = self.brute_force(engine, candidates, job)
+        response = index.rank_candidates(job)
+        assert response.total_candidates == len(expected)
+        assert [(m.candidate_id, m.match_score) for m in response.matches] == expected
+
+        top = index.rank_candidates(job, top_k=10)
+        assert [(m.candidate_id, m.match_score) for m in top.matches] == expected[:10]
+
+    def test_results_match_per_job_results(self, engine, index, candidates, job):
+        """Breakdowns, skill lists and reasons are built from the ranking scores, as match_candidate_to_job builds them"""
+        for match in index.rank_candidates(job, top_k=25).matches:
+            expected = engine.match_candidate_to_job(candidates[match.candidate_id], job)
+            assert match.breakdown == expected.breakdown
+            assert match.matching_skills == expected.matching_skills
+            assert match.missing_skills == expected.missing_skills
+            assert match.recommendation_reason == expected.recommendation_reason
+
+    def test_min_overlap(self, engine, index, candidates, job):
+        """Only candidates sharing at least min_overlap required skills are scored"""
+        expected = self.brute_force(engine, candidates, job, min_overlap=2)
+        response = index.rank_candidates(job, min_overlap=2)
+        assert [m.candidate_id for m in response.matches] == [cid for cid, _ in expected]
+        assert all(len(m.matching_skills) >= 2 for m in response.matches)
+
+    def test_incremental_update(self, index, job):
+        """Changing one profile updates the index without a reload"""
+        index.upsert("C9999", CandidateMatchProfile(
+            skills=["py", "fastapi", "postgres", "docker"],
+            experience_years=3,
+            preferred_locations=["Bangalore"],
+            preferred_roles=["Backend Developer"],
+            expected_salary=900000
+        ))
+        assert index.rank_candidates(job, top_k=1).matches[0].candidate_id == "C9999"
+
+        index.upsert("C9999", CandidateMatchProfile(
+            skills=["Rust"], experience_years=3, preferred_locations=[],
+            preferred_roles=[], expected_salary=900000
+        ))
+        assert "C9999" not in [m.candidate_id for m in index.rank_candidates(job).matches]
+
+        index.remove("C0000")
+        assert len(index) == 300
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
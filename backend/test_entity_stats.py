@@ -0,0 +1,101 @@
+"""
+Unit tests for the cached per-job and per-candidate application stats
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from entity_stats import EntityStatsCache, entity_stats, SCOPE_JOB
+
+
+class TestEntityStats:
+    """Test suite for EntityStatsCache and the per-entity stats endpoints"""
+
+    @pytest.fixture
+    def client(self, client):
+        for c in range(3):
+            client.post("/candidates", json={"id": f"C{c}", "name": f"Candidate {c}", "email": f"c{c}@x.com"})
+        for j in range(2):
+            client.post("/jobs", json={"id": f"J{j}", "title": f"Job {j}", "company": "co", "description": "d"})
+        return client
+
+    def apply(self, client, candidate_id, job_id):
+        response = client.post("/applications", json={"candidate_id": candidate_id, "job_id": job_id})
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    def test_stats_follow_application_writes(self, client):
+        """Creating an application or changing its status refreshes both entities' stats"""
+        first = self.apply(client, "C0", "J0")
+        self.apply(client, "C1", "J0")
+        self.apply(client, "C0", "J1")
+
+        job = client.get("/jobs/J0/applications/stats").json()
+        assert job["job_title"] == "Job 0" and job["total_applications"] == 2
+        assert job["by_status"]["applied"] == 2 and sum(job["by_status"].values()) == 2
+
+        client.patch(f"/applications/{first}/status", json={"status": "rejected"})
+        self.apply(client, "C2", "J0")
+        job = client.get("/jobs/J0/applications/stats").json()
+        assert job["total_applications"] == 3
+        assert job["by_status"]["applied"] == 2 and job["by_status"]["rejected"] == 1
+
+        candidate = client.get("/candidates/C0/applications/stats").json()
+        assert candidate["candidate_name"] == "Candidate 0" and candidate["total_applications"] == 2
+        assert candidate["rejections"] == 1 and candidate["offers_received"] == 0
+
+        assert client.get("/jobs/missing/applications/stats").status_code == 404
+        assert client.get("/candidates/missing/applications/stats").status_code == 404
+
+    def test_query_counts(self, client, db_engine):
+        """A miss is two queries, a hit none; writes only invalidate the entities they touch"""
+        self.apply(client, "C0", "J0")
+        application_id = self.apply(client, "C1", "J1")
+        statements = []
+        event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        client.get("/jobs/J0/applications/stats")
+        assert len(statements) == 2 and "GROUP BY" in statements[1]
+        statements.clear()
+        client.get("/jobs/J0/applications/stats")
+        client.get("/jobs/J1/applications/stats")
+        assert len(statements) == 2
+
+        client.patch(f"/applications/{application_id}/status", json={"status": "screening"})
+        statements.clear()
+        client.get("/jobs/J0/applications/stats")
+        assert statements == []
+        assert client.get("/jobs/J1/applications/stats").json()["by_status"]["screening"] == 1
+        assert len(statements) == 2
+
+    def test_rejected_write_keeps_cache(self, client):
+        """A write that fails validation does not invalidate anything"""
+        self.apply(client, "C0", "J0")
+        client.get("/jobs/J0/applications/stats")
+        invalidations = entity_stats.stats()["invalidations"]
+        assert client.post("/applications", json={"candidate_id": "C0", "job_id": "J0"}).status_code == 400
+        assert entity_stats.stats()["invalidations"] == invalidations
+
+    def test_invalidation_during_compute_is_not_stored(self):
+        """A value computed while its key was invalidated is returned but not cached"""
+        cache = EntityStatsCache(max_entries=2)
+        key = (SCOPE_JOB, "J0")
+
+        def racing_compute():
+            cache.invalidate(key)
+            return "stale"
+
+        assert cache.get_or_compute(key, racing_compute) == "stale"
+        assert len(cache) == 0
+        assert cache.get_or_compute(key, lambda: "fresh") == "fresh"
+        assert cache.get_or_compute(key, lambda: "recomputed") == "fresh"
+        assert cache.get_or_compute((SCOPE_JOB, "missing"), lambda: None) is None and len(cache) == 1
+
+        cache.get_or_compute((SCOPE_JOB, "J1"), lambda: "one")
+        cache.get_or_compute((SCOPE_JOB, "J2"), lambda: "two")
+        assert len(cache) == 2 and cache.get_or_compute(key, lambda: "evicted") == "evicted"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
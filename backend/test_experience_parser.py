@@ -0,0 +1,47 @@
+"""
+Unit tests for the shared experience requirement parser
+"""
+
+import pytest
+from experience_parser import (
+    parse_experience, experience_intervals, ExperienceRange,
+    UNSPECIFIED, EXACT, AT_LEAST, RANGE, OPEN_ENDED_MAX_YEARS
+)
+
+
+class TestExperienceParser:
+    """Test suite for parse_experience and experience_intervals"""
+
+    def test_kinds_and_bounds(self):
+        """Each requirement shape gets a kind plus engine and /matches bounds"""
+        cases = {
+            "0-2 years": (RANGE, (0, 2), (0, 2)),
+            "2 to 6 yrs (7 preferred)": (RANGE, (2, 6), (2, 6)),
+            "3 years": (EXACT, (3, 3), (3, 3)),
+            "5+ years": (AT_LEAST, (5, OPEN_ENDED_MAX_YEARS), (5, 5)),
+            "Fresher": (UNSPECIFIED, (0, OPEN_ENDED_MAX_YEARS), (0, 0)),
+        }
+        for raw, (kind, bounds, stated) in cases.items():
+            parsed = parse_experience(raw)
+            assert isinstance(parsed, ExperienceRange)
+            assert (parsed.kind, parsed.bounds, parsed.stated_bounds) == (kind, bounds, stated), raw
+
+    def test_memoized_by_raw_string(self):
+        parse_experience.cache_clear()
+        for _ in range(100):
+            parse_experience("1-3 years")
+        info = parse_experience.cache_info()
+        assert info.misses == 1 and info.hits == 99
+        assert info.maxsize is not None
+
+    def test_interval_columns(self):
+        raws = ["0-2 years", "5+ years", "Fresher", "0-2 years"]
+        mins, maxs = experience_intervals(raws)
+        assert mins.tolist() == [0, 5, 0, 0]
+        assert maxs.tolist() == [2, OPEN_ENDED_MAX_YEARS, OPEN_ENDED_MAX_YEARS, 2]
+        mins, maxs = experience_intervals(raws, stated=True)
+        assert maxs.tolist() == [2, 5, 0, 2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
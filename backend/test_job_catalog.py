@@ -0,0 +1,143 @@
+"""
+Unit tests for the compiled job catalog
+Uses an in-memory SQLite database
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Base, Job, JobMatchProfile, JobStatusEnum
+from schemas import JobMatchProfileCreate
+from matching_engine import JobMatchingEngine, CandidateMatchProfile, CatalogFilters
+from job_catalog import JobCatalog
+from taxonomy_registry import TaxonomyRegistry
+from testing_helpers import make_jobs
+
+
+class TestJobCatalog:
+    """Test suite for JobCatalog"""
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    @pytest.fixture
+    def engine(self):
+        return JobMatchingEngine()
+
+    @pytest.fixture
+    def postings(self):
+        return make_jobs(60, seed=11)
+
+    @pytest.fixture
+    def catalog(self, db, engine, postings):
+        catalog = JobCatalog(engine)
+        for posting in postings:
+            job = Job(id=posting.job_id, title=posting.title, company=posting.company)
+            profile = JobMatchProfile(job_id=posting.job_id)
+            catalog.compile_profile(job, profile, JobMatchProfileCreate(
+                required_skills=posting.required_skills,
+                experience_required=posting.experience_required,
+                location=posting.location,
+                salary_range=posting.salary_range
+            ))
+            db.add(job)
+            db.add(profile)
+        db.commit()
+        catalog.load(db)
+        return catalog
+
+    @pytest.fixture
+    def candidate(self):
+        return CandidateMatchProfile(
+            skills=["Python", "React", "k8s"],
+            experience_years=3,
+            preferred_locations=["Bangalore"],
+            preferred_roles=["Backend Developer"],
+            expected_salary=1100000
+        )
+
+    def test_catalog_matches_request_path(self, catalog, engine, postings, candidate):
+        """Matching the catalog gives the same ranking as sending the postings"""
+        expected = engine.match_candidate_to_jobs(candidate, postings)
+        actual = catalog.match(candidate)
+        assert [(m.job_id, m.match_score) for m in actual.matches] == \
+            [(m.job_id, m.match_score) for m in expected.matches]
+        assert [m.breakdown for m in actual.matches] == [m.breakdown for m in expected.matches]
+
+    def test_compiled_fields_are_stored(self, db, catalog):
+        """Profiles persist normalized skills, experience range and location"""
+        profile = db.query(JobMatchProfile).filter(JobMatchProfile.job_id == "J0000").first()
+        assert profile.location_normalized == profile.location.lower().strip()
+        assert profile.experience_max >= profile.experience_min
+
+    def test_filters(self, catalog, candidate):
+        """job_ids / locations / companies filters restrict the ranked rows"""
+        response = catalog.match(candidate, CatalogFilters(job_ids=["J0001", "J0002", "missing"]))
+        assert sorted(m.job_id for m in response.matches) == ["J0001", "J0002"]
+
+        response = catalog.match(candidate, CatalogFilters(companies=["company 3"]))
+        assert response.matches
+        assert all(m.company == "Company 3" for m in response.matches)
+
+        mumbai = {j.job_id for j in catalog.columns().jobs if j.location_key == "mumbai"}
+        response = catalog.match(candidate, CatalogFilters(locations=["MUMBAI"]))
+        assert {m.job_id for m in response.matches} == mumbai
+
+    def test_close_and_update_recompile_one_entry(self, db, catalog, candidate):
+        """Closing removes a job; updating a profile recompiles only that entry"""
+        version = catalog.version
+        job = db.query(Job).filter(Job.id == "J0005").first()
+        job.status = JobStatusEnum.CLOSED
+        db.commit()
+        catalog.refresh(job)
+        assert catalog.version == version + 1
+        assert "J0005" not in [m.job_id for m in catalog.match(candidate).matches]
+
+        job = db.query(Job).filter(Job.id == "J0006").first()
+        catalog.compile_profile(job, job.match_profile, JobMatchProfileCreate(
+            required_skills=["Python", "React", "kubernetes"],
+            experience_required="2-4 years",
+            location="Bangalore",
+            salary_range=[900000, 1500000]
+        ))
+        db.commit()
+        catalog.refresh(job)
+        top = catalog.match(candidate, CatalogFilters(job_ids=["J0006"])).matches[0]
+        assert top.breakdown.skill_match == 100.0
+        assert len(catalog) == 59
+
+    def test_reload_recompiles_stored_skills_outside_load(self, db):
+        """load() only reads profiles; recompile_profiles() renormalizes them after a reload"""
+        registry = TaxonomyRegistry()
+        catalog = JobCatalog(JobMatchingEngine(registry=registry))
+        job = Job(id="JX", title="Developer", company="Acme")
+        profile = JobMatchProfile(job_id="JX")
+        catalog.compile_profile(job, profile, JobMatchProfileCreate(
+            required_skills=["snake", "Rust"], experience_required="0-2 years", location="Pune", salary_range=[]
+        ))
+        db.add_all([job, profile])
+        db.commit()
+
+        registry.load_data({"skills": {"Python": {"category": "Backend", "aliases": ["snake"]}}})
+        catalog.load(db)
+        assert not db.dirty
+        assert json.loads(profile.normalized_skills) == ["rust", "snake"]
+
+        version = catalog.version
+        assert catalog.recompile_profiles(db) == 1
+        assert json.loads(profile.normalized_skills) == ["python", "rust"]
+        assert catalog.version == version + 1
+        assert catalog.recompile_profiles(db) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,161 @@
+"""
+Unit tests for columnar (vectorized) batch scoring
+Checks that the vectorized path reproduces the per-job path exactly
+"""
+
+import random
+import numpy as np
+import pytest
+from matching_engine import (
+    JobMatchingEngine,
+    CandidateMatchProfile
+)
+from job_columns import JobColumns, round_scores
+from testing_helpers import make_jobs, match_payload, SKILL_POOL, LOCATIONS, TITLES
+
+
+class TestVectorizedMatching:
+    """Test suite for JobColumns and the vectorized matching path"""
+
+    @pytest.fixture
+    def engine(self):
+        return JobMatchingEngine()
+
+    @pytest.fixture
+    def candidate(self):
+        return CandidateMatchProfile(
+            skills=["Python", "FastAPI", "Docker", "React", "postgres"],
+            experience_years=2,
+            preferred_locations=["Bangalore", "Hyderabad"],
+            preferred_roles=["Backend Developer"],
+            expected_salary=950000
+        )
+
+    def assert_same_results(self, expected, actual):
+        assert actual.total_matches == expected.total_matches
+        assert [m.job_id for m in actual.matches] == [m.job_id for m in expected.matches]
+        for exp, act in zip(expected.matches, actual.matches):
+            assert act.match_score == exp.match_score
+            assert act.breakdown == exp.breakdown
+            assert sorted(act.matching_skills) == sorted(exp.matching_skills)
+            assert sorted(act.missing_skills) == sorted(exp.missing_skills)
+            assert act.recommendation_reason == exp.recommendation_reason
+
+    def test_vectorized_matches_per_job_path(self, engine, candidate):
+        """Vectorized scores, ordering and explanations match the per-job path"""
+        jobs = make_jobs(300)
+        expected = engine.match_candidate_to_jobs(candidate, jobs)
+        actual = engine.match_candidate_to_jobs(candidate, jobs, vectorized=True)
+        self.assert_same_results(expected, actual)
+
+    @pytest.mark.parametrize("experience_years,expected_salary,locations,roles", [
+        (0, 0, [], []),
+        (10, 5000000, ["Remote"], ["Developer"]),
+        (3, 1200000, ["Pune"], ["Frontend Developer", "DevOps Engineer"]),
+    ])
+    def test_vectorized_candidate_variants(self, engine, experience_years, expected_salary, locations, roles):
+        """Edge-case candidates score identically on both paths"""
+        candidate = CandidateMatchProfile(
+            skills=["JavaScript", "k8s", "Go"],
+            experience_years=experience_years,
+            preferred_locations=locations,
+            preferred_roles=roles,
+            expected_salary=expected_salary
+        )
+        jobs = make_jobs(150, seed=experience_years)
+        expected = engine.match_candidate_to_jobs(candidate, jobs)
+        actual = engine.match_candidate_to_jobs(candidate, jobs, vectorized=True)
+        self.assert_same_results(expected, actual)
+
+    def test_vectorized_empty_job_list(self, engine, candidate):
+        """An empty job list returns an empty response"""
+        response = engine.match_candidate_to_jobs(candidate, [], vectorized=True)
+        assert response.total_matches == 0
+        assert response.matches == []
+
+    def test_job_columns_layout(self, engine):
+        """Postings are compiled into per-column arrays"""
+        jobs = make_jobs(20)
+        columns = JobColumns.from_postings(engine, jobs)
+        assert len(columns) == 20
+        assert columns.exp_min.shape == (20,)
+        assert columns.location_ids.max() < len(columns.location_names)
+        assert int(columns.skill_counts.sum()) == len(columns.skill_cols)
+
+    def test_stream_builds_results_lazily(self, engine, candidate):
+        """Streaming yields the same ranking, building results on demand"""
+        jobs = make_jobs(120)
+        total, matches = engine.stream_candidate_to_jobs(candidate, JobColumns.from_postings(engine, jobs))
+        assert total == 120
+        first = next(matches)
+        expected = engine.match_candidate_to_jobs(candidate, jobs)
+        assert [first.job_id] + [m.job_id for m in matches] == [m.job_id for m in expected.matches]
+
+    def test_ndjson_stream_lines(self, engine, candidate):
+        """NDJSON output has one match per line and a final summary line"""
+        import json
+        import main
+        jobs = make_jobs(250)
+        total, matches = engine.stream_candidate_to_jobs(candidate, JobColumns.from_postings(engine, jobs), top_k=120)
+        chunks = list(main.ndjson_match_stream(total, matches))
+        lines = "".join(chunks).splitlines()
+        assert len(chunks) == 2
+        assert len(lines) == 121
+        assert json.loads(lines[0])["job_id"]
+        assert json.loads(lines[-1]) == {"total_matches": 250}
+
+    def test_round_scores_matches_builtin_round(self):
+        """Array rounding agrees with Python's round() including near-ties"""
+        values = np.array([66.666666, 0.285, 1.005, 2.675, 12.5, 3.125, 99.995, 100 / 3])
+        expected = [round(v, 2) for v in values.tolist()]
+        assert round_scores(values).tolist() == expected
+
+    def test_match_matrix_matches_per_candidate_ranking(self, engine):
+        """Bulk triples equal each candidate's own ranking, full and top-K"""
+        rng = random.Random(11)
+        jobs = make_jobs(150, seed=12)
+        candidates = [
+            CandidateMatchProfile(
+                skills=rng.sample(SKILL_POOL, rng.randint(1, 5)),
+                experience_years=rng.randint(0, 8),
+                preferred_locations=rng.sample(LOCATIONS, rng.randint(0, 2)),
+                preferred_roles=rng.sample(TITLES, rng.randint(0, 1)),
+                expected_salary=rng.choice([600000, 1200000])
+            )
+            for _ in range(25)
+        ]
+        position = {job.job_id: i for i, job in enumerate(jobs)}
+
+        full = engine.match_matrix(candidates, jobs)
+        top = engine.match_matrix(candidates, jobs, top_k=5)
+        floor = engine.match_matrix(candidates, jobs, min_score=70)
+        assert full.total_candidates == 25 and full.total_jobs == 150
+        assert len(full.matches) == 25 * 150
+
+        for candidate_idx, candidate in enumerate(candidates):
+            ranked = [
+                (position[m.job_id], m.match_score)
+                for m in engine.match_candidate_to_jobs(candidate, jobs).matches
+            ]
+            assert sorted((j, s) for c, j, s in full.matches if c == candidate_idx) == sorted(ranked)
+            assert [(j, s) for c, j, s in top.matches if c == candidate_idx] == ranked[:5]
+            assert sorted(j for c, j, s in floor.matches if c == candidate_idx) == sorted(
+                j for j, s in ranked if s >= 70
+            )
+
+    def test_matrix_endpoint_caps_pairs_without_top_k(self, monkeypatch):
+        """A min_score floor does not lift the pair cap; top_k does"""
+        import main
+        from fastapi.testclient import TestClient
+        monkeypatch.setattr(main, "MATCH_MATRIX_MAX_PAIRS", 20)
+        single = match_payload(10)
+        payload = {"candidates": [single["candidate"]] * 3, "jobs": single["jobs"]}
+        client = TestClient(main.app)
+        assert client.post("/api/match/matrix", json=payload).status_code == 400
+        assert client.post("/api/match/matrix?min_score=0", json=payload).status_code == 400
+        response = client.post("/api/match/matrix?top_k=2", json=payload)
+        assert response.status_code == 200 and len(response.json()["matches"]) == 6
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,128 @@
+"""
+Unit tests for the match-result cache
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Base, Job, JobMatchProfile
+from schemas import JobMatchProfileCreate
+from matching_engine import JobMatchingEngine, CandidateMatchProfile
+from job_catalog import JobCatalog
+from match_cache import (
+    MatchCache, candidate_fingerprint, jobs_fingerprint, estimate_size, SCOPE_CATALOG, SCOPE_JOBS
+)
+from testing_helpers import make_jobs, FakeClock
+
+
+class TestMatchCache:
+    """Test suite for MatchCache and its key fingerprints"""
+
+    @pytest.fixture
+    def engine(self):
+        return JobMatchingEngine()
+
+    @pytest.fixture
+    def candidate(self):
+        return CandidateMatchProfile(
+            skills=["Python", "FastAPI", "Docker"],
+            experience_years=3,
+            preferred_locations=["Bangalore", "Pune"],
+            preferred_roles=["Backend Developer"],
+            expected_salary=1000000
+        )
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    def response_for(self, engine, candidate, count=20):
+        return engine.match_candidate_to_jobs(candidate, make_jobs(count))
+
+    def test_candidate_fingerprint_is_canonical(self, engine, candidate):
+        """Reordered, aliased or differently cased profiles share one key"""
+        same = candidate.model_copy(update={
+            "skills": ["docker", "fast-api", "py", "Python"],
+            "preferred_locations": ["pune", " Bangalore "]
+        })
+        other = candidate.model_copy(update={"experience_years": 4})
+        assert candidate_fingerprint(engine, same) == candidate_fingerprint(engine, candidate)
+        assert candidate_fingerprint(engine, other) != candidate_fingerprint(engine, candidate)
+
+    def test_jobs_fingerprint_tracks_job_set(self):
+        jobs = make_jobs(10)
+        assert jobs_fingerprint(jobs) == jobs_fingerprint(make_jobs(10))
+        assert jobs_fingerprint(jobs) != jobs_fingerprint(jobs[:9])
+
+    def test_hits_and_misses(self, engine, candidate, clock):
+        """A repeated key is served from the cache without recomputing"""
+        cache = MatchCache(clock=clock)
+        key = cache.make_key(SCOPE_JOBS, "v1", candidate_fingerprint(engine, candidate), None)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return self.response_for(engine, candidate)
+
+        first = cache.get_or_compute(key, compute)
+        second = cache.get_or_compute(key, compute)
+        assert second is first and len(calls) == 1
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    def test_ttl_expiry(self, engine, candidate, clock):
+        cache = MatchCache(ttl_seconds=10, clock=clock)
+        cache.put(("k",), self.response_for(engine, candidate))
+        clock.now = 9.9
+        assert cache.get(("k",)) is not None
+        clock.now = 10.0
+        assert cache.get(("k",)) is None
+        assert cache.expirations == 1 and len(cache) == 0
+
+    def test_memory_bound_evicts_least_recently_used(self, engine, candidate, clock):
+        """Entries are evicted oldest-use first once the byte bound is exceeded"""
+        response = self.response_for(engine, candidate)
+        size = estimate_size(response)
+        cache = MatchCache(max_bytes=size * 2, clock=clock)
+        cache.put(("a",), response)
+        cache.put(("b",), response)
+        cache.get(("a",))
+        cache.put(("c",), response)
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) is not None and cache.get(("c",)) is not None
+        assert cache.evictions == 1
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+        cache.put(("huge",), self.response_for(engine, candidate, count=100))
+        assert cache.get(("huge",)) is None
+
+    def test_catalog_change_invalidates_catalog_entries(self, engine, candidate, clock):
+        """Changing the job catalog drops cached catalog matches but not other scopes"""
+        db_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=db_engine)
+        db = sessionmaker(bind=db_engine)()
+        catalog = JobCatalog(engine)
+        cache = MatchCache(clock=clock)
+        catalog.subscribe(lambda version: cache.invalidate(SCOPE_CATALOG))
+        catalog.load(db)
+
+        fingerprint = candidate_fingerprint(engine, candidate)
+        cache.put(cache.make_key(SCOPE_CATALOG, catalog.version, fingerprint), catalog.match(candidate))
+        cache.put(cache.make_key(SCOPE_JOBS, "v1", fingerprint), self.response_for(engine, candidate))
+
+        job = Job(id="J1", title="Backend Developer", company="c", description="d")
+        job.match_profile = catalog.compile_profile(job, JobMatchProfile(job_id="J1"), JobMatchProfileCreate(
+            required_skills=["Python"], experience_required="1-3 years", location="Pune", salary_range=[1, 2]
+        ))
+        db.add(job)
+        db.commit()
+        catalog.refresh(job)
+
+        assert len(cache) == 1 and cache.invalidations == 1
+        assert cache.get(cache.make_key(SCOPE_JOBS, "v1", fingerprint)) is not None
+        db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,103 @@
+"""
+Unit tests for the bounded match executor and event-loop responsiveness
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+import httpx
+import pytest
+from match_executor import BoundedExecutor, ExecutorSaturated
+from testing_helpers import match_payload
+
+
+class TestMatchExecutor:
+    """Test suite for BoundedExecutor and its use by the matching endpoints"""
+
+    def test_rejects_beyond_queue_depth(self):
+        """workers + max_queue submissions are admitted; the next one is rejected"""
+        executor = BoundedExecutor(workers=1, max_queue=1, retry_after=3)
+        release = threading.Event()
+
+        async def scenario():
+            first = asyncio.ensure_future(executor.run(release.wait))
+            second = asyncio.ensure_future(executor.run(lambda: "queued"))
+            await asyncio.sleep(0.05)
+            assert executor.stats()["running"] == 1 and executor.stats()["queued"] == 1
+            with pytest.raises(ExecutorSaturated) as error:
+                await executor.run(lambda: "rejected")
+            assert error.value.retry_after == 3
+            release.set()
+            return await first, await second, await executor.run(lambda: "admitted")
+
+        assert asyncio.run(scenario()) == (True, "queued", "admitted")
+        stats = executor.stats()
+        assert (stats["running"], stats["queued"], stats["completed"], stats["rejected"]) == (0, 0, 3, 1)
+        executor.shutdown()
+
+    def test_context_and_errors_propagate(self):
+        """Workers see the caller's context variables; exceptions reach the awaiting caller"""
+        executor = BoundedExecutor(workers=2, max_queue=0)
+        request_id = contextvars.ContextVar("request_id", default=None)
+
+        async def scenario():
+            request_id.set("r-1")
+            seen = await executor.run(request_id.get)
+            with pytest.raises(ValueError):
+                await executor.run(int, "not a number")
+            return seen
+
+        assert asyncio.run(scenario()) == "r-1"
+        assert executor.stats()["queued"] == 0
+        executor.shutdown()
+
+    def test_saturated_endpoint_returns_503(self, monkeypatch):
+        import main
+        executor = BoundedExecutor(workers=1, max_queue=0, retry_after=2)
+        release = threading.Event()
+        monkeypatch.setattr(main, "match_executor", executor)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                blocker = asyncio.ensure_future(executor.run(release.wait))
+                await asyncio.sleep(0.05)
+                response = await client.post("/matches", json=match_payload(3))
+                release.set()
+                await blocker
+                return response
+
+        response = asyncio.run(scenario())
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "2"
+        executor.shutdown()
+
+    def test_health_responsive_during_large_match(self):
+        """/health keeps answering quickly while a large /matches request is being scored"""
+        import main
+        payload = match_payload(20000)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                started = time.perf_counter()
+                match = asyncio.ensure_future(client.post("/matches?top_k=10", json=payload))
+                latencies = []
+                while not match.done():
+                    sent = time.perf_counter()
+                    assert (await client.get("/health")).status_code == 200
+                    latencies.append(time.perf_counter() - sent)
+                    await asyncio.sleep(0.005)
+                response = await match
+                return response, time.perf_counter() - started, latencies
+
+        response, duration, latencies = asyncio.run(scenario())
+        assert response.status_code == 200 and len(response.json()["matches"]) == 10
+        # With scoring on the event loop, /health would only answer once the match finished
+        assert len(latencies) >= 5
+        assert max(latencies) < duration / 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,140 @@
+"""
+Unit tests for incremental match sessions
+Every incremental update must rank exactly like a fresh catalog match
+"""
+
+import random
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Base, Job, JobMatchProfile
+from schemas import JobMatchProfileCreate
+from matching_engine import JobMatchingEngine, CandidateMatchProfile, CatalogFilters, ProfileDelta
+from job_catalog import JobCatalog
+from match_session import MatchSession, MatchSessionStore
+from testing_helpers import make_jobs, SKILL_POOL, LOCATIONS, FakeClock
+
+
+def add_job(db, catalog, posting):
+    job = Job(id=posting.job_id, title=posting.title, company=posting.company)
+    profile = JobMatchProfile(job_id=posting.job_id)
+    job.match_profile = catalog.compile_profile(job, profile, JobMatchProfileCreate(
+        required_skills=posting.required_skills,
+        experience_required=posting.experience_required,
+        location=posting.location,
+        salary_range=posting.salary_range
+    ))
+    db.add(job)
+    db.commit()
+    return job
+
+
+class TestMatchSession:
+    """Test suite for MatchSession and MatchSessionStore"""
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    @pytest.fixture
+    def catalog(self, db):
+        catalog = JobCatalog(JobMatchingEngine())
+        for posting in make_jobs(200, seed=13):
+            add_job(db, catalog, posting)
+        catalog.load(db)
+        return catalog
+
+    @pytest.fixture
+    def candidate(self):
+        return CandidateMatchProfile(
+            skills=["Python", "React", "k8s"],
+            experience_years=3,
+            preferred_locations=["Bangalore"],
+            preferred_roles=["Backend Developer"],
+            expected_salary=1100000
+        )
+
+    def assert_same_as_fresh(self, catalog, session, filters=None):
+        expected = catalog.match(session.candidate, filters)
+        actual = session.response()
+        assert actual.total_matches == expected.total_matches
+        assert [m.model_dump() for m in actual.matches] == [m.model_dump() for m in expected.matches]
+
+    def test_random_edits_match_full_rescore(self, catalog, candidate):
+        """Skill, location, salary, role and experience edits rank like a fresh match"""
+        rng = random.Random(21)
+        session = MatchSession(catalog, candidate)
+        for _ in range(40):
+            delta = {}
+            if rng.random() < 0.8:
+                delta["skills_added"] = rng.sample(SKILL_POOL + ["py", "Rust"], rng.randint(0, 2))
+                delta["skills_removed"] = rng.sample(session.candidate.skills, rng.randint(0, 1))
+            if rng.random() < 0.2:
+                delta["preferred_locations"] = rng.sample(LOCATIONS, rng.randint(0, 2))
+            if rng.random() < 0.2:
+                delta["expected_salary"] = rng.randrange(300000, 2500000, 100000)
+            if rng.random() < 0.1:
+                delta["experience_years"] = rng.randint(0, 10)
+            if rng.random() < 0.1:
+                delta["preferred_roles"] = [rng.choice(["Backend Developer", "Data Engineer"])]
+            try:
+                session.update(ProfileDelta(**delta))
+            except ValueError:
+                continue  # would remove the last skill
+            self.assert_same_as_fresh(catalog, session)
+
+    def test_skill_edit_rescores_affected_rows_only(self, catalog, candidate):
+        session = MatchSession(catalog, candidate)
+        response = session.update(ProfileDelta(skills_added=["Docker"]))
+        requiring = len(catalog.columns().rows_with_skill(catalog.engine.vocabulary.skill_id("docker")))
+        assert response.recomputed == {"skill": requiring}
+        assert 0 < requiring < len(catalog)
+
+        response = session.update(ProfileDelta(expected_salary=900000))
+        assert response.recomputed == {"salary": len(catalog)}
+
+        # Aliases of a skill the candidate already has change nothing
+        assert session.update(ProfileDelta(skills_added=["py", "python"])).recomputed == {}
+        with pytest.raises(ValueError):
+            session.update(ProfileDelta(skills_removed=["python", "react", "kubernetes", "docker"]))
+
+    def test_filters_and_catalog_changes(self, db, catalog, candidate):
+        """Filters stay applied; a catalog change triggers a full rescore"""
+        filters = CatalogFilters(locations=["Bangalore", "Remote"])
+        session = MatchSession(catalog, candidate, filters)
+        self.assert_same_as_fresh(catalog, session, filters)
+
+        posting = make_jobs(1, seed=99)[0].model_copy(update={"job_id": "NEW", "location": "Remote"})
+        catalog.refresh(add_job(db, catalog, posting))
+        response = session.update(ProfileDelta(skills_added=["Go"]))
+        assert response.catalog_version == catalog.version
+        assert response.recomputed["skill"] == len(catalog)
+        assert "NEW" in {m.job_id for m in response.matches}
+        self.assert_same_as_fresh(catalog, session, filters)
+
+    def test_store_expiry_and_memory_bound(self, catalog, candidate):
+        clock = FakeClock()
+        store = MatchSessionStore(ttl_seconds=60, clock=clock)
+        session = store.create(catalog, candidate)
+        clock.now = 59
+        assert store.get(session.session_id) is session
+        clock.now = 118
+        assert store.get(session.session_id) is session  # use extends the lifetime
+        clock.now = 180
+        assert store.get(session.session_id) is None and store.expirations == 1
+
+        store = MatchSessionStore(max_bytes=session.nbytes * 2, clock=clock)
+        first, second, third = (store.create(catalog, candidate) for _ in range(3))
+        assert store.get(first.session_id) is None and store.evictions == 1
+        assert store.get(third.session_id) is third
+        assert store.delete(second.session_id) and not store.delete(second.session_id)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
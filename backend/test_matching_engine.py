@@ -9,8 +9,10 @@ from matching_engine import (
     CandidateMatchProfile,
     JobPostingForMatch,
     EducationModel,
-    MatchBreakdown
+    MatchBreakdown,
+    parse_match_fields
 )
+from testing_helpers import make_jobs
 
 
 class TestJobMatchingEngine:
@@ -354,6 +356,52 @@ class TestJobMatchingEngine:
         
         result = engine.match_candidate_to_job(candidate, job)
         assert "No skill matches" in result.recommendation_reason
+    
+    # ========================================================================
+    # TEST 9: FIELD PROJECTION
+    # ========================================================================
+    
+    def test_parse_match_fields(self):
+        """Comma-separated projections are validated; empty means everything"""
+        assert parse_match_fields("score, skills") == {"score", "skills"}
+        assert parse_match_fields(None) == parse_match_fields("") == {"score", "breakdown", "skills", "reason"}
+        with pytest.raises(ValueError):
+            parse_match_fields("score,salary")
+    
+    def test_projection_omits_unrequested_parts(self, engine, sample_candidate, sample_job):
+        """Only requested parts are built; the score is unchanged"""
+        full = engine.match_candidate_to_job(sample_candidate, sample_job)
+        score_only = engine.match_candidate_to_job(sample_candidate, sample_job, fields=frozenset({"score"}))
+        assert score_only.match_score == full.match_score
+        assert score_only.breakdown is None
+        assert score_only.matching_skills is None and score_only.missing_skills is None
+        assert score_only.recommendation_reason is None
+        
+        reason_only = engine.match_candidate_to_job(sample_candidate, sample_job, fields=frozenset({"reason"}))
+        assert reason_only.recommendation_reason == full.recommendation_reason
+        assert reason_only.matching_skills is None
+    
+    def test_projection_matches_full_results_on_every_path(self, engine, sample_candidate):
+        """Per-job, top-K and vectorized paths project the same values"""
+        jobs = make_jobs(200, seed=8)
+        full = engine.match_candidate_to_jobs(sample_candidate, jobs).matches
+        projections = {
+            "score": set(),
+            "breakdown": {"breakdown"},
+            "skills": {"matching_skills", "missing_skills"},
+            "reason": {"recommendation_reason"},
+        }
+        for field, attributes in projections.items():
+            expected = [m.model_dump(include={"job_id", "match_score"} | attributes) for m in full]
+            for kwargs in ({}, {"top_k": len(jobs)}, {"vectorized": True}):
+                response = engine.match_candidate_to_jobs(
+                    sample_candidate, jobs, fields=frozenset({field}), **kwargs
+                )
+                projected = [
+                    m.model_dump(exclude_none=True, exclude={"job_title", "company"})
+                    for m in response.matches
+                ]
+                assert projected == expected
 
 
 # ============================================================================
@@ -0,0 +1,106 @@
+"""
+Unit tests for runtime metrics (registry, exposition format, request attribution)
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from metrics import (
+    Counter, Histogram, MetricsRegistry, MetricsMiddleware, instrument_engine, metrics
+)
+from matching_engine import JobMatchingEngine, CandidateMatchProfile
+from job_columns import JobColumns
+from testing_helpers import make_jobs
+
+
+class TestMetrics:
+    """Test suite for metrics"""
+
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_exposition_format(self):
+        """Counters render per label set; histogram buckets are cumulative with +Inf"""
+        counter = Counter("demo_total", "Demo counter", ("kind",))
+        counter.inc('a"b')
+        counter.inc('a"b', amount=2)
+        assert counter.value('a"b') == 3
+        assert list(counter.samples()) == ['demo_total{kind="a\\"b"} 3']
+
+        histogram = Histogram("demo_seconds", "Demo histogram", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, "x")
+        assert list(histogram.samples()) == [
+            'demo_seconds_bucket{stage="x",le="0.1"} 1',
+            'demo_seconds_bucket{stage="x",le="1"} 2',
+            'demo_seconds_bucket{stage="x",le="+Inf"} 3',
+            'demo_seconds_sum{stage="x"} 5.55',
+            'demo_seconds_count{stage="x"} 3',
+        ]
+
+    def test_request_attribution(self, registry):
+        """Latency, status, DB queries and jobs scored are recorded per route template"""
+        db_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        instrument_engine(db_engine, registry)
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware, registry=registry)
+
+        @app.get("/items/{item_id}")
+        def read_item(item_id: int):
+            with db_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            registry.record_jobs_scored("demo", 25)
+            return {"id": item_id}
+
+        client = TestClient(app)
+        for item_id in (1, 2, 3):
+            assert client.get(f"/items/{item_id}").status_code == 200
+        assert client.get("/items/abc").status_code == 422
+        assert client.get("/missing").status_code == 404
+
+        assert registry.http_requests.value("GET", "/items/{item_id}", "200") == 3
+        assert registry.http_requests.value("GET", "/items/{item_id}", "422") == 1
+        assert registry.http_requests.value("GET", "unmatched", "404") == 1
+        assert registry.http_latency.count("GET", "/items/{item_id}") == 4
+        assert registry.http_db_queries.total("/items/{item_id}") == 6
+        assert registry.http_jobs_scored.total("/items/{item_id}") == 75
+        assert registry.db_queries.value("SELECT") == 6
+        assert registry.jobs_scored.value("demo") == 75
+
+        rendered = registry.render()
+        assert "# TYPE http_request_duration_seconds histogram" in rendered
+        assert 'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 3' in rendered
+        assert "/items/1" not in rendered
+
+    def test_work_outside_requests_is_not_attributed(self, registry):
+        registry.record_jobs_scored("demo", 10)
+        with registry.request_scope() as stats:
+            registry.record_jobs_scored("demo", 4)
+            registry.record_query("SELECT", 0.001)
+        assert (stats.jobs_scored, stats.db_queries) == (4, 1)
+        assert registry.jobs_scored.value("demo") == 14
+
+    def test_pipeline_stage_timings(self):
+        """Vectorized matching times every factor plus ranking and serialization"""
+        engine = JobMatchingEngine()
+        candidate = CandidateMatchProfile(
+            skills=["Python"], experience_years=2, preferred_locations=["Pune"],
+            preferred_roles=["Backend Developer"], expected_salary=800000
+        )
+        columns = JobColumns.from_postings(engine, make_jobs(20))
+        before = metrics.jobs_scored.value("api_match")
+        engine.match_candidate_to_jobs_vectorized(candidate, columns, top_k=5)
+
+        assert metrics.jobs_scored.value("api_match") == before + 20
+        for stage in ("skill", "location", "salary", "experience", "role"):
+            assert metrics.stage_latency.count("api_match", stage) >= 1
+        assert metrics.stage_latency.count("columnar", "ranking") >= 1
+        assert metrics.stage_latency.count("columnar", "serialization") >= 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
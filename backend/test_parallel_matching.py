@@ -0,0 +1,58 @@
+"""
+Unit tests for multi-process sharded matching
+"""
+
+import pytest
+from matching_engine import JobMatchingEngine, CandidateMatchProfile
+from parallel_matching import ParallelMatcher
+from testing_helpers import make_jobs
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    """Two-worker pool shared by the module's tests"""
+    matcher = ParallelMatcher(workers=2, shard_size=70)
+    yield matcher
+    matcher.shutdown()
+
+
+class TestParallelMatcher:
+    """Test suite for ParallelMatcher"""
+
+    @pytest.fixture
+    def candidate(self):
+        return CandidateMatchProfile(
+            skills=["Python", "React", "Docker", "AWS"],
+            experience_years=4,
+            preferred_locations=["Remote", "Pune"],
+            preferred_roles=["DevOps Engineer"],
+            expected_salary=1300000
+        )
+
+    def test_sharded_results_identical_to_serial(self, matcher, candidate):
+        """Merged shard rankings equal the serial ranking, including ties"""
+        jobs = make_jobs(500, seed=21)
+        serial = JobMatchingEngine().match_candidate_to_jobs(candidate, jobs)
+        parallel = matcher.match_candidate_to_jobs(candidate, jobs)
+        assert parallel.total_matches == serial.total_matches
+        assert [(m.job_id, m.match_score) for m in parallel.matches] == \
+            [(m.job_id, m.match_score) for m in serial.matches]
+
+    def test_sharded_top_k(self, matcher, candidate):
+        """Each shard returns its local top-K and the merge keeps the global top-K"""
+        jobs = make_jobs(500, seed=22)
+        serial = JobMatchingEngine().match_candidate_to_jobs(candidate, jobs)
+        parallel = matcher.match_candidate_to_jobs(candidate, jobs, top_k=25)
+        assert [m.job_id for m in parallel.matches] == [m.job_id for m in serial.matches[:25]]
+        assert parallel.total_matches == 500
+
+    def test_small_list_runs_in_process(self, candidate):
+        """Lists within one shard never start the pool"""
+        matcher = ParallelMatcher(workers=2, shard_size=100)
+        response = matcher.match_candidate_to_jobs(candidate, make_jobs(10))
+        assert response.total_matches == 10
+        assert matcher._executor is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,109 @@
+"""
+Unit tests for top-K ranking with score upper bounds
+"""
+
+import asyncio
+import random
+import pytest
+from ranking import select_top_k
+from matching_engine import JobMatchingEngine, CandidateMatchProfile
+from testing_helpers import make_jobs
+
+
+class TestTopKRanking:
+    """Test suite for select_top_k and the top_k matching paths"""
+
+    @pytest.fixture
+    def engine(self):
+        return JobMatchingEngine()
+
+    @pytest.fixture
+    def candidate(self):
+        return CandidateMatchProfile(
+            skills=["Python", "FastAPI", "Docker", "AWS"],
+            experience_years=3,
+            preferred_locations=["Bangalore"],
+            preferred_roles=["Backend Developer"],
+            expected_salary=1000000
+        )
+
+    def test_select_top_k_matches_stable_sort(self):
+        """Heap selection equals the first k items of a stable descending sort"""
+        rng = random.Random(3)
+        scores = [rng.choice([10.0, 20.0, 30.5, 30.5, 40.0]) for _ in range(200)]
+        expected = sorted(range(len(scores)), key=lambda i: -scores[i])[:15]
+        ranked = select_top_k([s + 1 for s in scores], 15, lambda i: scores[i])
+        assert [i for _, i in ranked] == expected
+
+    def test_select_top_k_skips_low_bounds(self):
+        """Items whose bound cannot beat the k-th best are never scored"""
+        scored = []
+        bounds = [100, 90, 80, 5, 4, 3]
+        ranked = select_top_k(bounds, 2, lambda i: scored.append(i) or bounds[i] - 1)
+        assert [i for _, i in ranked] == [0, 1]
+        assert 3 not in scored and 4 not in scored and 5 not in scored
+
+    def test_engine_top_k_equals_full_ranking_prefix(self, engine, candidate):
+        """Per-job and vectorized top_k return the head of the full ranking"""
+        jobs = make_jobs(400, seed=5)
+        full = engine.match_candidate_to_jobs(candidate, jobs)
+        for top_k in (1, 20, 50):
+            expected = [(m.job_id, m.match_score) for m in full.matches[:top_k]]
+            heap = engine.match_candidate_to_jobs(candidate, jobs, top_k=top_k)
+            vectorized = engine.match_candidate_to_jobs(candidate, jobs, vectorized=True, top_k=top_k)
+            assert [(m.job_id, m.match_score) for m in heap.matches] == expected
+            assert [(m.job_id, m.match_score) for m in vectorized.matches] == expected
+            assert heap.total_matches == vectorized.total_matches == len(jobs)
+
+    def test_top_k_results_reuse_ranking_scores(self, engine, candidate, monkeypatch):
+        """Each job is scored at most once; returned results equal the full per-job results"""
+        jobs = make_jobs(300, seed=4)
+        expected = engine.match_candidate_to_jobs(candidate, jobs).matches[:10]
+        scored = []
+        score_factors = engine.score_factors
+
+        def counted(candidate, job, skill_score):
+            scored.append(job.job_id)
+            return score_factors(candidate, job, skill_score)
+
+        monkeypatch.setattr(engine, "score_factors", counted)
+        monkeypatch.setattr(engine, "match_candidate_to_job", None)
+        response = engine.match_candidate_to_jobs(candidate, jobs, top_k=10)
+        assert len(scored) == len(set(scored)) < len(jobs)
+        assert response.matches == expected
+
+    def test_top_k_larger_than_job_list(self, engine, candidate):
+        jobs = make_jobs(5)
+        response = engine.match_candidate_to_jobs(candidate, jobs, top_k=50)
+        assert len(response.matches) == 5
+
+    def test_matches_endpoint_top_k(self):
+        """/matches with top_k returns the head of the full ranking"""
+        import main
+        rng = random.Random(9)
+        jobs = [
+            main.JobPosting(
+                job_id=f"J{i}",
+                title="Developer",
+                required_skills=rng.sample(["python", "react", "sql", "java", "docker"], 2),
+                experience_required=rng.choice(["0-2 years", "3-5 years"]),
+                location=rng.choice(["Pune", "Bangalore"]),
+                salary_range=[500000, rng.choice([600000, 900000, 1200000])],
+                company="c"
+            )
+            for i in range(100)
+        ]
+        payload = main.MatchRequest(
+            candidate=main.CandidateMatchProfile(
+                skills=["Python", "SQL"], experience_years=1, preferred_locations=["Pune"],
+                preferred_roles=[], expected_salary=800000
+            ),
+            jobs=jobs
+        )
+        full = asyncio.run(main.get_matches(payload, top_k=None))["matches"]
+        top = asyncio.run(main.get_matches(payload, top_k=10))["matches"]
+        assert [m["job_id"] for m in top] == [m["job_id"] for m in full[:10]]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,152 @@
+"""
+Unit tests for the unified scoring pipeline
+Checks that exact and fast factor variants agree and that the profiles
+reproduce the /api/match and /matches scores
+"""
+
+import asyncio
+import numpy as np
+import pytest
+from matching_engine import JobMatchingEngine, CandidateMatchProfile
+from scoring_pipeline import (
+    FACTORS, PROFILES, Factor, PreparedJobs, ScoringProfile, parse_variants
+)
+from testing_helpers import make_jobs
+
+
+class TestScoringPipeline:
+    """Test suite for ScoringPipeline, its factors and profiles"""
+
+    @pytest.fixture
+    def engine(self):
+        return JobMatchingEngine()
+
+    @pytest.fixture
+    def candidate(self):
+        return CandidateMatchProfile(
+            skills=["Python", "FastAPI", "Docker", "react.js"],
+            experience_years=3,
+            preferred_locations=["Bangalore", "Remote"],
+            preferred_roles=["Backend Developer"],
+            expected_salary=1200000
+        )
+
+    @pytest.fixture
+    def jobs(self):
+        return [job for job in make_jobs(300) if job.salary_range]
+
+    def all_variants(self, profile, variant):
+        return profile.with_variants({factor: variant for factor in profile.weights})
+
+    def test_engine_profile_variants_agree(self, engine, candidate, jobs):
+        """Row-by-row and columnar factors give identical /api/match scores"""
+        profile = PROFILES["api_match"]
+        exact = engine.pipeline.score(candidate, PreparedJobs(engine, jobs), self.all_variants(profile, "exact"))
+        fast = engine.pipeline.score(candidate, PreparedJobs(engine, jobs), self.all_variants(profile, "fast"))
+        for factor in profile.weights:
+            np.testing.assert_array_equal(exact.factors[factor], fast.factors[factor])
+        np.testing.assert_array_equal(exact.total, fast.total)
+        np.testing.assert_array_equal(exact.states["skill"].matched, fast.states["skill"].matched)
+
+        per_job = [match.match_score for match in engine.match_candidate_to_jobs(candidate, jobs).matches]
+        assert sorted(exact.total.tolist(), reverse=True) == per_job
+
+    def test_partial_skill_profile(self, engine, candidate, jobs):
+        """Partial credit never lowers a skill score, and its variants agree"""
+        profile = PROFILES["api_match_partial"]
+        assert profile.slots["skill"] == "skill_partial"
+        exact = engine.pipeline.score(candidate, PreparedJobs(engine, jobs), self.all_variants(profile, "exact"))
+        fast = engine.pipeline.score(candidate, PreparedJobs(engine, jobs), self.all_variants(profile, "fast"))
+        np.testing.assert_array_equal(exact.factors["skill_partial"], fast.factors["skill_partial"])
+        np.testing.assert_array_equal(exact.states["skill_partial"].matched, fast.states["skill_partial"].matched)
+
+        standard = engine.pipeline.score(candidate, PreparedJobs(engine, jobs), PROFILES["api_match"])
+        assert (fast.factors["skill_partial"] >= standard.factors["skill"]).all()
+        assert (fast.factors["skill_partial"] > standard.factors["skill"]).any()
+        np.testing.assert_array_equal(fast.states["skill_partial"].matched, standard.states["skill"].matched)
+
+    def test_engine_profile_uses_engine_weights(self):
+        assert PROFILES["api_match"].weights == JobMatchingEngine.WEIGHTS
+
+    def test_matches_profile_variants(self, engine, candidate, jobs):
+        """Only the approximate skill factor may differ between variants"""
+        profile = PROFILES["matches"]
+        prepared = PreparedJobs(engine, jobs)
+        exact = engine.pipeline.score(candidate, prepared, self.all_variants(profile, "exact"))
+        fast = engine.pipeline.score(candidate, prepared, self.all_variants(profile, "fast"))
+        for factor in ("location_contains", "salary_ceiling", "experience_window"):
+            np.testing.assert_array_equal(exact.factors[factor], fast.factors[factor])
+        assert (fast.factors["skill_containment"] <= exact.factors["skill_containment"]).all()
+
+        # "react.js" contains "react": a containment match, but not an exact one
+        react = PreparedJobs(engine, [jobs[0].model_copy(update={"required_skills": ["React"]})])
+        assert engine.pipeline.score(candidate, react, self.all_variants(profile, "exact")).factors["skill_containment"][0] == 100
+        assert engine.pipeline.score(candidate, react, self.all_variants(profile, "fast")).factors["skill_containment"][0] == 0
+
+    def test_matches_gate(self, engine, candidate, jobs):
+        """Jobs with under 10% skill coverage score 0 in the /matches profile"""
+        scores = engine.pipeline.score(candidate, PreparedJobs(engine, jobs), PROFILES["matches"])
+        gated = scores.factors["skill_containment"] < 10
+        assert gated.any()
+        assert (scores.total[gated] == 0).all()
+        assert (scores.total[~gated] > 0).all()
+
+    def test_custom_factor(self, engine, candidate, jobs, monkeypatch):
+        """New factors plug in through the registry and are weighted like built-ins"""
+        class CompanyFactor(Factor):
+            name = "company"
+
+            def exact(self, state, candidate, jobs, row):
+                return 100.0 if jobs.postings[row].company.endswith("1") else 0.0
+
+        class IncompleteFactor(Factor):
+            name = "incomplete"
+
+        with pytest.raises(TypeError):
+            IncompleteFactor(engine)
+
+        monkeypatch.setitem(FACTORS, "company", CompanyFactor)
+        weights = {**PROFILES["api_match"].weights, "company": 0.5}
+        profile = ScoringProfile("custom", weights, round_factors=2)
+        base = engine.pipeline.score(candidate, PreparedJobs(engine, jobs), PROFILES["api_match"])
+        scores = engine.pipeline.score(candidate, PreparedJobs(engine, jobs), profile)
+        expected = np.round(base.raw_total + scores.factors["company"] * 0.5, 2)
+        np.testing.assert_allclose(scores.total, expected)
+
+    def test_profile_validation(self):
+        with pytest.raises(ValueError):
+            ScoringProfile("bad", {"nope": 1.0})
+        with pytest.raises(ValueError):
+            PROFILES["matches"].with_variants({"skill": "fast"})
+        with pytest.raises(ValueError):
+            PROFILES["matches"].with_variants({"skill_containment": "approx"})
+        assert parse_variants(" skill_containment=fast, salary_ceiling = exact ") == {
+            "skill_containment": "fast", "salary_ceiling": "exact"
+        }
+        with pytest.raises(ValueError):
+            parse_variants("skill_containment")
+
+    def test_matches_endpoint_variants(self):
+        """/matches accepts variant overrides and rejects unknown ones"""
+        import main
+        from fastapi import HTTPException
+        payload = main.MatchRequest(
+            candidate=main.CandidateMatchProfile(
+                skills=["react.js"], experience_years=2, preferred_locations=["Pune"],
+                preferred_roles=[], expected_salary=800000
+            ),
+            jobs=[main.JobPosting(
+                job_id="1", title="Frontend", required_skills=["React"], experience_required="1-3 years",
+                location="Pune", salary_range=[1, 900000], company="c"
+            )]
+        )
+        exact = asyncio.run(main.get_matches(payload, top_k=None))["matches"][0]
+        fast = asyncio.run(main.get_matches(payload, top_k=None, variants="skill_containment=fast"))["matches"][0]
+        assert exact["match_score"] == 100.0 and exact["missing_skills"] == []
+        assert fast["match_score"] == 0 and fast["recommendation_reason"].startswith("Not a fit")
+        with pytest.raises(HTTPException):
+            asyncio.run(main.get_matches(payload, top_k=None, variants="role=fast"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
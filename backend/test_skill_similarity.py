@@ -0,0 +1,94 @@
+"""
+Unit tests for the precomputed skill-similarity matrix and partial skill credit
+"""
+
+import numpy as np
+import pytest
+from matching_engine import JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch
+from scoring_pipeline import PROFILES
+from skill_similarity import SkillSimilarity, CREDIT_SUCCESSOR, CREDIT_PREREQUISITE, CREDIT_SAME_CATEGORY
+from taxonomy_registry import CompiledTaxonomy, TaxonomyRegistry
+
+
+TAXONOMY = {"skills": {
+    "Python": {"category": "Backend"},
+    "FastAPI": {"category": "Backend", "prerequisites": ["Python"]},
+    "Docker": {"category": "DevOps"},
+    "Kubernetes": {"category": "DevOps", "aliases": ["k8s"], "prerequisites": ["Docker"]},
+    "Figma": {"category": "Design"},
+}}
+
+
+class TestSkillSimilarity:
+    """Test suite for SkillSimilarity and the skill_partial factor"""
+
+    @pytest.fixture
+    def taxonomy(self):
+        return CompiledTaxonomy(TAXONOMY, 1)
+
+    def test_credits_from_links_and_categories(self, taxonomy):
+        """Successor, prerequisite and same-category credit; the best relation wins"""
+        similarity = taxonomy.skill_similarity
+        assert similarity.similarity("FastAPI", "Python") == CREDIT_SUCCESSOR
+        assert similarity.similarity("Python", "FastAPI") == CREDIT_PREREQUISITE
+        assert similarity.similarity("k8s", "Docker") == CREDIT_SUCCESSOR
+        assert similarity.similarity("Docker", "Kubernetes") == CREDIT_PREREQUISITE
+        assert similarity.similarity("Python", "Python") == 1.0
+        assert similarity.similarity("Figma", "Docker") == 0.0
+        assert similarity.similarity("Rust", "Python") == 0.0
+
+        # Only the two prerequisite pairs are stored (both directions); categories are a column
+        assert similarity.nnz == 4
+        assert taxonomy.skill_similarity is similarity
+
+    def test_credit_vector_takes_best_per_skill(self, taxonomy):
+        vocabulary = taxonomy.vocabulary
+        mask = np.zeros(len(vocabulary), dtype=bool)
+        mask[[vocabulary.skill_id("fastapi"), vocabulary.skill_id("docker")]] = True
+        credit = taxonomy.skill_similarity.credits(mask)
+        expected = {
+            "python": CREDIT_SUCCESSOR, "fastapi": 1.0, "docker": 1.0,
+            "kubernetes": CREDIT_PREREQUISITE, "figma": 0.0,
+        }
+        assert {name: credit[vocabulary.skill_id(name)] for name in expected} == expected
+
+    def test_partial_credit_engine(self, tmp_path):
+        """An engine on the partial profile scores related skills; the default engine does not"""
+        registry = TaxonomyRegistry(str(tmp_path / "taxonomy.json"))
+        registry.load_data(TAXONOMY)
+        partial = JobMatchingEngine(registry=registry, profile=PROFILES["api_match_partial"])
+        standard = JobMatchingEngine(registry=registry)
+        candidate = CandidateMatchProfile(
+            skills=["FastAPI", "Docker"], experience_years=2, preferred_locations=["Pune"],
+            preferred_roles=[], expected_salary=0
+        )
+        job = JobPostingForMatch(
+            job_id="J1", title="Platform Engineer", required_skills=["Python", "Kubernetes", "Figma", "Docker"],
+            experience_required="1-3 years", location="Pune", salary_range=[], company="c"
+        )
+        partial_match = partial.match_candidate_to_jobs(candidate, [job]).matches[0]
+        standard_match = standard.match_candidate_to_jobs(candidate, [job]).matches[0]
+
+        assert standard_match.breakdown.skill_match == 25.0
+        assert partial_match.breakdown.skill_match == round((CREDIT_SUCCESSOR + CREDIT_PREREQUISITE + 0 + 1) / 4 * 100, 2)
+        assert partial_match.matching_skills == standard_match.matching_skills == ["docker"]
+        assert partial_match.match_score > standard_match.match_score
+        assert standard_match.recommendation_reason.startswith("Strong skill alignment with 1/4 matching skills. Preferred")
+        assert f"Related skills credited for a {partial_match.breakdown.skill_match:g}% skill match." in \
+            partial_match.recommendation_reason
+
+        # Without exact matches the reason names the related-skill credit instead of "No skill matches"
+        candidate = candidate.model_copy(update={"skills": ["FastAPI"]})
+        reason = partial.match_candidate_to_jobs(candidate, [job]).matches[0].recommendation_reason
+        assert reason.startswith("No exact skill matches; related skills credited")
+        assert standard.match_candidate_to_jobs(candidate, [job]).matches[0].recommendation_reason.startswith(
+            "No skill matches. Missing 4 required skills."
+        )
+
+        # A new taxonomy version gets its own matrix
+        registry.load_data({"skills": {**TAXONOMY["skills"], "Helm": {"category": "DevOps"}}})
+        assert registry.current.skill_similarity.similarity("Helm", "Docker") == CREDIT_SAME_CATEGORY
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
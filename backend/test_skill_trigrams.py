@@ -0,0 +1,71 @@
+"""
+Unit tests for the trigram skill index
+"""
+
+import pytest
+import skill_vocabulary
+from skill_trigrams import TrigramIndex, trigrams, MAX_QUERY_LENGTH
+from taxonomy_registry import CompiledTaxonomy, taxonomy_registry
+
+
+class TestTrigramIndex:
+    """Test suite for TrigramIndex"""
+
+    @pytest.fixture
+    def index(self):
+        return TrigramIndex(taxonomy_registry.current.aliases)
+
+    def test_resolves_variants_and_typos(self, index):
+        """Versioned, concatenated, misspelled and qualified names reach their canonical skill"""
+        cases = {
+            "postgres 15": "postgresql",
+            "reactjs": "react",
+            "kubernets": "kubernetes",
+            "typescipt": "typescript",
+            "python3": "python",
+            "node.js 18": "nodejs",
+            "java script": "javascript",
+            "springboot": "spring boot",
+        }
+        for raw, expected in cases.items():
+            assert index.lookup(raw) == expected, raw
+
+    def test_unrelated_skills_stay_unknown(self, index):
+        """Below the threshold nothing is returned; short aliases are exact-only"""
+        for raw in ("rust", "nosql", "graphql", "html", "excel", "go", "jsx", ""):
+            assert index.lookup(raw) is None, raw
+        strict = TrigramIndex(taxonomy_registry.current.aliases, threshold=0.95)
+        assert strict.lookup("kubernets") is None
+
+    def test_related_skills_are_not_collapsed(self, index):
+        """Distinct skills that contain or resemble a taxonomy skill stay unknown"""
+        for raw in (
+            "react native", "reactive programming", "reactive", "sql server",
+            "javafx", "docker compose", "aws lambda", "k8s admin"
+        ):
+            assert index.lookup(raw) is None, raw
+
+    def test_ambiguous_spelling_needs_margin(self):
+        """A close second-best name makes the spelling ambiguous"""
+        index = TrigramIndex({"postgresql": "postgresql", "postgres-xl": "postgres-xl"})
+        assert index.best("postgresq")[1] == "postgresql"
+        assert index.lookup("postgresq") is None
+        assert TrigramIndex({"postgresql": "postgresql"}).lookup("postgresq") == "postgresql"
+
+    def test_similarity_and_bounds(self, index):
+        assert trigrams("ab") == {"  a", " ab", "ab "}
+        score, canonical = index.best("docker")
+        assert (score, canonical) == (1.0, "docker")
+        # Over-long input is truncated, so the work per lookup stays bounded
+        assert index.lookup("kubernetes " + "x" * 10 * MAX_QUERY_LENGTH) == "kubernetes"
+
+    def test_built_per_taxonomy_version(self, monkeypatch):
+        """Each compiled taxonomy resolves against its own names"""
+        monkeypatch.setattr(skill_vocabulary, "FUZZY_MATCHING", True)
+        taxonomy = CompiledTaxonomy({"skills": {"Terraform": {"aliases": ["tf"]}}}, 1)
+        assert taxonomy.canonical("terraform 1.5") == "terraform"
+        assert taxonomy.canonical("kubernets") == "kubernets"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,127 @@
+"""
+Unit tests for the interned skill vocabulary
+Tests alias resolution, interning and bitset / sorted-id skill vectors
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import skill_vocabulary
+from skill_vocabulary import SkillVocabulary, popcount
+from matching_engine import JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch
+
+
+class TestSkillVocabulary:
+    """Test suite for SkillVocabulary"""
+
+    @pytest.fixture
+    def vocabulary(self):
+        return SkillVocabulary(JobMatchingEngine().skill_taxonomy)
+
+    def test_alias_resolves_to_canonical_id(self, vocabulary):
+        """Aliases and canonical names share one id"""
+        assert vocabulary.normalize(" PY ") == "python"
+        assert vocabulary.skill_id("Node.js") == vocabulary.skill_id("nodejs")
+        assert vocabulary.skill_id("k8s") == vocabulary.skill_id("Kubernetes")
+
+    def test_unknown_skill_is_interned_once(self, vocabulary):
+        """Unknown skills get a new id that stays stable"""
+        size = len(vocabulary)
+        first = vocabulary.skill_id("Rust")
+        assert vocabulary.skill_id("rust ") == first
+        assert len(vocabulary) == size + 1
+        assert vocabulary.name(first) == "rust"
+
+    def test_bitset_operations(self, vocabulary):
+        """Matching, missing and overlap are bitwise operations"""
+        candidate = vocabulary.encode(["Python", "Docker", "React"])
+        required = vocabulary.encode(["py", "PostgreSQL", "docker"])
+        assert isinstance(candidate, int)
+        assert vocabulary.overlap(candidate, required) == 2
+        assert popcount(vocabulary.intersection(required, candidate)) == 2
+        assert vocabulary.decode(vocabulary.difference(required, candidate)) == ["postgresql"]
+
+    def test_sorted_ids_for_large_vocabulary(self, vocabulary, monkeypatch):
+        """Large vocabularies switch to sorted id tuples with the same semantics"""
+        candidate_bits = vocabulary.encode(["Python", "Docker"])
+        monkeypatch.setattr(skill_vocabulary, "BITSET_MAX_VOCABULARY", 0)
+        required = vocabulary.encode(["Docker", "Python", "AWS"])
+        assert isinstance(required, tuple)
+        assert list(required) == sorted(required)
+        assert vocabulary.overlap(candidate_bits, required) == 2
+        assert vocabulary.decode(vocabulary.difference(required, candidate_bits)) == ["aws"]
+
+    def test_engine_skill_match_uses_vocabulary(self):
+        """Engine skill matching still resolves aliases after interning"""
+        engine = JobMatchingEngine()
+        score, matching, missing = engine.calculate_skill_match(["js", "pg"], ["JavaScript", "Postgres", "AWS"])
+        assert score == pytest.approx(66.67, 0.1)
+        assert sorted(matching) == ["javascript", "postgresql"]
+        assert missing == ["aws"]
+
+    def test_fuzzy_resolution_is_memoized(self):
+        """Unknown spellings resolve through the trigram index once, then from the memo"""
+        vocabulary = SkillVocabulary(JobMatchingEngine().skill_taxonomy, fuzzy=True)
+        vocabulary.resolve_fuzzy.cache_clear()
+        for _ in range(50):
+            assert vocabulary.normalize("Postgres 15") == "postgresql"
+            assert vocabulary.normalize("ReactJS") == "react"
+        info = vocabulary.resolve_fuzzy.cache_info()
+        assert (info.misses, info.hits) == (2, 98)
+        assert vocabulary.normalize("Rust") == "rust"
+        assert vocabulary.skill_id("Kubernets") == vocabulary.skill_id("Kubernetes")
+
+    def test_fuzzy_resolution_is_opt_in(self, vocabulary):
+        """Unless enabled, unknown spellings are kept as written; aliases still resolve"""
+        assert vocabulary.fuzzy_threshold is None
+        assert vocabulary.normalize("kubernets") == "kubernets"
+        assert vocabulary.normalize("k8s") == "kubernetes"
+        assert SkillVocabulary(JobMatchingEngine().skill_taxonomy, fuzzy_threshold=0.8).fuzzy_threshold == 0.8
+
+    def test_scratch_ids_stay_out_of_shared_vocabulary(self, vocabulary):
+        """A scratch view keeps shared ids and numbers unknown skills after them, privately"""
+        size = len(vocabulary)
+        scratch = vocabulary.scratch()
+        assert scratch.skill_id("py") == vocabulary.get_id("python")
+        rust = scratch.skill_id("Rust")
+        assert rust == size
+        assert scratch.skill_id("rust ") == rust
+        assert scratch.decode(scratch.encode(["Rust", "Python"])) == ["python", "rust"]
+        assert len(vocabulary) == size
+        assert vocabulary.get_id("rust") is None
+        assert vocabulary.scratch().get_id("rust") is None
+
+    def test_request_skills_do_not_grow_vocabulary(self):
+        """Matching requests full of unseen skills leave the shared vocabulary as it was"""
+        engine = JobMatchingEngine(vocabulary=SkillVocabulary(JobMatchingEngine().skill_taxonomy))
+        size = len(engine.vocabulary)
+        for i in range(200):
+            skills = [f"skill-{i}-{j}" for j in range(5)] + ["Python"]
+            candidate = CandidateMatchProfile(
+                candidate_id=f"C{i}", skills=skills, experience_years=3,
+                preferred_locations=["Remote"], expected_salary=1000000, preferred_roles=["Developer"]
+            )
+            job = JobPostingForMatch(
+                job_id=f"J{i}", title="Developer", required_skills=[f"skill-{i}-0", f"tool-{i}", "py"],
+                experience_required="2-5 years", location="Remote", salary_range=[800000, 1200000],
+                company="Acme", description=""
+            )
+            engine.calculate_skill_match(skills, job.required_skills)
+            engine.match_candidate_to_jobs(candidate, [job], top_k=1)
+            response = engine.match_candidate_to_jobs(candidate, [job], vectorized=True)
+            assert response.matches[0].missing_skills == [f"tool-{i}"]
+        assert len(engine.vocabulary) == size
+
+    def test_concurrent_interning_assigns_one_id_per_key(self, vocabulary):
+        """Threads interning the same new keys agree on their ids and never duplicate one"""
+        size = len(vocabulary)
+        keys = [f"catalog-skill-{i}" for i in range(500)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: [vocabulary.intern(key) for key in keys], range(8)))
+        assert all(ids == results[0] for ids in results)
+        assert sorted(results[0]) == list(range(size, size + len(keys)))
+        assert [vocabulary.name(skill_id) for skill_id in results[0]] == keys
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,58 @@
+"""
+Unit tests for the compiled substring skill matcher
+Checks that it reproduces the nested-loop containment semantics exactly
+"""
+
+import random
+import pytest
+from substring_matcher import SubstringMatcher
+
+
+def naive_matches(names, query):
+    return any(query in name or name in query for name in names)
+
+
+def naive_first_contained(names, text):
+    return next((name for name in names if name in text), None)
+
+
+class TestSubstringMatcher:
+    """Test suite for SubstringMatcher"""
+
+    @pytest.fixture
+    def words(self):
+        rng = random.Random(5)
+        alphabet = "abcab.js "
+        return [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 7)))
+            for _ in range(400)
+        ]
+
+    def test_matches_equals_nested_loops(self, words):
+        """Random names and queries (overlaps, repeats, empty strings) agree with the naive test"""
+        rng = random.Random(6)
+        for _ in range(60):
+            names = rng.sample(words, rng.randint(0, 8))
+            matcher = SubstringMatcher(names)
+            for query in rng.sample(words, 40):
+                assert matcher.matches(query) == naive_matches(names, query), (names, query)
+
+    def test_first_contained_respects_name_order(self, words):
+        rng = random.Random(7)
+        for _ in range(60):
+            names = rng.sample(words, rng.randint(0, 8))
+            matcher = SubstringMatcher(names)
+            for text in rng.sample(words, 40):
+                assert matcher.first_contained(text) == naive_first_contained(names, text)
+
+    def test_skill_examples(self):
+        matcher = SubstringMatcher(["react.js", "python", "sql"])
+        matched, missing = matcher.split(["react", "postgresql", "py", "java", "python"])
+        assert matched == ["react", "postgresql", "py", "python"]
+        assert missing == ["java"]
+        assert SubstringMatcher(["sql", "postgresql", "java"]).first_contained("postgresql") == "sql"
+        assert not SubstringMatcher([]).matches("python")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
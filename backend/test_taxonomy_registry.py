@@ -0,0 +1,93 @@
+"""
+Unit tests for the versioned skill taxonomy registry
+"""
+
+import json
+import pytest
+from taxonomy_registry import TaxonomyRegistry, CompiledTaxonomy, TAXONOMY_PATH
+from matching_engine import JobMatchingEngine, CandidateMatchProfile, JobPostingForMatch
+
+
+def write_taxonomy(path, skills):
+    path.write_text(json.dumps({"skills": skills}))
+    return path
+
+
+class TestTaxonomyRegistry:
+    """Test suite for TaxonomyRegistry and CompiledTaxonomy"""
+
+    @pytest.fixture
+    def taxonomy_file(self, tmp_path):
+        return write_taxonomy(tmp_path / "taxonomy.json", {
+            "Python": {"category": "Backend", "difficulty": 1, "aliases": ["py"]},
+            "FastAPI": {"category": "Backend", "difficulty": 2, "prerequisites": ["py"]},
+            "Docker": {"category": "DevOps", "difficulty": 2}
+        })
+
+    @pytest.fixture
+    def registry(self, taxonomy_file):
+        return TaxonomyRegistry(str(taxonomy_file))
+
+    def test_shipped_taxonomy_compiles(self):
+        """taxonomy.json compiles and keeps the aliases the engine relies on"""
+        taxonomy = CompiledTaxonomy(TaxonomyRegistry._read(TAXONOMY_PATH), 1)
+        assert taxonomy.canonical("K8s") == "kubernetes"
+        assert taxonomy.canonical("react.js") == "react"
+        assert taxonomy.category("AWS") == "DevOps"
+        assert taxonomy.skill_prerequisites("kubernetes") == ("docker",)
+
+    def test_compiled_lookup_tables(self, registry):
+        """Alias, category, difficulty and prerequisite tables use canonical names"""
+        taxonomy = registry.current
+        assert taxonomy.version == 1
+        assert taxonomy.names == ("python", "fastapi", "docker")
+        assert taxonomy.canonical(" PY ") == "python"
+        assert taxonomy.category("py") == "Backend"
+        assert taxonomy.skill_difficulty("fastapi") == 2
+        assert taxonomy.skill_prerequisites("FastAPI") == ("python",)
+        assert taxonomy.category("cobol") is None
+
+    def test_reload_swaps_version(self, registry, taxonomy_file):
+        """Reload compiles a new version, notifies listeners, and leaves old snapshots intact"""
+        notified = []
+        registry.subscribe(notified.append)
+        before = registry.current
+
+        write_taxonomy(taxonomy_file, {"Python": {"category": "Backend", "aliases": ["py", "python3"]}})
+        after = registry.reload()
+
+        assert after.version == 2 and registry.current is after
+        assert notified == [after]
+        assert after.canonical("python3") == "python"
+        assert before.canonical("python3") == "python3"
+        assert before.checksum != after.checksum
+
+    def test_invalid_reload_keeps_current(self, registry):
+        """A malformed taxonomy is rejected without replacing the current version"""
+        current = registry.current
+        with pytest.raises(ValueError):
+            registry.load_data({"skills": {"Go": {"prerequisites": ["Rust"]}}})
+        with pytest.raises(ValueError):
+            registry.load_data({"skills": {}})
+        assert registry.current is current
+
+    def test_engine_follows_reload(self, registry):
+        """Engines read the registry's current version instead of a private copy"""
+        engine = JobMatchingEngine(registry=registry)
+        candidate = CandidateMatchProfile(
+            skills=["golang"], experience_years=2, preferred_locations=[],
+            preferred_roles=[], expected_salary=0
+        )
+        job = JobPostingForMatch(
+            job_id="J1", title="Dev", required_skills=["Go"], experience_required="0-2 years",
+            location="Pune", salary_range=[], company="c"
+        )
+        assert engine.match_candidate_to_job(candidate, job).matching_skills == []
+
+        registry.load_data({"skills": {"Go": {"category": "Backend", "aliases": ["golang"]}}})
+        assert engine.normalize_skill("golang") == "go"
+        assert engine.match_candidate_to_job(candidate, job).matching_skills == ["go"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
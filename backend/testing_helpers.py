@@ -0,0 +1,70 @@
+"""
+Test Data Helpers
+Synthetic job postings, API match payloads and a controllable clock shared
+by the test modules
+"""
+
+import random
+
+from matching_engine import JobPostingForMatch
+
+
+SKILL_POOL = [
+    "Python", "py", "FastAPI", "Django", "Node.js", "JavaScript", "js", "React",
+    "TypeScript", "PostgreSQL", "postgres", "MongoDB", "Docker", "k8s", "AWS",
+    "GCP", "Git", "Rust", "Go", "Kafka"
+]
+LOCATIONS = ["Bangalore", "Mumbai", "Remote", "Hyderabad", "Pune", " bangalore "]
+TITLES = ["Backend Developer", "Senior Backend Developer", "Frontend Developer", "DevOps Engineer", "Developer"]
+EXPERIENCE = ["0-2 years", "2-5 yrs", "5+ years", "3 years", "Fresher", "1-3 years", "0 years"]
+
+
+def make_jobs(count, seed=7):
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        salary_shape = rng.random()
+        if salary_shape < 0.1:
+            salary_range = []
+        elif salary_shape < 0.15:
+            salary_range = [0, 0]
+        else:
+            low = rng.randrange(300000, 1500000, 50000)
+            salary_range = [low, low + rng.randrange(0, 1000000, 50000)]
+        jobs.append(JobPostingForMatch(
+            job_id=f"J{i:04d}",
+            title=rng.choice(TITLES),
+            required_skills=rng.sample(SKILL_POOL, rng.randint(0, 6)),
+            experience_required=rng.choice(EXPERIENCE),
+            location=rng.choice(LOCATIONS),
+            salary_range=salary_range,
+            company=f"Company {i % 17}"
+        ))
+    return jobs
+
+
+def match_payload(count):
+    """JSON body for /api/match/candidate-to-jobs with count synthetic jobs"""
+    jobs = [
+        {
+            "job_id": job.job_id, "title": job.title, "required_skills": job.required_skills,
+            "experience_required": job.experience_required, "location": job.location,
+            "salary_range": job.salary_range or [0, 0], "company": job.company
+        }
+        for job in make_jobs(count)
+    ]
+    candidate = {
+        "skills": ["Python", "SQL", "Docker"], "experience_years": 3, "preferred_locations": ["Pune"],
+        "preferred_roles": ["Backend Developer"], "expected_salary": 900000
+    }
+    return {"candidate": candidate, "jobs": jobs}
+
+
+class FakeClock:
+    """Clock for TTL tests; advance it by setting now"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now